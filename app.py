@@ -1,5 +1,10 @@
+import os
+
 import streamlit as st
-from pawpal_system import Pet, Owner, TaskManager, DailyPlanner
+from pawpal_system import Pet, Owner, DailyPlanner
+from pawpal_sqlite import SqliteTaskManager
+from pawpal_views import TaskViewModel, page_bounds
+from pawpal_metrics import METRICS
 
 st.set_page_config(page_title="PawPal+", page_icon="🐾", layout="centered")
 
@@ -45,9 +50,33 @@ if "owner" not in st.session_state:
 if "pet" not in st.session_state:
     st.session_state.pet = None
 if "task_manager" not in st.session_state:
-    st.session_state.task_manager = TaskManager()
+    # Tasks live in SQLite so they survive restarts and are shared between sessions
+    st.session_state.task_manager = SqliteTaskManager(os.environ.get("PAWPAL_DB", "pawpal.db"))
 if "planner" not in st.session_state:
     st.session_state.planner = None
+if "views" not in st.session_state:
+    # Derived tables are cached until a task changes
+    st.session_state.views = TaskViewModel(st.session_state.task_manager, page_size=25)
+if "plan" not in st.session_state:
+    st.session_state.plan = None
+
+# Completed daily and weekly tasks are pending again once their next occurrence is due
+st.session_state.task_manager.roll_over_recurring()
+
+
+def switch_metrics() -> None:
+    """Install or remove the timing wrappers when this session flips the toggle"""
+    if st.session_state.collect_metrics:
+        METRICS.enable()
+    else:
+        METRICS.disable()
+
+
+# Timing wrappers are installed only while this is on, so metrics cost nothing when off.
+# They are shared by all sessions: the toggle shows the current state and only a change switches them.
+st.session_state.collect_metrics = METRICS.is_enabled()
+st.sidebar.toggle("Collect performance metrics", key="collect_metrics", on_change=switch_metrics,
+                  help="Time every TaskManager and DailyPlanner call (shared by all sessions)")
 
 st.subheader("Step 1: Setup Owner & Pet")
 owner_name = st.text_input("Owner name", value="Jordan")
@@ -119,42 +148,43 @@ if st.button("Add Task"):
     except ValueError as e:
         st.error(f"Error adding task: {e}")
 
+
+def page_selector(label: str, total: int, key: str) -> int:
+    """Show a page number input when rows span several pages and return the chosen page"""
+    page_size = st.session_state.views.get_page_size()
+    page_count = page_bounds(total, 1, page_size)[2]
+    if page_count == 1:
+        return 1
+    page = st.number_input(f"{label} page (of {page_count})", min_value=1, max_value=page_count,
+                           value=1, key=key)
+    st.caption(f"{total} rows, {page_size} per page")
+    return int(page)
+
+
 # Display all tasks from TaskManager (sorted by scheduled time)
-sorted_tasks = st.session_state.task_manager.get_tasks_sorted_by_time()
+views = st.session_state.views
+sorted_tasks = views.get_sorted_tasks()
 if sorted_tasks:
     st.markdown("### Current tasks (sorted by time)")
-    task_data = [
-        {
-            "Task": task.get_task_name(),
-            "Type": task.get_task_type(),
-            "Duration (min)": task.get_duration(),
-            "Priority": task.get_priority(),
-            "Time": task.get_time(),
-            "Recurrence": task.get_recurrence() or "",
-            "Completed": "Yes" if task.is_completed() else "No"
-        }
-        for task in sorted_tasks
-    ]
-    st.table(task_data)
+    task_page = page_selector("Task", len(sorted_tasks), "task_page")
+    st.table(views.get_task_page(task_page))
 
     # Check for duplicate name+time entries
-    combo_counts = {}
-    for t in sorted_tasks:
-        key = (t.get_task_name(), t.get_time())
-        combo_counts[key] = combo_counts.get(key, 0) + 1
-
-    duplicates = [f"{name} at {time} (x{count})" for (name, time), count in combo_counts.items() if count > 1]
+    duplicates = views.get_duplicates()
     if duplicates:
         st.warning("⚠️ Duplicate tasks detected (same name and time):")
-        for d in duplicates:
+        for d in duplicates[:views.get_page_size()]:
             st.warning(f" - {d}")
+        if len(duplicates) > views.get_page_size():
+            st.caption(f"... and {len(duplicates) - views.get_page_size()} more")
 
     # Show any overlapping scheduling conflicts across the system
-    all_conflicts = st.session_state.task_manager.get_all_conflicts()
+    all_conflicts = views.get_conflicts()
     if all_conflicts:
         st.warning(f"⚠️ Found {len(all_conflicts)} scheduling conflict(s):")
-        for t1, t2, reason in all_conflicts:
-            st.warning(f" - {t1.get_task_name()} at {t1.get_time()} <> {t2.get_task_name()} at {t2.get_time()} : {reason}")
+        conflict_page = page_selector("Conflict", len(all_conflicts), "conflict_page")
+        for line in views.get_conflict_page(conflict_page):
+            st.warning(f" - {line}")
 else:
     st.info("No tasks yet. Add one above.")
 
@@ -169,6 +199,11 @@ with col1:
     available_time = st.number_input("Available time (minutes)", min_value=0, max_value=1440, value=120)
 with col2:
     sort_by_time = st.checkbox("Sort tasks by scheduled time", value=False)
+    planning_mode = st.selectbox("Planning mode", ["greedy", "optimal"],
+                                 help="Optimal finds the highest total score that fits the available time")
+    explain_decisions = st.checkbox("Explain every decision", value=False,
+                                    help="Record why each task was picked or left out; "
+                                         "slower on large task lists")
 
 # Preferences
 with st.expander("Set Preferences (Optional)"):
@@ -198,44 +233,96 @@ if st.button("Generate Schedule"):
                 'sort_by_time': sort_by_time
             }
             st.session_state.planner.set_preferences(preferences)
+            st.session_state.plan_preferences = preferences
+
+            # Recording decisions keeps greedy plans off the vectorized and incremental paths
+            if explain_decisions:
+                st.session_state.planner.enable_explanations()
+            else:
+                st.session_state.planner.disable_explanations()
 
             # Generate the plan using DailyPlanner.generate_plan()
-            plan = st.session_state.planner.generate_plan()
-
-            # Display the results
-            st.success(f"✅ Schedule generated! {len(plan)} tasks scheduled.")
-
-            # Show the plan in a professional table
-            if plan:
-                st.markdown("### 📅 Your Daily Schedule")
-                plan_table = [
-                    {
-                        "#": i + 1,
-                        "Task": task.get_task_name(),
-                        "Type": task.get_task_type(),
-                        "Duration (min)": task.get_duration(),
-                        "Priority": task.get_priority(),
-                        "Time": task.get_time()
-                    }
-                    for i, task in enumerate(plan)
-                ]
-                st.table(plan_table)
-
-                # Display plan summary using DailyPlanner.get_plan_summary()
-                summary = st.session_state.planner.get_plan_summary()
-                st.markdown("### 📊 Schedule Summary")
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Total Tasks", summary['total_tasks'])
-                with col2:
-                    st.metric("Time Used", f"{summary['total_time']} min")
-                with col3:
-                    st.metric("Time Remaining", f"{summary['remaining_time']} min")
-
-                # Show detailed explanation using DailyPlanner.explain_plan()
-                with st.expander("📝 View Detailed Explanation"):
-                    explanation = st.session_state.planner.explain_plan()
-                    st.code(explanation)
+            # and keep it so paging through it does not regenerate it
+            st.session_state.plan = st.session_state.planner.generate_plan(mode=planning_mode)
+            st.session_state.plan_version = st.session_state.task_manager.get_version()
+            st.session_state.plan_page = 1
 
         except ValueError as e:
+            st.session_state.plan = None
             st.error(f"Error generating schedule: {e}")
+
+# A kept plan is dropped once any task changes, here or in another session
+plan = st.session_state.plan
+if plan is not None and st.session_state.plan_version != st.session_state.task_manager.get_version():
+    plan = st.session_state.plan = None
+if plan is not None and st.session_state.planner:
+    # Display the results
+    st.success(f"✅ Schedule generated! {len(plan)} tasks scheduled.")
+
+    # Show the plan in a professional table
+    if plan:
+        st.markdown("### 📅 Your Daily Schedule")
+        plan_page = page_selector("Schedule", len(plan), "plan_page")
+        st.table(views.get_plan_page(st.session_state.planner, plan, plan_page))
+
+        # Display plan summary using DailyPlanner.get_plan_summary()
+        summary = st.session_state.planner.get_plan_summary()
+        st.markdown("### 📊 Schedule Summary")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Tasks", summary['total_tasks'])
+        with col2:
+            st.metric("Time Used", f"{summary['total_time']} min")
+        with col3:
+            st.metric("Time Remaining", f"{summary['remaining_time']} min")
+        if summary['optimality_gap'] > 0:
+            st.caption(f"Plan score {summary['plan_score']} of a possible {summary['optimal_score']} "
+                       f"({summary['optimality_gap_pct']:.0f}% gap). Try the optimal planning mode.")
+
+        # One pass over every budget shows how well each available time is used;
+        # the expander body runs on every rerun, so the result is cached per store version
+        with st.expander("📈 Utilization by available time"):
+            budget_plans = views.get_budget_plans(st.session_state.planner, st.session_state.plan_preferences)
+            st.line_chart(budget_plans.utilization_curve())
+            st.caption("Time used by the optimal plan for each available time (minutes).")
+
+        # Show detailed explanation using DailyPlanner.explain_plan()
+        with st.expander("📝 View Detailed Explanation"):
+            trace = st.session_state.planner.get_plan_trace()
+            rows = max(len(plan), len(trace) if trace is not None else 0)
+            explain_page = page_selector("Explanation", rows, "explain_page")
+            explanation = st.session_state.planner.explain_plan(explain_page, views.get_page_size())
+            st.code(explanation)
+
+st.divider()
+
+metrics = METRICS.get_metrics()
+with st.expander("⏱️ Performance metrics", expanded=metrics['enabled']):
+    if not metrics['methods']:
+        st.caption("No calls recorded. Turn on \"Collect performance metrics\" in the sidebar.")
+    else:
+        st.dataframe([
+            {
+                "Method": method,
+                "Calls": m['calls'],
+                "Errors": m['errors'],
+                "Total (ms)": round(m['total_ms'], 2),
+                "p50 (ms)": round(m['p50_ms'], 3),
+                "p90 (ms)": round(m['p90_ms'], 3),
+                "p99 (ms)": round(m['p99_ms'], 3),
+                "Max (ms)": round(m['max_ms'], 3),
+                "Tasks (max)": m['tasks_max'],
+                "Result (max)": m['result_max'],
+            }
+            for method, m in sorted(metrics['methods'].items(), key=lambda item: -item[1]['total_ms'])
+        ], use_container_width=True)
+        st.caption(f"Percentiles cover the last {metrics['window']} calls of each method.")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.download_button("Prometheus", METRICS.to_prometheus(), "pawpal_metrics.prom", "text/plain")
+        with col2:
+            st.download_button("JSON", METRICS.to_json(), "pawpal_metrics.json", "application/json")
+        with col3:
+            if st.button("Reset metrics"):
+                METRICS.reset()
+                st.rerun()
@@ -0,0 +1,132 @@
+"""
+Benchmark: event loop latency under concurrent load, calling TaskManager
+and DailyPlanner directly from coroutines vs. through the asyncio facade,
+plus a burst of create_task calls with and without batching
+
+A heartbeat coroutine wakes every millisecond; its lag is how long any
+other request on the same event loop would have been stalled.
+
+Run with: python benchmarks/bench_async.py [tasks]
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import DailyPlanner, Pet, TaskManager
+from pawpal_async import AsyncDailyPlanner, AsyncTaskManager
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+PETS = 32
+
+
+def make_rows(n: int, seed: int = 42):
+    """Generate n random task rows"""
+    rng = random.Random(seed)
+    return [
+        dict(task_name=f"Task {i}", description="Benchmark task",
+             time=f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+             priority=rng.randrange(11), duration=rng.randrange(1, 6),
+             task_type=rng.choice(TASK_TYPES), pet_id=f"pet{i % PETS}")
+        for i in range(n)
+    ]
+
+
+def percentile(values, q: float) -> float:
+    """Return the q-th percentile (0-100) of values"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+async def heartbeat(lags, stop: asyncio.Event) -> None:
+    """Record how late each 1 ms wake-up is, until stop is set"""
+    while not stop.is_set():
+        start = timer.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(timer.perf_counter() - start - 0.001)
+
+
+async def under_load(make_requests) -> tuple[float, list, list]:
+    """Run requests next to a heartbeat; return wall time, request latencies and heartbeat lags"""
+    lags, latencies = [], []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(lags, stop))
+    await asyncio.sleep(0.01)
+
+    async def timed_request(request):
+        start = timer.perf_counter()
+        await request
+        latencies.append(timer.perf_counter() - start)
+
+    start = timer.perf_counter()
+    await asyncio.gather(*(timed_request(request) for request in make_requests()))
+    wall = timer.perf_counter() - start
+    stop.set()
+    await beat
+    return wall, latencies, lags
+
+
+async def main(n: int = 20_000) -> None:
+    # Burst of create_task calls from one request
+    burst = make_rows(2000, seed=7)
+    for row in burst:
+        row['task_name'] += " (burst)"
+    print(f"{len(burst)} create_task calls gathered at once")
+    async with AsyncTaskManager() as atm:
+        start = timer.perf_counter()
+        await asyncio.gather(*(atm.run(atm.get_task_manager().create_task, **row) for row in burst))
+        unbatched = timer.perf_counter() - start
+    async with AsyncTaskManager() as atm:
+        start = timer.perf_counter()
+        await asyncio.gather(*(atm.create_task(**row) for row in burst))
+        batched = timer.perf_counter() - start
+        batches = atm.get_batch_count()
+    print(f"{'one executor call each':<28} {unbatched * 1000:>9.1f} ms")
+    print(f"{'merged create_task batch':<28} {batched * 1000:>9.1f} ms ({batches} batch)\n")
+
+    rows = make_rows(n)
+    pets = [Pet(f"pet{i}", 1 + i % 12, "dog") for i in range(PETS)]
+    print(f"{n} tasks, {PETS} plan requests + 1 get_all_conflicts in flight at once")
+    print(f"{'calls':<10} {'wall (s)':>9} {'req p50 (ms)':>13} {'req p99 (ms)':>13} "
+          f"{'loop lag p99 (ms)':>18} {'loop lag max (ms)':>18}")
+
+    # Direct: synchronous calls inside coroutines
+    tm = TaskManager()
+    tm.create_tasks_bulk(rows)
+    planners = [DailyPlanner(pet, tm, cache_size=0) for pet in pets]
+    for planner in planners:
+        planner.set_available_time(240)
+
+    async def direct(func):
+        return func()
+
+    def direct_requests():
+        return [direct(planner.generate_plan) for planner in planners] + [direct(tm.get_all_conflicts)]
+
+    results = {"direct": await under_load(direct_requests)}
+
+    # Facade: the same work on the executor
+    async with AsyncTaskManager() as atm:
+        await atm.run(atm.get_task_manager().create_tasks_bulk, rows)
+        async_planners = [AsyncDailyPlanner(pet, atm, cache_size=0) for pet in pets]
+        for planner in async_planners:
+            planner.get_planner().set_available_time(240)
+
+        def facade_requests():
+            return [planner.generate_plan() for planner in async_planners] + [atm.get_all_conflicts()]
+
+        results["facade"] = await under_load(facade_requests)
+
+    for name, (wall, latencies, lags) in results.items():
+        print(f"{name:<10} {wall:>9.3f} {statistics.median(latencies) * 1000:>13.1f} "
+              f"{percentile(latencies, 99) * 1000:>13.1f} {percentile(lags, 99) * 1000:>18.1f} "
+              f"{max(lags) * 1000:>18.1f}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
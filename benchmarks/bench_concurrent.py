@@ -0,0 +1,113 @@
+"""
+Benchmark: readers and one writer sharing a task store from several
+threads, for a plain TaskManager, a TaskManager behind one lock, and the
+copy-on-write ConcurrentTaskManager
+
+Readers loop over a sorted listing, a pet filter and a full conflict scan
+for a fixed time while the writer creates or deletes a task every 10 ms
+(a read-heavy mix, as with several app sessions sharing one store).
+CPython runs one thread at a time, so total reads/s cannot grow with the
+reader count; the point is that readers never fail or wait on a writer.
+
+Run with: python benchmarks/bench_concurrent.py [tasks]
+"""
+
+import os
+import random
+import sys
+import threading
+import time as timer
+from contextlib import nullcontext
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import TaskManager
+from pawpal_concurrent import ConcurrentTaskManager
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+SECONDS = 2.0
+
+
+def make_rows(n: int, prefix: str = "Task", seed: int = 42):
+    """Generate n random one-minute task rows"""
+    rng = random.Random(seed)
+    return [
+        dict(task_name=f"{prefix} {i}", description="Benchmark task",
+             time=f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+             priority=rng.randrange(11), duration=1,
+             task_type=rng.choice(TASK_TYPES), pet_id=f"pet{i % 50}")
+        for i in range(n)
+    ]
+
+
+def run(tm, lock, readers: int, new_rows) -> tuple[float, float, float, float, int]:
+    """
+    Run readers and one writer for SECONDS
+
+    Returns:
+        Tuple (reads/s, p99 read ms, writes/s, mean write ms, reader errors)
+    """
+    stop = threading.Event()
+    read_times, errors, write_times = [], [0] * readers, []
+
+    def reader(slot: int) -> None:
+        while not stop.is_set():
+            start = timer.perf_counter()
+            try:
+                with lock:
+                    tm.get_tasks_sorted_by_time()
+                    tm.get_tasks_by_pet("pet7")
+                    tm.get_all_conflicts()
+                read_times.append(timer.perf_counter() - start)
+            except (RuntimeError, KeyError):
+                # Dict changed size during iteration, or a task deleted mid-scan
+                errors[slot] += 1
+
+    def writer() -> None:
+        rows = iter(new_rows)
+        created = []
+        while not stop.is_set():
+            start = timer.perf_counter()
+            with lock:
+                if len(created) < 10:
+                    created.append(tm.create_task(**next(rows)))
+                else:
+                    tm.delete_task(created.pop(0).get_task_id())
+            write_times.append(timer.perf_counter() - start)
+            timer.sleep(0.01)
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    timer.sleep(SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    read_times.sort()
+    p99 = read_times[int(len(read_times) * 0.99)] if read_times else 0.0
+    return (len(read_times) / SECONDS, p99 * 1000, len(write_times) / SECONDS,
+            sum(write_times) / max(1, len(write_times)) * 1000, sum(errors))
+
+
+def main(n: int = 5000) -> None:
+    rows = make_rows(n)
+    new_rows = make_rows(1_000_000, prefix="New", seed=7)
+    print(f"{n} tasks, one writer, {SECONDS:.0f} s per run")
+    print(f"{'store':<22} {'readers':>7} {'reads/s':>9} {'read p99 (ms)':>14} "
+          f"{'writes/s':>9} {'write (ms)':>11} {'reader errors':>14}")
+    for readers in (1, 2, 4):
+        setups = {
+            "TaskManager": (TaskManager(), nullcontext()),
+            "TaskManager + lock": (TaskManager(), threading.Lock()),
+            "ConcurrentTaskManager": (ConcurrentTaskManager(), nullcontext()),
+        }
+        for name, (tm, lock) in setups.items():
+            tm.create_tasks_bulk(rows)
+            reads, read_ms, writes, write_ms, errors = run(tm, lock, readers, new_rows)
+            print(f"{name:<22} {readers:>7} {reads:>9.1f} {read_ms:>14.1f} {writes:>9.1f} "
+                  f"{write_ms:>11.2f} {errors:>14}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,78 @@
+"""
+Benchmark: conflict detection with the old pairwise scan, a one-off sweep
+line, get_all_conflicts (sweep cached by store version) and single-task
+checks against the interval index
+
+Run with: python benchmarks/bench_conflicts.py
+"""
+
+import os
+import random
+import sys
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import TaskManager
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+
+
+def build_manager(n: int, seed: int = 42) -> TaskManager:
+    """Create a TaskManager with n random tasks spread over the day"""
+    rng = random.Random(seed)
+    tm = TaskManager()
+    for i in range(n):
+        tm.create_task(
+            f"Task {i}", "Benchmark task",
+            f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            rng.randrange(11), rng.choice([5, 10, 15, 20, 30, 45]),
+            rng.choice(TASK_TYPES), pet_id=f"pet{rng.randrange(n // 4 + 1)}",
+            allow_duplicates=True
+        )
+    return tm
+
+
+def pairwise_conflicts(tm: TaskManager):
+    """The original O(n^2) scan, kept as the reference (wrapping past midnight)"""
+    conflicts = []
+    tasks_list = tm.get_all_tasks()
+    for i, task1 in enumerate(tasks_list):
+        for task2 in tasks_list[i + 1:]:
+            if any(start1 < end2 and start2 < end1
+                   for start1, end1 in TaskManager._intervals(task1)
+                   for start2, end2 in TaskManager._intervals(task2)):
+                conflicts.append((task1, task2, TaskManager._conflict_reason(task1, task2)))
+    return conflicts
+
+
+def best_of(func, repeat: int = 3) -> float:
+    """Return the best wall time of several runs in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = timer.perf_counter()
+        func()
+        best = min(best, timer.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"{'tasks':>8} {'conflicts':>10} {'pairwise (s)':>14} {'sweep (s)':>11} "
+          f"{'cached (s)':>11} {'check one (ms)':>15}")
+    for n in (250, 500, 1000, 2000):
+        tm = build_manager(n)
+        indexed = tm.get_all_conflicts()
+        reference = pairwise_conflicts(tm)
+        assert indexed == reference, "get_all_conflicts differs from pairwise scan"
+
+        tasks = tm.get_all_tasks()
+        pairwise_s = best_of(lambda: pairwise_conflicts(tm), repeat=1)
+        sweep_s = best_of(lambda: TaskManager._find_overlapping_pairs(tasks))
+        cached_s = best_of(tm.get_all_conflicts)
+        check_s = best_of(lambda: [tm.check_task_conflicts(t) for t in tasks[:100]]) / 100
+        print(f"{n:>8} {len(indexed):>10} {pairwise_s:>14.4f} {sweep_s:>11.4f} "
+              f"{cached_s:>11.4f} {check_s * 1000:>15.3f}")
+
+
+if __name__ == '__main__':
+    main()
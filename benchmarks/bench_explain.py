@@ -0,0 +1,59 @@
+"""
+Benchmark: cost of recording the plan trace in generate_plan and of
+rendering one page of explain_plan, at 10k tasks
+
+Tasks are one-minute check-ins for separate pets so that placement stays
+cheap and about a quarter of them fit the n // 4 minute budget.
+
+Run with: python benchmarks/bench_explain.py [tasks]
+"""
+
+import os
+import random
+import sys
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import DailyPlanner, Pet, Task, TaskManager
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+
+
+def make_manager(n: int, seed: int = 42) -> TaskManager:
+    """Build a TaskManager holding n random one-minute tasks"""
+    rng = random.Random(seed)
+    tm = TaskManager()
+    tm.add_tasks([
+        Task(f"Task {i}", "Benchmark task", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+             rng.randrange(11), 1, rng.choice(TASK_TYPES), None, f"pet{i}")
+        for i in range(n)
+    ])
+    return tm
+
+
+def timed(func) -> tuple[object, float]:
+    """Run a function once and return its result and wall time in seconds"""
+    start = timer.perf_counter()
+    result = func()
+    return result, timer.perf_counter() - start
+
+
+def main(n: int = 10_000) -> None:
+    tm = make_manager(n)
+    print(f"{n} tasks")
+    print(f"{'mode':<8} {'explain':<8} {'generate_plan (ms)':>19} {'explain_plan page (ms)':>23}")
+    for mode in ("greedy", "optimal"):
+        for explain in (False, True):
+            planner = DailyPlanner(Pet("Bench", 4, "dog"), tm, cache_size=0)
+            planner.set_preferences({'preferred_task_types': ['walk'], 'avoided_task_types': ['grooming']})
+            planner.set_available_time(n // 4)
+            if explain:
+                planner.enable_explanations()
+            _, plan_s = timed(lambda: planner.generate_plan(mode))
+            _, explain_s = timed(lambda: planner.explain_plan(page=10, page_size=50))
+            print(f"{mode:<8} {'on' if explain else 'off':<8} {plan_s * 1000:>19.1f} {explain_s * 1000:>23.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,57 @@
+"""
+Benchmark: streaming JSON Lines export and import throughput (rows/s),
+plain and gzip-compressed, at 100k tasks
+
+Run with: python benchmarks/bench_jsonl.py [tasks]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import Task, TaskManager
+from pawpal_io import export_jsonl, import_jsonl
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+DURATIONS = [5, 10, 15, 20, 30, 45, 60]
+
+
+def make_manager(n: int, seed: int = 42) -> TaskManager:
+    """Build a TaskManager holding n random tasks"""
+    rng = random.Random(seed)
+    tm = TaskManager()
+    tm.add_tasks([
+        Task(f"Task {i}", "Benchmark task", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+             rng.randrange(11), rng.choice(DURATIONS), rng.choice(TASK_TYPES), rng.choice([None, "daily"]), f"pet{i // 4}")
+        for i in range(n)
+    ])
+    return tm
+
+
+def timed(func) -> tuple[object, float]:
+    """Run a function once and return its result and wall time in seconds"""
+    start = timer.perf_counter()
+    result = func()
+    return result, timer.perf_counter() - start
+
+
+def main(n: int = 100_000) -> None:
+    tm = make_manager(n)
+    print(f"{n} tasks")
+    print(f"{'file':<14} {'export (rows/s)':>16} {'import (rows/s)':>16} {'size (MB)':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("tasks.jsonl", "tasks.jsonl.gz"):
+            path = os.path.join(tmp, name)
+            rows, export_s = timed(lambda: export_jsonl(path, tm))
+            result, import_s = timed(lambda: import_jsonl(path, TaskManager(), chunk_size=5000))
+            assert result['imported'] == n
+            print(f"{name:<14} {rows / export_s:>16,.0f} {n / import_s:>16,.0f} "
+                  f"{os.path.getsize(path) / 1e6:>10.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,75 @@
+"""
+Benchmark: memory per task for a dict of Task objects (what TaskManager
+holds before any indexes) vs. the columnar TaskStore
+
+Run with: python benchmarks/bench_memory.py
+"""
+
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import Task
+from pawpal_store import TaskStore
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+TASK_NAMES = ["Morning walk", "Breakfast", "Dinner", "Evening walk", "Brushing", "Meds", "Fetch"]
+
+
+def make_rows(n: int, seed: int = 42):
+    """Generate n random task rows"""
+    rng = random.Random(seed)
+    for i in range(n):
+        yield dict(
+            task_name=rng.choice(TASK_NAMES), description="Daily care",
+            time=f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            priority=rng.randrange(11), duration=rng.choice([5, 10, 15, 20, 30]),
+            task_type=rng.choice(TASK_TYPES), recurrence=rng.choice([None, "daily"]),
+            pet_id=f"pet{i // 4}"
+        )
+
+
+def measure(build) -> tuple[object, int]:
+    """Build an object and return it with the bytes it allocated"""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current
+
+
+def main() -> None:
+    print(f"{'tasks':>8} {'dict of Task B/task':>20} {'TaskStore B/task':>17} "
+          f"{'ratio':>7} {'store self-report':>18}")
+    for n in (10_000, 100_000, 1_000_000):
+        tasks, dict_bytes = measure(lambda: _fill_dict(n))
+        del tasks
+        store, store_bytes = measure(lambda: _fill_store(n))
+        print(f"{n:>8} {dict_bytes / n:>20.1f} {store_bytes / n:>17.1f} "
+              f"{dict_bytes / store_bytes:>6.1f}x {store.bytes_per_task():>18.1f}")
+
+
+def _fill_dict(n: int) -> dict:
+    """Create the task_id -> Task dict a TaskManager keeps for n random tasks"""
+    tasks = {}
+    for row in make_rows(n):
+        task = Task(**row)
+        tasks[task.get_task_id()] = task
+    return tasks
+
+
+def _fill_store(n: int) -> TaskStore:
+    """Create a TaskStore holding n random tasks"""
+    store = TaskStore()
+    for row in make_rows(n):
+        store.create_task(**row)
+    return store
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark: per-call overhead of the metrics wrappers on cheap TaskManager
+calls, before enabling, while enabled and after disabling again
+
+Run with: python benchmarks/bench_metrics.py [calls]
+"""
+
+import os
+import sys
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import TaskManager
+from pawpal_metrics import Metrics
+
+
+def make_manager(n: int = 1000) -> TaskManager:
+    """Build a TaskManager holding n one-minute tasks spread over 100 pets"""
+    tm = TaskManager()
+    for i in range(n):
+        tm.create_task(f"Task {i}", "Benchmark task", f"{i % 1440 // 60:02d}:{i % 60:02d}",
+                       i % 11, 1, "walk", pet_id=f"pet{i % 100}")
+    return tm
+
+
+def per_call_ns(tm: TaskManager, calls: int) -> dict:
+    """Time cheap reads and return nanoseconds per call"""
+    results = {}
+    for name, func in (("get_version", lambda: tm.get_version()),
+                       ("get_task_by_id", lambda: tm.get_task_by_id("missing")),
+                       ("get_tasks_by_pet", lambda: tm.get_tasks_by_pet("pet7"))):
+        start = timer.perf_counter()
+        for _ in range(calls):
+            func()
+        results[name] = (timer.perf_counter() - start) / calls * 1e9
+    return results
+
+
+def main(calls: int = 200_000) -> None:
+    tm = make_manager()
+    metrics = Metrics()
+    before = per_call_ns(tm, calls)
+    metrics.enable()
+    enabled = per_call_ns(tm, calls)
+    metrics.disable()
+    after = per_call_ns(tm, calls)
+
+    print(f"{calls} calls each, ns per call")
+    print(f"{'method':<20} {'never on':>10} {'enabled':>10} {'disabled':>10}")
+    for name in before:
+        print(f"{name:<20} {before[name]:>10.0f} {enabled[name]:>10.0f} {after[name]:>10.0f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,65 @@
+"""
+Benchmark: cold start from a memory-mapped snapshot vs. rebuilding Task
+objects one by one, at 1M tasks
+
+Run with: python benchmarks/bench_snapshot.py [tasks]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import Task
+from pawpal_snapshot import Snapshot, write_snapshot
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+TASK_NAMES = ["Morning walk", "Breakfast", "Dinner", "Evening walk", "Brushing", "Meds", "Fetch"]
+
+
+def make_tasks(n: int, seed: int = 42):
+    """Generate n random tasks"""
+    rng = random.Random(seed)
+    for i in range(n):
+        yield Task(
+            rng.choice(TASK_NAMES), "Daily care", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            rng.randrange(11), rng.choice([5, 10, 15, 20, 30]), rng.choice(TASK_TYPES),
+            rng.choice([None, "daily"]), f"pet{i // 4}"
+        )
+
+
+def timed(func) -> tuple[object, float]:
+    """Run a function once and return its result and wall time in seconds"""
+    start = timer.perf_counter()
+    result = func()
+    return result, timer.perf_counter() - start
+
+
+def main(n: int = 1_000_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tasks.snap")
+        _, write_s = timed(lambda: write_snapshot(make_tasks(n), path))
+        print(f"{n} tasks, snapshot {os.path.getsize(path) / n:.1f} bytes/task")
+        print(f"{'write snapshot':<34} {write_s:>9.3f} s")
+
+        snap, open_s = timed(lambda: Snapshot(path))
+        print(f"{'open snapshot (cold start)':<34} {open_s * 1000:>9.3f} ms")
+        _, pet_s = timed(lambda: snap.get_tasks_by_pet(f"pet{n // 8}"))
+        print(f"{'first filter by pet':<34} {pet_s * 1000:>9.3f} ms")
+        _, type_s = timed(lambda: snap.get_tasks_by_type("walk"))
+        print(f"{'filter by type':<34} {type_s * 1000:>9.3f} ms")
+        _, total_s = timed(snap.get_total_duration)
+        print(f"{'total duration':<34} {total_s * 1000:>9.3f} ms")
+        sample = min(n, 100_000)
+        views = snap.get_all_tasks()[:sample]
+        _, load_s = timed(lambda: [view.load() for view in views])
+        print(f"{'rebuild every Task object (est.)':<34} {load_s * n / sample:>9.3f} s")
+        del views
+        snap.close()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
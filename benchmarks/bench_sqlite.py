@@ -0,0 +1,71 @@
+"""
+Benchmark: in-memory TaskManager vs. SqliteTaskManager (WAL, indexed) at
+100k tasks, for bulk loading, indexed filters, conflict checks and totals.
+
+Run with: python benchmarks/bench_sqlite.py [tasks]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import TaskManager
+from pawpal_sqlite import SqliteTaskManager
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+DURATIONS = [5, 10, 15, 20, 30, 45, 60]
+
+
+def make_rows(n: int, seed: int = 42):
+    """Generate n random task rows"""
+    rng = random.Random(seed)
+    return [
+        dict(task_name=f"Task {i}", description="Benchmark task",
+             time=f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+             priority=rng.randrange(11), duration=rng.choice(DURATIONS),
+             task_type=rng.choice(TASK_TYPES), pet_id=f"pet{i // 4}")
+        for i in range(n)
+    ]
+
+
+def timed(func) -> tuple[object, float]:
+    """Run a function once and return its result and wall time in seconds"""
+    start = timer.perf_counter()
+    result = func()
+    return result, timer.perf_counter() - start
+
+
+def main(n: int = 100_000) -> None:
+    rows = make_rows(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        managers = {
+            "memory": TaskManager(),
+            "sqlite": SqliteTaskManager(os.path.join(tmp, "bench.db")),
+        }
+        print(f"{n} tasks")
+        print(f"{'operation':<28} {'memory (s)':>11} {'sqlite (s)':>11}")
+
+        results = {}
+        for name, tm in managers.items():
+            _, results[(name, "bulk load")] = timed(lambda: tm.create_tasks_bulk(rows))
+            probe = tm.get_tasks_by_pet("pet100")[0]
+            results[(name, "filter by pet (x1000)")] = timed(
+                lambda: [tm.get_tasks_by_pet(f"pet{i}") for i in range(1000)])[1]
+            results[(name, "tasks of one type")] = timed(lambda: tm.get_tasks_by_type("walk"))[1]
+            results[(name, "check one conflict (x100)")] = timed(
+                lambda: [tm.check_task_conflicts(probe) for _ in range(100)])[1]
+            results[(name, "edit 1000 tasks")] = timed(
+                lambda: [tm.edit_task(t.get_task_id(), priority=5) for t in tm.get_tasks_by_pet("pet7") * 250])[1]
+            results[(name, "total duration")] = timed(lambda: tm.get_total_duration(include_completed=False))[1]
+
+        for operation in dict.fromkeys(op for _, op in results):
+            print(f"{operation:<28} {results[('memory', operation)]:>11.4f} {results[('sqlite', operation)]:>11.4f}")
+        managers["sqlite"].close()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
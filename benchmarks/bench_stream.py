@@ -0,0 +1,82 @@
+"""
+Benchmark: peak memory and time of optimize_stream over a task generator
+against building the task list and ranking it with the greedy selection
+
+Tasks are created on demand by a generator, so the streaming run never
+holds more than its candidate set. Peak memory is measured with
+tracemalloc, which slows both runs by the same factor.
+
+Run with: python benchmarks/bench_stream.py [tasks]
+"""
+
+import os
+import random
+import sys
+import time as timer
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import DailyPlanner, Pet, Task, TaskManager
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+DURATIONS = [1, 5, 10, 15, 30, 45, 60, 120]
+
+
+def generate_tasks(n: int, seed: int = 42):
+    """Yield n random tasks without keeping them"""
+    rng = random.Random(seed)
+    for i in range(n):
+        yield Task(f"Task {i}", "Benchmark task", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+                   rng.randrange(11), rng.choice(DURATIONS), rng.choice(TASK_TYPES), None, f"pet{i}")
+
+
+def timed(func) -> tuple[object, float]:
+    """Run a function once and return its result and wall time in seconds"""
+    start = timer.perf_counter()
+    result = func()
+    return result, timer.perf_counter() - start
+
+
+def traced(func) -> tuple[object, float, float]:
+    """Run a function under tracemalloc and return its result, seconds and peak MiB"""
+    tracemalloc.start()
+    try:
+        result, seconds = timed(func)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak / 2 ** 20
+
+
+def main(n: int = 100_000) -> None:
+    planner = DailyPlanner(Pet("Bench", 4, "dog"), TaskManager())
+    planner.set_preferences({'preferred_task_types': ['walk'], 'avoided_task_types': ['grooming']})
+    preferred, avoided = {'walk'}, {'grooming'}
+
+    def stream(budget):
+        planner.set_available_time(budget)
+        return planner.optimize_stream(generate_tasks(n))
+
+    def listed(budget):
+        # The list baseline holds the whole input while ranking it
+        planner.set_available_time(budget)
+        return planner._select_greedy(list(generate_tasks(n)), preferred, avoided)[0]
+
+    _, generate_s = timed(lambda: sum(1 for _ in generate_tasks(n)))
+    print(f"{n} tasks, generating them alone takes {generate_s:.2f} s")
+    print(f"{'budget':>7} {'stream (s)':>11} {'list (s)':>9} {'candidates peak':>16} {'plan':>6}")
+    for budget in (60, 480, 2000):
+        plan, stream_s = timed(lambda: stream(budget))
+        expected, list_s = timed(lambda: listed(budget))
+        assert [t.get_task_name() for t in plan] == [t.get_task_name() for t in expected]
+        print(f"{budget:>7} {stream_s:>11.2f} {list_s:>9.2f} "
+              f"{planner.get_stream_stats()['candidates_peak']:>16} {len(plan):>6}")
+
+    _, _, stream_mib = traced(lambda: stream(480))
+    _, _, list_mib = traced(lambda: listed(480))
+    print(f"peak memory at budget 480: stream {stream_mib:.1f} MiB, list {list_mib:.1f} MiB")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
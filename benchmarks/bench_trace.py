@@ -0,0 +1,73 @@
+"""
+Benchmark: cost of recording a trace and replaying it, on a session of
+creates, edits, completions, deletes and plans
+
+Run with: python benchmarks/bench_trace.py [tasks]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import DailyPlanner, Pet, TaskManager
+from pawpal_trace import RecordingDailyPlanner, RecordingTaskManager, TraceRecorder, format_report, replay
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+DURATIONS = [5, 10, 15, 20, 30, 45, 60]
+
+
+def session(tm, planner, n: int, seed: int = 42) -> None:
+    """Run a mixed workload: n creates, then edits, completions, deletes and plans"""
+    rng = random.Random(seed)
+    task_ids = []
+    for i in range(n):
+        task = tm.create_task(f"Task {i}", "Benchmark task", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+                              rng.randrange(11), rng.choice(DURATIONS), rng.choice(TASK_TYPES), rng.choice([None, "daily"]), f"pet{i // 4}")
+        task_ids.append(task.get_task_id())
+    for task_id in rng.sample(task_ids, n // 10):
+        tm.edit_task(task_id, priority=rng.randrange(11))
+    for task_id in rng.sample(task_ids, n // 10):
+        tm.mark_task_completed(task_id)
+    for task_id in rng.sample(task_ids, n // 20):
+        tm.delete_task(task_id)
+    planner.set_available_time(240)
+    for mode in ("greedy", "optimal"):
+        planner.generate_plan(mode)
+
+
+def timed(func) -> tuple[object, float]:
+    """Run a function once and return its result and wall time in seconds"""
+    start = timer.perf_counter()
+    result = func()
+    return result, timer.perf_counter() - start
+
+
+def main(n: int = 20_000) -> None:
+    pet = Pet("Bench", 4, "dog")
+    tm = TaskManager()
+    _, plain_s = timed(lambda: session(tm, DailyPlanner(pet, tm), n))
+    del tm
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{n} tasks, untraced session {plain_s:.2f} s")
+        print(f"{'trace':<16} {'recorded (s)':>13} {'overhead':>9} {'calls':>7} {'bytes/call':>11} {'replay (s)':>11}")
+        for name in ("trace.jsonl", "trace.jsonl.gz"):
+            path = os.path.join(tmp, name)
+            with TraceRecorder(path) as recorder:
+                traced = RecordingTaskManager(TaskManager(), recorder)
+                planner = RecordingDailyPlanner(pet, traced, recorder)
+                _, traced_s = timed(lambda: session(traced, planner, n))
+            calls = recorder.get_call_count()
+            report, replay_s = timed(lambda: replay(path))
+            print(f"{name:<16} {traced_s:>13.2f} {traced_s / plain_s - 1:>9.0%} {calls:>7} "
+                  f"{os.path.getsize(path) / calls:>11.1f} {replay_s:>11.2f}")
+        print()
+        print(format_report(report))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
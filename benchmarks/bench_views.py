@@ -0,0 +1,86 @@
+"""
+Benchmark: cost of one app rerun for the task section, rebuilding every
+derived table (the previous app.py) vs. the cached, paginated TaskViewModel
+
+Run with: python benchmarks/bench_views.py
+"""
+
+import os
+import random
+import sys
+import time as timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import TaskManager
+from pawpal_views import TaskViewModel
+
+TASK_TYPES = ["walk", "feed", "medication", "grooming", "playtime", "training"]
+RERUNS = 20
+
+
+def make_manager(n: int, seed: int = 42) -> TaskManager:
+    """Build a TaskManager holding n random tasks"""
+    rng = random.Random(seed)
+    tm = TaskManager()
+    tm.create_tasks_bulk([
+        dict(task_name=f"Task {i % 500}", description="Benchmark task",
+             time=f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+             priority=rng.randrange(11), duration=rng.choice([5, 10, 15]),
+             task_type=rng.choice(TASK_TYPES), pet_id=f"pet{i % 20}")
+        for i in range(n)
+    ], allow_duplicates=True)
+    return tm
+
+
+def full_rerun(tm: TaskManager) -> int:
+    """Everything the task section of app.py computed on every rerun before the view model"""
+    sorted_tasks = tm.get_tasks_sorted_by_time()
+    task_data = [TaskViewModel.task_row(task) for task in sorted_tasks]
+    combo_counts = {}
+    for t in sorted_tasks:
+        key = (t.get_task_name(), t.get_time())
+        combo_counts[key] = combo_counts.get(key, 0) + 1
+    duplicates = [f"{name} at {time} (x{count})" for (name, time), count in combo_counts.items() if count > 1]
+    lines = [f"{t1.get_task_name()} at {t1.get_time()} <> {t2.get_task_name()} at {t2.get_time()} : {reason}"
+             for t1, t2, reason in tm.get_all_conflicts()]
+    return len(task_data) + len(duplicates) + len(lines)
+
+
+def view_rerun(views: TaskViewModel) -> int:
+    """The same section with the view model, showing page 1 of each table"""
+    rows = views.get_task_page(1)
+    duplicates = views.get_duplicates()[:views.get_page_size()]
+    lines = views.get_conflict_page(1)
+    return len(rows) + len(duplicates) + len(lines)
+
+
+def per_rerun_ms(func) -> float:
+    """Average wall time of RERUNS calls in milliseconds"""
+    start = timer.perf_counter()
+    for _ in range(RERUNS):
+        func()
+    return (timer.perf_counter() - start) / RERUNS * 1000
+
+
+def main() -> None:
+    print(f"{'tasks':>6} {'conflicts':>10} {'full rebuild (ms)':>18} {'view, unchanged (ms)':>21} "
+          f"{'view, after a write (ms)':>25}")
+    for n in (500, 2000, 5000):
+        tm = make_manager(n)
+        views = TaskViewModel(tm, page_size=25)
+        full = per_rerun_ms(lambda: full_rerun(tm))
+        view_rerun(views)
+        cached = per_rerun_ms(lambda: view_rerun(views))
+        task = tm.get_all_tasks()[0]
+
+        def write_then_rerun():
+            task.set_priority((task.get_priority() + 1) % 11)
+            view_rerun(views)
+
+        changed = per_rerun_ms(write_then_rerun)
+        print(f"{n:>6} {len(tm.get_all_conflicts()):>10} {full:>18.2f} {cached:>21.3f} {changed:>25.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+"""
+Benchmark suite: the scheduling hot paths of TaskManager and DailyPlanner
+on a seeded synthetic workload (see workload.py) at several task counts
+
+Results are written as JSON. Given a baseline JSON from an earlier run,
+every operation that got slower by more than the threshold is flagged and
+the exit status is 1, so the suite can guard a CI job.
+
+get_all_conflicts returns every overlapping pair of tasks, and with
+realistic durations on one daily clock that is about n * n / 35 pairs, so
+it is only timed up to --max-conflict-tasks tasks; larger sizes record it
+as skipped. Every other operation is measured at every size.
+
+Run with: python benchmarks/suite.py [--sizes 1000,10000] [--output results.json]
+          [--baseline old.json] [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time as timer
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import DailyPlanner, Task, TaskManager
+from workload import TASK_PROFILES, iter_task_rows, make_owners
+
+OPERATIONS = [
+    "create_task", "get_tasks_by_pet", "get_tasks_by_type", "get_tasks_by_priority",
+    "get_completed_tasks", "get_pending_tasks", "get_recurring_tasks",
+    "get_tasks_sorted_by_time", "check_task_conflicts", "get_all_conflicts",
+    "generate_plan[greedy]", "generate_plan[optimal]", "mark_task_completed",
+    "roll_over_recurring",
+]
+
+# Slowdowns in operations taking less than this in total are timer noise
+NOISE_FLOOR_SECONDS = 0.002
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Run a function repeat times and return the fastest wall time in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = timer.perf_counter()
+        func()
+        best = min(best, timer.perf_counter() - start)
+    return best
+
+
+def record(size: int, operation: str, calls: int, seconds: Optional[float], skipped: Optional[str] = None) -> Dict[str, Any]:
+    """Build one result entry"""
+    return {
+        "size": size,
+        "operation": operation,
+        "calls": calls,
+        "seconds": seconds,
+        "per_call_ms": None if seconds is None else seconds / calls * 1000,
+        "skipped": skipped,
+    }
+
+
+def run_size(n: int, seed: int, repeat: int, max_conflict_tasks: int) -> List[Dict[str, Any]]:
+    """Measure every operation on a workload of n tasks"""
+    results = []
+    # About 1.5 pets per owner, so roughly 8 tasks per pet as in iter_task_rows' default
+    owners = make_owners(max(1, n // 12), seed)
+    pets = [pet for owner in owners for pet in owner.get_pets()]
+    tm = TaskManager()
+    start = timer.perf_counter()
+    for row in iter_task_rows(n, seed, pet_ids=[pet.get_name() for pet in pets]):
+        tm.create_task(**row)
+    results.append(record(n, "create_task", n, timer.perf_counter() - start))
+
+    pet_ids = sorted({task.get_pet_id() for task in tm.get_all_tasks()})[:100]
+    reads = [
+        ("get_tasks_by_pet", len(pet_ids), lambda: [tm.get_tasks_by_pet(p) for p in pet_ids]),
+        ("get_tasks_by_type", len(TASK_PROFILES), lambda: [tm.get_tasks_by_type(t) for t in TASK_PROFILES]),
+        ("get_tasks_by_priority", 11, lambda: [tm.get_tasks_by_priority(p) for p in range(11)]),
+        ("get_completed_tasks", 5, lambda: [tm.get_completed_tasks() for _ in range(5)]),
+        ("get_pending_tasks", 5, lambda: [tm.get_pending_tasks() for _ in range(5)]),
+        ("get_recurring_tasks", 5, lambda: [tm.get_recurring_tasks() for _ in range(5)]),
+        ("get_tasks_sorted_by_time", 5, lambda: [tm.get_tasks_sorted_by_time() for _ in range(5)]),
+    ]
+    for operation, calls, func in reads:
+        results.append(record(n, operation, calls, best_of(func, repeat)))
+
+    # Stored and new tasks alike query the interval index
+    stored = tm.get_all_tasks()[::max(1, n // 100)][:100]
+    probes = [Task(f"Probe {i}", "Probe", f"{(i * 29) % 24:02d}:{(i * 7) % 60:02d}", 5, 20, "walk")
+              for i in range(100)]
+    results.append(record(n, "check_task_conflicts", len(stored) + len(probes),
+                          best_of(lambda: [tm.check_task_conflicts(t) for t in stored + probes], repeat)))
+
+    def all_conflicts_cold() -> None:
+        # Moving a task drops the cached pair list, as any real edit would
+        task = stored[0]
+        task.set_time(task.get_time())
+        tm.get_all_conflicts()
+
+    if n <= max_conflict_tasks:
+        results.append(record(n, "get_all_conflicts", 1, best_of(all_conflicts_cold, repeat)))
+    else:
+        results.append(record(n, "get_all_conflicts", 0, None,
+                              f"returns every overlapping pair, skipped above --max-conflict-tasks {max_conflict_tasks:,}"))
+
+    planner = DailyPlanner(pets[0], tm, cache_size=0)
+    planner.set_available_time(240)
+    results.append(record(n, "generate_plan[greedy]", 1, best_of(lambda: planner.generate_plan("greedy"), repeat)))
+    results.append(record(n, "generate_plan[optimal]", 1, best_of(lambda: planner.generate_plan("optimal"), repeat)))
+
+    # Completing a recurring task sets its current occurrence's bit;
+    # roll_over_recurring later moves it on to the occurrence that is due
+    recurring = [task.get_task_id() for task in tm.get_recurring_tasks()[:1000]]
+    start = timer.perf_counter()
+    for task_id in recurring:
+        tm.mark_task_completed(task_id)
+    results.append(record(n, "mark_task_completed", max(1, len(recurring)), timer.perf_counter() - start))
+
+    # One call walks every recurring task; completed daily ones move on to tomorrow
+    tomorrow = date.today() + timedelta(days=1)
+    start = timer.perf_counter()
+    tm.roll_over_recurring(tomorrow)
+    results.append(record(n, "roll_over_recurring", 1, timer.perf_counter() - start))
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compare a run against a baseline run
+
+    Args:
+        results: Entries of this run
+        baseline: Entries of the baseline run
+        threshold: Allowed slowdown as a fraction (0.25 = 25% slower)
+
+    Returns:
+        One entry per operation measured in both runs, with the relative
+        change and whether it is a regression
+    """
+    before = {(entry["size"], entry["operation"]): entry for entry in baseline}
+    rows = []
+    for entry in results:
+        old = before.get((entry["size"], entry["operation"]))
+        if old is None or entry["per_call_ms"] is None or old.get("per_call_ms") is None:
+            continue
+        change = entry["per_call_ms"] / old["per_call_ms"] - 1 if old["per_call_ms"] > 0 else 0.0
+        regression = change > threshold and entry["seconds"] >= NOISE_FLOOR_SECONDS
+        rows.append({"size": entry["size"], "operation": entry["operation"],
+                     "baseline_ms": old["per_call_ms"], "per_call_ms": entry["per_call_ms"],
+                     "change": change, "regression": regression})
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="PawPal+ benchmark suite")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000",
+                        help="comma-separated task counts")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per read operation (fastest is kept)")
+    parser.add_argument("--max-conflict-tasks", type=int, default=10_000,
+                        help="largest size at which get_all_conflicts (every overlapping pair) is timed")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="flag operations slower than the baseline by more than this fraction")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    results: List[Dict[str, Any]] = []
+    print(f"{'tasks':>8} {'operation':<24} {'calls':>6} {'per call (ms)':>14}")
+    for n in sizes:
+        for entry in run_size(n, args.seed, args.repeat, args.max_conflict_tasks):
+            results.append(entry)
+            if entry["skipped"]:
+                print(f"{n:>8} {entry['operation']:<24} skipped: {entry['skipped']}")
+                continue
+            print(f"{n:>8} {entry['operation']:<24} {entry['calls']:>6} {entry['per_call_ms']:>14.4f}")
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "sizes": sizes,
+        },
+        "results": results,
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        comparison = compare(results, baseline, args.threshold)
+        report["comparison"] = {"baseline": args.baseline, "threshold": args.threshold, "entries": comparison}
+        regressions = [row for row in comparison if row["regression"]]
+        print(f"\nCompared with {args.baseline} (threshold {args.threshold:.0%}):")
+        for row in comparison:
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(f"{row['size']:>8} {row['operation']:<24} {row['baseline_ms']:>10.4f} -> "
+                  f"{row['per_call_ms']:>10.4f} ms ({row['change']:+.0%}){flag}")
+        print(f"{len(regressions)} regression(s)")
+        status = 1 if regressions else 0
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
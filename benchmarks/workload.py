@@ -0,0 +1,111 @@
+"""
+Seeded synthetic workload for the benchmark suite: owners, pets and tasks
+with realistic time, duration and recurrence distributions
+
+Walks and meals cluster in the morning and evening, medication sits at
+fixed times, grooming is mostly weekly and daytime-only, and start times
+fall on 5-minute marks. The same seed always gives the same workload.
+
+Used by benchmarks/suite.py; not a script on its own.
+"""
+
+import os
+import random
+import sys
+from typing import Any, Dict, Iterator, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pawpal_system import Owner, Pet
+
+# task type -> share of tasks, labels, durations, priority range, daily time windows
+# (start minute, end minute) and recurrence weights
+TASK_PROFILES: Dict[str, Dict[str, Any]] = {
+    "walk": dict(share=0.30, labels=["Morning walk", "Evening walk", "Long walk"],
+                 durations=[15, 20, 30, 45, 60], priority=(5, 9),
+                 windows=[(6 * 60, 9 * 60), (17 * 60, 21 * 60)],
+                 recurrence={"daily": 0.8, None: 0.2}),
+    "feed": dict(share=0.25, labels=["Breakfast", "Dinner", "Snack"],
+                 durations=[5, 10, 15], priority=(7, 10),
+                 windows=[(6 * 60 + 30, 8 * 60 + 30), (17 * 60, 19 * 60)],
+                 recurrence={"daily": 0.95, None: 0.05}),
+    "medication": dict(share=0.10, labels=["Pill", "Eye drops", "Flea treatment"],
+                       durations=[2, 5, 10], priority=(8, 10),
+                       windows=[(8 * 60, 8 * 60 + 15), (20 * 60, 20 * 60 + 15)],
+                       recurrence={"daily": 0.85, "weekly": 0.1, None: 0.05}),
+    "grooming": dict(share=0.10, labels=["Brushing", "Bath", "Nail trim"],
+                     durations=[15, 30, 60, 90], priority=(2, 6),
+                     windows=[(9 * 60, 18 * 60)],
+                     recurrence={"weekly": 0.6, None: 0.4}),
+    "playtime": dict(share=0.15, labels=["Fetch", "Tug of war", "Laser pointer"],
+                     durations=[10, 15, 30], priority=(1, 6),
+                     windows=[(10 * 60, 22 * 60)],
+                     recurrence={"daily": 0.3, None: 0.7}),
+    "training": dict(share=0.10, labels=["Sit and stay", "Recall", "Leash training"],
+                     durations=[10, 15, 20, 30], priority=(3, 7),
+                     windows=[(9 * 60, 19 * 60)],
+                     recurrence={"daily": 0.3, "weekly": 0.3, None: 0.4}),
+}
+
+SPECIES = {"dog": 0.55, "cat": 0.35, "other": 0.10}
+PETS_PER_OWNER = {1: 0.6, 2: 0.3, 3: 0.1}
+
+
+def _pick(rng: random.Random, weights: Dict[Any, float]) -> Any:
+    """Pick a key with probability proportional to its weight"""
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def make_owners(n_owners: int, seed: int = 42) -> List[Owner]:
+    """
+    Generate owners with one to three pets each
+
+    Args:
+        n_owners: Number of owners
+        seed: Random seed
+
+    Returns:
+        Owners; every pet name is unique across the workload
+    """
+    rng = random.Random(seed)
+    owners = []
+    for i in range(n_owners):
+        owner = Owner(f"Owner {i}", f"owner{i}@example.com")
+        for j in range(_pick(rng, PETS_PER_OWNER)):
+            owner.add_pet(Pet(f"pet{i}-{j}", rng.randrange(1, 16), _pick(rng, SPECIES)))
+        owners.append(owner)
+    return owners
+
+
+def iter_task_rows(n: int, seed: int = 42, pet_ids: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Generate create_task rows one at a time
+
+    Args:
+        n: Number of tasks
+        seed: Random seed
+        pet_ids: Pets to spread the tasks over (about 8 tasks per pet by default)
+
+    Yields:
+        Dicts of create_task arguments with unique task names
+    """
+    rng = random.Random(seed)
+    if pet_ids is None:
+        pet_ids = [f"pet{i}" for i in range(max(1, n // 8))]
+    types = list(TASK_PROFILES)
+    shares = [TASK_PROFILES[t]["share"] for t in types]
+    for i in range(n):
+        task_type = rng.choices(types, weights=shares)[0]
+        profile = TASK_PROFILES[task_type]
+        lo, hi = rng.choice(profile["windows"])
+        start = rng.randrange(lo, hi + 1) // 5 * 5
+        yield dict(
+            task_name=f"{rng.choice(profile['labels'])} #{i}",
+            description=f"Synthetic {task_type}",
+            time=f"{start // 60:02d}:{start % 60:02d}",
+            priority=rng.randint(*profile["priority"]),
+            duration=rng.choice(profile["durations"]),
+            task_type=task_type,
+            recurrence=_pick(rng, profile["recurrence"]),
+            pet_id=rng.choice(pet_ids),
+        )
@@ -0,0 +1,135 @@
+"""
+PawPal+ Task Archive
+Append-only JSONL archive for completed tasks moved out of a TaskManager
+"""
+
+import json
+import os
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from pawpal_system import Task
+
+
+class TaskArchive:
+    """
+    Append-only archive of completed tasks, one JSON record per line.
+
+    Records are only ever appended, so compaction never rewrites history.
+    Summary counters stay in memory and historical queries stream the file
+    one line at a time, so neither depends on loading the archive.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open an archive, creating it on the first append
+
+        Args:
+            path: Path of the JSONL file
+        """
+        self._path = path
+        self._count = 0
+        self._total_duration = 0
+        self._by_type: Dict[str, int] = {}
+        self._by_pet: Dict[Optional[str], int] = {}
+        if os.path.exists(path):
+            # Rebuild the counters for an existing archive in one streaming pass
+            for record in self._records():
+                self._count_record(record)
+
+    def get_path(self) -> str:
+        """Get the path of the archive file"""
+        return self._path
+
+    def _count_record(self, record: Dict[str, Any]) -> None:
+        """Add one record to the summary counters"""
+        self._count += 1
+        self._total_duration += record['duration']
+        self._by_type[record['task_type']] = self._by_type.get(record['task_type'], 0) + 1
+        self._by_pet[record.get('pet_id')] = self._by_pet.get(record.get('pet_id'), 0) + 1
+
+    def append(self, tasks: List[Task]) -> None:
+        """
+        Append tasks to the archive
+
+        Args:
+            tasks: Tasks to archive
+        """
+        records = [task.to_dict() for task in tasks]
+        with open(self._path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        for record in records:
+            self._count_record(record)
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        """Stream the raw records in the order they were archived"""
+        if not os.path.exists(self._path):
+            return
+        with open(self._path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Stream every archived task, oldest archived first
+
+        Yields:
+            Restored Task objects, one at a time
+        """
+        for record in self._records():
+            yield Task.from_dict(record)
+
+    def query(
+        self,
+        task_type: Optional[str] = None,
+        pet_id: Optional[str] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        predicate: Optional[Callable[[Task], bool]] = None
+    ) -> Iterator[Task]:
+        """
+        Stream archived tasks matching every given filter
+
+        Args:
+            task_type: Only tasks of this type
+            pet_id: Only tasks for this pet
+            start: Only tasks dated on or after this date
+            end: Only tasks dated on or before this date
+            predicate: Extra test applied to each restored task
+
+        Yields:
+            Matching Task objects, one at a time
+        """
+        task_type = task_type.strip().lower() if task_type else None
+        for record in self._records():
+            # Filter on the raw record before paying for a Task
+            if task_type is not None and record['task_type'] != task_type:
+                continue
+            if pet_id is not None and record.get('pet_id') != pet_id:
+                continue
+            record_date = date.fromisoformat(record['start_date'])
+            if (start is not None and record_date < start) or (end is not None and record_date > end):
+                continue
+            task = Task.from_dict(record)
+            if predicate is None or predicate(task):
+                yield task
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get the in-memory summary of the archive
+
+        Returns:
+            Dictionary with count, total_duration, by_type and by_pet
+        """
+        return {
+            'count': self._count,
+            'total_duration': self._total_duration,
+            'by_type': dict(self._by_type),
+            'by_pet': dict(self._by_pet),
+        }
+
+    def __len__(self) -> int:
+        """Number of archived tasks"""
+        return self._count
@@ -0,0 +1,273 @@
+"""
+PawPal+ Asyncio Facade
+Runs TaskManager and DailyPlanner calls off the event loop
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from pawpal_system import DailyPlanner, Pet, Task, TaskManager
+
+T = TypeVar("T")
+
+
+class AsyncTaskManager:
+    """
+    Asyncio facade over a TaskManager (or SqliteTaskManager).
+
+    Every call runs on an executor so that large conflict checks and plans
+    do not block the event loop. The default executor has a single worker
+    thread, which also serialises access to the manager: TaskManager is not
+    thread safe, so only pass a multi-threaded executor for a manager that is.
+
+    create_task calls issued in the same event loop iteration (for example
+    through asyncio.gather) are merged into one create_tasks_bulk batch.
+    """
+
+    def __init__(self, task_manager: Optional[TaskManager] = None, executor: Optional[Executor] = None):
+        """
+        Initialize AsyncTaskManager
+
+        Args:
+            task_manager: Manager to wrap, defaults to a new TaskManager
+            executor: Executor to run calls on, defaults to a private
+                single-thread executor that close() shuts down
+        """
+        self._task_manager = task_manager if task_manager is not None else TaskManager()
+        self._owns_executor = executor is None
+        self._executor = executor if executor is not None else ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pawpal")
+        self._pending: List[tuple[Dict[str, Any], bool, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._batch_count = 0
+
+    def get_task_manager(self) -> TaskManager:
+        """Get the wrapped manager (only call it from the executor or while no call is running)"""
+        return self._task_manager
+
+    def get_batch_count(self) -> int:
+        """Get the number of create_task batches run so far"""
+        return self._batch_count
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run any function on the executor, after every create_task issued before it
+
+        Args:
+            func: Function to call, usually a method of the wrapped manager
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The function's result
+        """
+        loop = asyncio.get_running_loop()
+        if self._flush_handle is not None:
+            # Submit pending creates first so this call sees them
+            self._flush_handle.cancel()
+            self._flush_creates()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def create_task(
+        self,
+        task_name: str,
+        description: str,
+        time: str,
+        priority: int,
+        duration: int,
+        task_type: str,
+        recurrence: Optional[str] = None,
+        pet_id: Optional[str] = None,
+        allow_duplicates: bool = False,
+        start_date: Optional[Any] = None
+    ) -> Task:
+        """
+        Create a task, batched with other create_task calls of this loop iteration
+
+        Args:
+            task_name: Name of the task
+            description: Detailed description
+            time: Scheduled time
+            priority: Priority level
+            duration: Duration in minutes
+            task_type: Type of task
+            recurrence: Recurrence pattern (None, "daily", "weekly")
+            pet_id: Optional pet ID to associate with this task
+            allow_duplicates: If False, prevents creating duplicate tasks
+            start_date: Date of the first (or only) occurrence, defaults to today
+
+        Returns:
+            The created Task object
+
+        Raises:
+            ValueError: If the task is invalid or a duplicate
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        row = dict(task_name=task_name, description=description, time=time, priority=priority,
+                   duration=duration, task_type=task_type, recurrence=recurrence, pet_id=pet_id,
+                   start_date=start_date)
+        self._pending.append((row, allow_duplicates, future))
+        if self._flush_handle is None:
+            # Runs after every callback already queued, i.e. the rest of the burst
+            self._flush_handle = loop.call_soon(self._flush_creates)
+        return await future
+
+    def _flush_creates(self) -> None:
+        """Submit the pending create_task calls to the executor as one batch"""
+        pending, self._pending = self._pending, []
+        self._flush_handle = None
+        if not pending:
+            return
+        self._batch_count += 1
+        requests = [(row, allow_duplicates) for row, allow_duplicates, _ in pending]
+        futures = [future for _, _, future in pending]
+        done = asyncio.get_running_loop().run_in_executor(self._executor, self._create_batch, requests)
+
+        def deliver(done: asyncio.Future) -> None:
+            error = done.exception() if not done.cancelled() else asyncio.CancelledError()
+            outcomes = [error] * len(futures) if error is not None else done.result()
+            for future, outcome in zip(futures, outcomes):
+                if future.done():
+                    continue
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+        done.add_done_callback(deliver)
+
+    def _create_batch(self, requests: List[tuple[Dict[str, Any], bool]]) -> List[Any]:
+        """
+        Create a batch of tasks on the executor
+
+        Returns:
+            One Task or ValueError per request, in order
+        """
+        outcomes: List[Any] = []
+        # One bulk call per run of requests sharing the same allow_duplicates flag
+        for allow_duplicates, run in groupby(requests, key=lambda request: request[1]):
+            rows = [row for row, _ in run]
+            created, errors = self._task_manager.create_tasks_bulk(rows, allow_duplicates=allow_duplicates)
+            failed = dict(errors)
+            created_iter = iter(created)
+            outcomes.extend(ValueError(failed[n]) if n in failed else next(created_iter)
+                            for n in range(len(rows)))
+        return outcomes
+
+    async def edit_task(self, task_id: str, **kwargs) -> Optional[Task]:
+        """Edit a task (see TaskManager.edit_task)"""
+        return await self.run(self._task_manager.edit_task, task_id, **kwargs)
+
+    async def delete_task(self, task_id: str) -> bool:
+        """Delete a task (see TaskManager.delete_task)"""
+        return await self.run(self._task_manager.delete_task, task_id)
+
+    async def mark_task_completed(self, task_id: str) -> Optional[Task]:
+        """Mark a task completed (see TaskManager.mark_task_completed)"""
+        return await self.run(self._task_manager.mark_task_completed, task_id)
+
+    async def roll_over_recurring(self, on_date: Optional[date] = None) -> int:
+        """Move completed recurring tasks on (see TaskManager.roll_over_recurring)"""
+        return await self.run(self._task_manager.roll_over_recurring, on_date)
+
+    async def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        """Get a specific task by ID"""
+        return await self.run(self._task_manager.get_task_by_id, task_id)
+
+    async def get_all_tasks(self) -> List[Task]:
+        """Get all tasks"""
+        return await self.run(self._task_manager.get_all_tasks)
+
+    async def get_tasks_by_pet(self, pet_id: str) -> List[Task]:
+        """Get all tasks for a specific pet"""
+        return await self.run(self._task_manager.get_tasks_by_pet, pet_id)
+
+    async def get_tasks_sorted_by_time(self) -> List[Task]:
+        """Get all tasks sorted by scheduled time"""
+        return await self.run(self._task_manager.get_tasks_sorted_by_time)
+
+    async def check_task_conflicts(self, task: Task) -> List[tuple[Task, str]]:
+        """Check a task for scheduling conflicts with existing tasks"""
+        return await self.run(self._task_manager.check_task_conflicts, task)
+
+    async def get_all_conflicts(self) -> List[tuple[Task, Task, str]]:
+        """Get all scheduling conflicts"""
+        return await self.run(self._task_manager.get_all_conflicts)
+
+    async def get_total_duration(self, include_completed: bool = True) -> int:
+        """Get the total duration of tasks"""
+        return await self.run(self._task_manager.get_total_duration, include_completed)
+
+    def close(self) -> None:
+        """Shut down the executor if this facade created it"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncTaskManager":
+        """Use the facade as an async context manager"""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Wait for queued calls, then shut down the executor"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_creates()
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+class AsyncDailyPlanner:
+    """
+    Asyncio facade over a DailyPlanner.
+
+    Plans run on the AsyncTaskManager's executor, so they never overlap with
+    writes to the tasks. Configure the planner (available time, preferences,
+    plan date) through get_planner() between awaits.
+    """
+
+    def __init__(self, pet: Pet, task_manager: AsyncTaskManager, buffer_minutes: int = 5, cache_size: int = 32):
+        """
+        Initialize AsyncDailyPlanner
+
+        Args:
+            pet: The Pet object
+            task_manager: The AsyncTaskManager holding the tasks
+            buffer_minutes: Minutes of buffer time to add between consecutive tasks
+            cache_size: Number of generated plans to keep (0 disables the plan cache)
+        """
+        self._task_manager = task_manager
+        self._planner = DailyPlanner(pet, task_manager.get_task_manager(), buffer_minutes, cache_size)
+
+    def get_planner(self) -> DailyPlanner:
+        """Get the wrapped DailyPlanner"""
+        return self._planner
+
+    async def generate_plan(self, mode: str = "greedy") -> List[Task]:
+        """Generate a plan on the executor (see DailyPlanner.generate_plan)"""
+        return await self._task_manager.run(self._planner.generate_plan, mode)
+
+    async def get_plan_summary(self) -> Dict[str, Any]:
+        """Get the summary of the last plan"""
+        return await self._task_manager.run(self._planner.get_plan_summary)
+
+    async def explain_plan(self, page: int = 1, page_size: int = 50) -> str:
+        """Explain one page of the last plan (see DailyPlanner.explain_plan)"""
+        return await self._task_manager.run(self._planner.explain_plan, page, page_size)
+
+
+async def generate_plans(planners: Sequence[AsyncDailyPlanner], mode: str = "greedy") -> List[List[Task]]:
+    """
+    Generate plans for several pets concurrently
+
+    Args:
+        planners: One AsyncDailyPlanner per pet
+        mode: Planning mode passed to every planner
+
+    Returns:
+        The plans, in the order of planners
+    """
+    return list(await asyncio.gather(*(planner.generate_plan(mode) for planner in planners)))
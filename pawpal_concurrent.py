@@ -0,0 +1,308 @@
+"""
+PawPal+ Concurrent Task Manager
+TaskManager for many threads: locked writers, lock-free snapshot readers
+"""
+
+import copy
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from pawpal_archive import TaskArchive
+from pawpal_system import Task, TaskManager, TaskOccurrence
+
+
+class TaskSnapshot(TaskManager):
+    """
+    Read-only copy of a TaskManager at one version.
+
+    Its indexes never change after it is published, and neither do the
+    fields of the tasks it returns, so any number of threads can filter,
+    sort and scan it without a lock and always see tasks that agree with
+    its indexes. Task objects are shared with the live store until a writer
+    changes or deletes one: just before that write, every snapshot still
+    holding the object gets a frozen copy of it in its place. Frozen copies
+    reject setters; a Task reference taken before the write is the live
+    task and shows the new values, so look tasks up in the snapshot when
+    fields must match it.
+    """
+
+    def _add_task(self, task: Task, priority_batch: Optional[list] = None, index_interval: bool = True) -> None:
+        """Reject writes"""
+        raise RuntimeError("Task snapshots are read-only, write through ConcurrentTaskManager")
+
+    def _remove_task(self, task_id: str) -> Task:
+        """Reject writes"""
+        raise RuntimeError("Task snapshots are read-only, write through ConcurrentTaskManager")
+
+
+def _reject_write(task: Task) -> None:
+    """Guard of frozen snapshot copies: reject every setter"""
+    raise RuntimeError("This task is a snapshot's frozen copy, change it through ConcurrentTaskManager")
+
+
+class _LiveTaskManager(TaskManager):
+    """The writable store behind a ConcurrentTaskManager"""
+
+    def __init__(self, owner: "ConcurrentTaskManager"):
+        """Initialize the store for its owner"""
+        super().__init__()
+        self._owner = owner
+
+    def _add_task(self, task: Task, priority_batch: Optional[list] = None, index_interval: bool = True) -> None:
+        """Store a task whose setters run under the owner's write lock"""
+        super()._add_task(task, priority_batch, index_interval)
+        task._guard = self._owner._writing
+
+    def _remove_task(self, task_id: str) -> Task:
+        """Drop a task, leaving frozen copies in the snapshots that still hold it"""
+        task = super()._remove_task(task_id)
+        self._owner._freeze(task)
+        return task
+
+
+class ConcurrentTaskManager:
+    """
+    Thread-safe TaskManager with copy-on-write read snapshots.
+
+    Writers take a short lock, update the live store and publish a new
+    TaskSnapshot. Readers only load the current snapshot, so they never wait
+    for a writer and never see a dictionary change while iterating.
+
+    Publishing copies only the top-level dictionaries (O(tasks), no per-task
+    work); index buckets and Task objects are shared and copied by the
+    writer the first time it changes one, so only the first change to a
+    task after each publish pays for a Task copy. Use batch() to publish
+    once for many writes. For several queries that must agree with each
+    other, take one snapshot() and read from it.
+    """
+
+    def __init__(self):
+        """Initialize an empty ConcurrentTaskManager"""
+        self._lock = threading.RLock()
+        self._depth = 0  # nesting of batch() in the thread holding the lock
+        self._live = _LiveTaskManager(self)
+        self._snapshot: TaskSnapshot = self._live._share(TaskSnapshot)
+        self._published: "weakref.WeakSet[TaskSnapshot]" = weakref.WeakSet([self._snapshot])
+        self._publish_count = 0
+
+    def snapshot(self) -> TaskSnapshot:
+        """
+        Get the latest published snapshot (no lock taken)
+
+        Returns:
+            A read-only TaskManager whose tasks and indexes never change
+        """
+        return self._snapshot
+
+    def get_publish_count(self) -> int:
+        """Get the number of snapshots published so far"""
+        return self._publish_count
+
+    @contextmanager
+    def batch(self) -> Iterator[TaskManager]:
+        """
+        Hold the write lock for several writes and publish once at the end
+
+        Yields:
+            The live TaskManager, only to be used inside the with-block
+        """
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self._live
+            finally:
+                self._depth -= 1
+                if self._depth == 0 and self._live.get_version() != self._snapshot.get_version():
+                    self._snapshot = self._live._share(TaskSnapshot)
+                    self._published.add(self._snapshot)
+                    self._publish_count += 1
+
+    @contextmanager
+    def _writing(self, task: Task) -> Iterator[None]:
+        """
+        Guard of live tasks (see Task._changing): hold the write lock across
+        a setter and freeze the task's current fields into the snapshots
+        that still share it before they change
+        """
+        with self.batch():
+            self._freeze(task)
+            yield
+
+    def _freeze(self, task: Task) -> None:
+        """Replace a live task with one frozen copy in every snapshot still holding it (lock held)"""
+        task_id = task.get_task_id()
+        frozen = None
+        for snapshot in self._published:
+            if snapshot._tasks.get(task_id) is task:
+                if frozen is None:
+                    frozen = copy.copy(task)
+                    frozen._listener = None
+                    frozen._guard = _reject_write
+                # Replacing a value never resizes the dict, so lock-free readers keep iterating
+                snapshot._tasks[task_id] = frozen
+
+    # Writes
+
+    def subscribe(self, callback: Callable[[str, Task], None]) -> None:
+        """Register a callback for task mutations, called while the write lock is held"""
+        with self._lock:
+            self._live.subscribe(callback)
+
+    def unsubscribe(self, callback: Callable[[str, Task], None]) -> None:
+        """Remove a callback registered with subscribe()"""
+        with self._lock:
+            self._live.unsubscribe(callback)
+
+    def create_task(
+        self,
+        task_name: str,
+        description: str,
+        time: str,
+        priority: int,
+        duration: int,
+        task_type: str,
+        recurrence: Optional[str] = None,
+        pet_id: Optional[str] = None,
+        allow_duplicates: bool = False,
+        warn_conflicts: bool = False,
+        start_date: Optional[date] = None
+    ) -> Task:
+        """Create a new task (see TaskManager.create_task)"""
+        with self.batch() as tm:
+            return tm.create_task(task_name, description, time, priority, duration, task_type,
+                                  recurrence, pet_id, allow_duplicates, warn_conflicts, start_date)
+
+    def create_tasks_bulk(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        allow_duplicates: bool = False
+    ) -> tuple[List[Task], List[tuple[int, str]]]:
+        """Create many tasks and publish once (see TaskManager.create_tasks_bulk)"""
+        with self.batch() as tm:
+            return tm.create_tasks_bulk(rows, allow_duplicates)
+
+    def add_tasks(self, tasks: List[Task]) -> None:
+        """Store already built tasks and publish once (see TaskManager.add_tasks)"""
+        with self.batch() as tm:
+            tm.add_tasks(tasks)
+
+    def edit_task(self, task_id: str, **kwargs) -> Optional[Task]:
+        """Edit an existing task (see TaskManager.edit_task)"""
+        with self.batch() as tm:
+            return tm.edit_task(task_id, **kwargs)
+
+    def delete_task(self, task_id: str) -> bool:
+        """Delete a task (see TaskManager.delete_task)"""
+        with self.batch() as tm:
+            return tm.delete_task(task_id)
+
+    def mark_task_completed(self, task_id: str) -> Optional[Task]:
+        """Mark a task as completed (see TaskManager.mark_task_completed)"""
+        with self.batch() as tm:
+            return tm.mark_task_completed(task_id)
+
+    def roll_over_recurring(self, on_date: Optional[date] = None) -> int:
+        """Move completed recurring tasks on (see TaskManager.roll_over_recurring)"""
+        with self.batch() as tm:
+            return tm.roll_over_recurring(on_date)
+
+    def compact(self, archive: TaskArchive, older_than_days: int = 30, now: Optional[datetime] = None) -> int:
+        """Archive old completed tasks (see TaskManager.compact)"""
+        with self.batch() as tm:
+            return tm.compact(archive, older_than_days, now)
+
+    def set_auto_compaction(
+        self,
+        archive: Optional[TaskArchive],
+        older_than_days: int = 30,
+        threshold: int = 1000
+    ) -> None:
+        """Compact automatically (see TaskManager.set_auto_compaction)"""
+        with self.batch() as tm:
+            tm.set_auto_compaction(archive, older_than_days, threshold)
+
+    def run_auto_compaction(self) -> int:
+        """Compact if automatic compaction is due (see TaskManager.run_auto_compaction)"""
+        with self.batch() as tm:
+            return tm.run_auto_compaction()
+
+    # Reads, each answered from the latest snapshot without a lock
+
+    def get_version(self) -> int:
+        """Get the mutation version of the latest snapshot"""
+        return self._snapshot.get_version()
+
+    def has_duplicate_task(self, task_name: str, time: str) -> bool:
+        """Check if a task with the same name and time already exists"""
+        return self._snapshot.has_duplicate_task(task_name, time)
+
+    def get_all_tasks(self) -> List[Task]:
+        """Get all tasks as a list"""
+        return self._snapshot.get_all_tasks()
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """Generate all tasks of the latest snapshot, whose task set never changes while iterating"""
+        return self._snapshot.iter_tasks()
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        """Get a specific task by ID"""
+        return self._snapshot.get_task_by_id(task_id)
+
+    def get_insertion_rank(self, task_id: str) -> Optional[int]:
+        """
+        Get a task's insertion rank from the live store, so mutation
+        subscribers see tasks the next snapshot has not published yet
+        """
+        with self._lock:
+            return self._live.get_insertion_rank(task_id)
+
+    def get_tasks_by_type(self, task_type: str) -> List[Task]:
+        """Get all tasks of a specific type"""
+        return self._snapshot.get_tasks_by_type(task_type)
+
+    def get_tasks_by_priority(self, min_priority: int) -> List[Task]:
+        """Get tasks with priority >= min_priority"""
+        return self._snapshot.get_tasks_by_priority(min_priority)
+
+    def get_completed_tasks(self) -> List[Task]:
+        """Get all completed tasks"""
+        return self._snapshot.get_completed_tasks()
+
+    def get_pending_tasks(self) -> List[Task]:
+        """Get all pending tasks"""
+        return self._snapshot.get_pending_tasks()
+
+    def get_recurring_tasks(self) -> List[Task]:
+        """Get all recurring tasks"""
+        return self._snapshot.get_recurring_tasks()
+
+    def get_tasks_by_pet(self, pet_id: str) -> List[Task]:
+        """Get all tasks for a specific pet"""
+        return self._snapshot.get_tasks_by_pet(pet_id)
+
+    def get_tasks_sorted_by_time(self) -> List[Task]:
+        """Get all tasks sorted by scheduled time"""
+        return self._snapshot.get_tasks_sorted_by_time()
+
+    def check_task_conflicts(self, task: Task) -> List[tuple[Task, str]]:
+        """Check a task for scheduling conflicts with existing tasks"""
+        return self._snapshot.check_task_conflicts(task)
+
+    def get_all_conflicts(self) -> List[tuple[Task, Task, str]]:
+        """Get all scheduling conflicts"""
+        return self._snapshot.get_all_conflicts()
+
+    def iter_occurrences(self, start: date, end: Optional[date] = None) -> Iterable[TaskOccurrence]:
+        """Generate every task occurrence between two dates, inclusive"""
+        return self._snapshot.iter_occurrences(start, end)
+
+    def get_occurrences_on(self, on_date: date) -> List[TaskOccurrence]:
+        """Get the occurrences of all tasks on one date"""
+        return self._snapshot.get_occurrences_on(on_date)
+
+    def get_total_duration(self, include_completed: bool = True) -> int:
+        """Calculate total duration of all tasks"""
+        return self._snapshot.get_total_duration(include_completed)
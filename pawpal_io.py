@@ -0,0 +1,192 @@
+"""
+PawPal+ JSON Lines Import/Export
+Streams tasks, owners and pets to and from .jsonl (optionally gzip) files
+"""
+
+import gzip
+import io
+import json
+import os
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TextIO, Union
+
+from pawpal_system import Owner, Task, TaskManager
+
+# Called as reject(line_number, line, message) for every row that cannot be imported
+RejectSink = Callable[[int, str, str], None]
+
+Source = Union[str, os.PathLike, TextIO, io.BufferedIOBase]
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def iter_records(task_manager: TaskManager, owner: Optional[Owner] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Generate the records of an export one at a time
+
+    Args:
+        task_manager: Tasks to export
+        owner: Optional owner (with their pets) to export first
+
+    Yields:
+        One dictionary per line, each with a "kind" of "owner" or "task"
+    """
+    if owner is not None:
+        yield {'kind': 'owner', **owner.to_dict()}
+    # iter_tasks builds one Task at a time, so a SQLite export never holds them all
+    for task in task_manager.iter_tasks():
+        yield {'kind': 'task', **task.to_dict()}
+
+
+def export_jsonl(fp: Source, task_manager: TaskManager, owner: Optional[Owner] = None) -> int:
+    """
+    Write an owner and every task as JSON Lines, one record at a time
+
+    Args:
+        fp: Text file object, or a path (gzip-compressed when it ends in .gz)
+        task_manager: Tasks to export
+        owner: Optional owner (with their pets) to export first
+
+    Returns:
+        Number of lines written
+    """
+    with _open_text(fp, "w") as out:
+        count = 0
+        for record in iter_records(task_manager, owner):
+            out.write(json.dumps(record, ensure_ascii=False))
+            out.write("\n")
+            count += 1
+    return count
+
+
+def import_jsonl(
+    fp: Source,
+    task_manager: TaskManager,
+    reject: Optional[RejectSink] = None,
+    chunk_size: int = 1000,
+    allow_duplicates: bool = False
+) -> Dict[str, Any]:
+    """
+    Read JSON Lines into a TaskManager, streaming the input.
+
+    Lines are parsed and validated in chunks of chunk_size and each valid
+    chunk is stored with one add_tasks call, so memory stays bounded by the
+    chunk, not the file; duplicates are checked against the current chunk
+    and the manager's indexes. Bad lines (invalid JSON, invalid fields, duplicate
+    IDs, or duplicate name and time unless allow_duplicates) are passed to
+    the reject sink and skipped instead of aborting the import.
+
+    Args:
+        fp: Text or binary file object, or a path; gzip input is detected
+            from its first bytes and decompressed on the fly
+        task_manager: Manager to add the tasks to (TaskManager or
+            SqliteTaskManager)
+        reject: Called as reject(line_number, line, message) for each bad line
+        chunk_size: Lines validated and stored per batch
+        allow_duplicates: If False, tasks matching a stored or earlier task
+            by name and time are rejected
+
+    Returns:
+        Dictionary with imported (count), rejected (count) and owner (the
+        last owner record, or None)
+    """
+    result: Dict[str, Any] = {'imported': 0, 'rejected': 0, 'owner': None}
+
+    def rejected(line_number: int, line: str, message: str) -> None:
+        result['rejected'] += 1
+        if reject is not None:
+            reject(line_number, line, message)
+
+    with _open_text(fp, "r") as source:
+        lines = enumerate(source, start=1)
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                break
+            # Earlier chunks are already stored, so the manager's lookups
+            # cover them and these sets only hold the current chunk
+            tasks: List[Task] = []
+            seen_ids: Set[str] = set()
+            seen_keys: Set[tuple[str, str]] = set()
+            for line_number, line in chunk:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    if not isinstance(record, dict):
+                        raise ValueError("Line must be a JSON object")
+                    kind = record.pop('kind', 'task')
+                    if kind == 'owner':
+                        result['owner'] = Owner.from_dict(record)
+                        continue
+                    if kind != 'task':
+                        raise ValueError(f"Unknown record kind '{kind}'")
+                    task = Task.from_dict(record)
+                    key = (task.get_task_name(), task.get_time())
+                    task_id = task.get_task_id()
+                    if task_id in seen_ids or task_manager.get_task_by_id(task_id) is not None:
+                        raise ValueError(f"Task ID {task_id} already exists")
+                    if not allow_duplicates and (key in seen_keys or task_manager.has_duplicate_task(*key)):
+                        raise ValueError(f"Task '{key[0]}' at {key[1]} already exists")
+                except (ValueError, TypeError, AttributeError) as e:
+                    rejected(line_number, line.rstrip("\n"), str(e))
+                    continue
+                seen_ids.add(task_id)
+                seen_keys.add(key)
+                tasks.append(task)
+            task_manager.add_tasks(tasks)
+            result['imported'] += len(tasks)
+    return result
+
+
+def _open_text(fp: Source, mode: str, compresslevel: int = 9) -> TextIO:
+    """
+    Open a path or wrap a file object as UTF-8 text, handling gzip
+
+    Paths are compressed on write (at compresslevel) when they end in .gz.
+    On read, paths and binary file objects are checked for the gzip magic
+    number.
+    """
+    if isinstance(fp, (str, os.PathLike)):
+        if mode == "w":
+            if os.fspath(fp).endswith(".gz"):
+                return gzip.open(fp, "wt", encoding="utf-8", compresslevel=compresslevel)
+            return open(fp, "w", encoding="utf-8")
+        with open(fp, "rb") as f:
+            compressed = f.read(2) == _GZIP_MAGIC
+        if compressed:
+            return gzip.open(fp, "rt", encoding="utf-8")
+        return open(fp, "r", encoding="utf-8")
+
+    if isinstance(fp, io.TextIOBase):
+        # Leave the caller's file open when the with-block ends
+        return _Unclosed(fp)
+    # Binary file object
+    if mode == "r":
+        buffered = fp if hasattr(fp, "peek") else io.BufferedReader(fp)
+        if buffered.peek(2)[:2] == _GZIP_MAGIC:
+            buffered = gzip.GzipFile(fileobj=buffered, mode="rb")
+        return _Unclosed(io.TextIOWrapper(buffered, encoding="utf-8"), detach=True)
+    return _Unclosed(io.TextIOWrapper(fp, encoding="utf-8"), detach=True)
+
+
+class _Unclosed:
+    """Context manager around a caller's file that flushes but does not close it"""
+
+    def __init__(self, stream: TextIO, detach: bool = False):
+        """Wrap a stream; detach marks a TextIOWrapper created over the caller's binary file"""
+        self._stream = stream
+        self._detach = detach
+
+    def __enter__(self) -> TextIO:
+        """Return the wrapped stream"""
+        return self._stream
+
+    def __exit__(self, *exc_info) -> None:
+        """Flush the stream, and detach our own wrapper so the caller's binary file stays open"""
+        self._stream.flush()
+        if self._detach and not self._stream.closed:
+            try:
+                self._stream.detach()
+            except (ValueError, io.UnsupportedOperation):
+                pass
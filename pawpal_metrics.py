@@ -0,0 +1,301 @@
+"""
+PawPal+ Metrics
+Runtime-switchable timing of TaskManager and DailyPlanner public methods
+"""
+
+import functools
+import json
+import threading
+import time as timer
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from pawpal_system import DailyPlanner, TaskManager
+from pawpal_sqlite import SqliteTaskManager
+
+DEFAULT_CLASSES = (TaskManager, SqliteTaskManager, DailyPlanner)
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Guards class patching, which is process-wide
+_PATCH_LOCK = threading.Lock()
+
+# Pending calls per method that trigger folding into the counters
+_FOLD_BATCH = 256
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of an ascending list
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction (0.99 for p99)
+
+    Returns:
+        The percentile, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * fraction // 1))
+    return sorted_values[int(rank) - 1]
+
+
+class _MethodStats:
+    """Counters of one instrumented method"""
+
+    __slots__ = ('calls', 'errors', 'total', 'max', 'recent', 'tasks_sum', 'tasks_count', 'tasks_max',
+                 'result_sum', 'result_count', 'result_max', 'pending')
+
+    def __init__(self, window: int):
+        """Initialize empty counters keeping the last window latencies"""
+        self.recent: Deque[float] = deque(maxlen=window)
+        # (elapsed, tasks, result size, failed) per call, appended without a lock
+        self.pending: Deque[tuple] = deque()
+        self.clear()
+
+    def clear(self) -> None:
+        """Reset every counter"""
+        self.calls = self.errors = 0
+        self.total = self.max = 0.0
+        self.recent.clear()
+        self.pending.clear()
+        self.tasks_sum = self.tasks_count = self.tasks_max = 0
+        self.result_sum = self.result_count = self.result_max = 0
+
+    def fold(self) -> None:
+        """Add the pending calls to the counters (call with the metrics lock held)"""
+        pending = self.pending
+        if not pending:
+            return
+        # Other threads only append, so the first len(pending) entries are ours to take
+        batch = [pending.popleft() for _ in range(len(pending))]
+        elapsed, tasks, sizes, failed = zip(*batch)
+        self.calls += len(batch)
+        self.errors += sum(failed)
+        self.total += sum(elapsed)
+        self.max = max(self.max, max(elapsed))
+        self.recent.extend(elapsed)
+        tasks = [n for n in tasks if n is not None]
+        if tasks:
+            self.tasks_sum += sum(tasks)
+            self.tasks_count += len(tasks)
+            self.tasks_max = max(self.tasks_max, max(tasks))
+        sizes = [n for n in sizes if n is not None]
+        if sizes:
+            self.result_sum += sum(sizes)
+            self.result_count += len(sizes)
+            self.result_max = max(self.result_max, max(sizes))
+
+
+def _task_count(obj: Any) -> Optional[int]:
+    """Number of tasks in an in-memory manager, or in the manager of a planner"""
+    tasks = getattr(obj, '_tasks', None)
+    if tasks is None:
+        tasks = getattr(getattr(obj, '_task_manager', None), '_tasks', None)
+    return len(tasks) if isinstance(tasks, dict) else None
+
+
+def _result_size(result: Any) -> Optional[int]:
+    """Length of a list result (tasks, conflicts, plan), or of the created tasks of a bulk create"""
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], list):
+        return len(result[0])
+    return None
+
+
+class Metrics:
+    """
+    Call counts, latencies and sizes for the public methods of TaskManager,
+    SqliteTaskManager and DailyPlanner.
+
+    enable() replaces each public method on the class with a timing wrapper
+    and disable() puts the original back, so there is no cost at all while
+    metrics are off. When on, a call costs two clock reads and one append to
+    a queue; the counters take the queued calls in batches.
+
+    Per method it keeps the call and error counts, cumulative and maximum
+    latency, percentiles over the most recent window calls, the number of
+    tasks in the (in-memory) store at call time and the length of the
+    result (tasks, conflicts or plan length). Latencies are inclusive, so a
+    public method called by another is counted under both.
+    """
+
+    _active: Optional["Metrics"] = None  # the instance whose wrappers are installed
+
+    def __init__(self, window: int = 2048):
+        """
+        Initialize Metrics
+
+        Args:
+            window: Latest calls per method kept for percentiles
+
+        Raises:
+            ValueError: If window is not positive
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        self._window = window
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _MethodStats] = {}
+        self._patched: List[tuple[type, str, Callable[..., Any]]] = []
+
+    def is_enabled(self) -> bool:
+        """Check whether the timing wrappers are installed"""
+        return bool(self._patched)
+
+    def enable(self, classes: Optional[Iterable[type]] = None) -> None:
+        """
+        Install timing wrappers on every public method of the classes
+
+        Calling it again while enabled does nothing.
+
+        Args:
+            classes: Classes to instrument, defaults to DEFAULT_CLASSES
+
+        Raises:
+            RuntimeError: If another Metrics instance is enabled
+        """
+        with _PATCH_LOCK:
+            if Metrics._active is self:
+                return
+            if Metrics._active is not None:
+                raise RuntimeError("Another Metrics instance is enabled, disable it first")
+            for cls in (DEFAULT_CLASSES if classes is None else classes):
+                for name, func in list(vars(cls).items()):
+                    if name.startswith('_') or not callable(func) or isinstance(func, (staticmethod, classmethod)):
+                        continue
+                    self._patched.append((cls, name, func))
+                    setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", func))
+            Metrics._active = self
+
+    def disable(self) -> None:
+        """Restore the original methods (collected metrics are kept)"""
+        with _PATCH_LOCK:
+            for cls, name, func in reversed(self._patched):
+                setattr(cls, name, func)
+            self._patched = []
+            if Metrics._active is self:
+                Metrics._active = None
+
+    def reset(self) -> None:
+        """Clear every collected metric"""
+        with self._lock:
+            for stats in self._stats.values():
+                stats.clear()
+
+    def _wrap(self, label: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Build the timing wrapper of one method"""
+        stats = self._stats.get(label)
+        if stats is None:
+            stats = self._stats[label] = _MethodStats(self._window)
+        pending = stats.pending
+        lock = self._lock
+        clock = timer.perf_counter
+
+        @functools.wraps(func)
+        def instrumented(obj, *args, **kwargs):
+            tasks = _task_count(obj)
+            failed = True
+            start = clock()
+            try:
+                result = func(obj, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                # deque.append is atomic, so calls only take the lock to fold a full batch
+                pending.append((clock() - start, tasks, None if failed else _result_size(result), failed))
+                if len(pending) >= _FOLD_BATCH and lock.acquire(blocking=False):
+                    try:
+                        stats.fold()
+                    finally:
+                        lock.release()
+
+        return instrumented
+
+    def _folded(self) -> Dict[str, _MethodStats]:
+        """Fold pending calls into every counter (call with the lock held)"""
+        for stats in self._stats.values():
+            stats.fold()
+        return self._stats
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the collected metrics
+
+        Returns:
+            Dictionary with enabled, window and methods. methods maps
+            "Class.method" (only methods called at least once) to calls,
+            errors, total_ms, mean_ms, p50_ms, p90_ms, p99_ms, max_ms,
+            tasks_mean, tasks_max, result_mean and result_max (sizes are
+            None when not measured)
+        """
+        with self._lock:
+            methods = {}
+            for label, stats in sorted(self._folded().items()):
+                if not stats.calls:
+                    continue
+                recent = sorted(stats.recent)
+                methods[label] = {
+                    'calls': stats.calls,
+                    'errors': stats.errors,
+                    'total_ms': stats.total * 1000,
+                    'mean_ms': stats.total / stats.calls * 1000,
+                    'p50_ms': percentile(recent, 0.5) * 1000,
+                    'p90_ms': percentile(recent, 0.9) * 1000,
+                    'p99_ms': percentile(recent, 0.99) * 1000,
+                    'max_ms': stats.max * 1000,
+                    'tasks_mean': stats.tasks_sum / stats.tasks_count if stats.tasks_count else None,
+                    'tasks_max': stats.tasks_max if stats.tasks_count else None,
+                    'result_mean': stats.result_sum / stats.result_count if stats.result_count else None,
+                    'result_max': stats.result_max if stats.result_count else None,
+                }
+        return {'enabled': self.is_enabled(), 'window': self._window, 'methods': methods}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Dump get_metrics() as JSON"""
+        return json.dumps(self.get_metrics(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """
+        Format the metrics in the Prometheus text exposition format
+
+        Returns:
+            pawpal_call_duration_seconds (summary with p50/p90/p99 quantiles),
+            pawpal_call_errors_total, pawpal_call_tasks and
+            pawpal_call_result_size (sum and count), labelled by method
+        """
+        with self._lock:
+            rows = [(label, stats.calls, stats.errors, stats.total, sorted(stats.recent),
+                     stats.tasks_sum, stats.tasks_count, stats.result_sum, stats.result_count)
+                    for label, stats in sorted(self._folded().items()) if stats.calls]
+        lines = [
+            "# HELP pawpal_call_duration_seconds Latency of PawPal+ public methods",
+            "# TYPE pawpal_call_duration_seconds summary",
+        ]
+        for label, calls, _, total, recent, *_ in rows:
+            for q in QUANTILES:
+                lines.append(f'pawpal_call_duration_seconds{{method="{label}",quantile="{q}"}} '
+                             f'{percentile(recent, q):.9f}')
+            lines.append(f'pawpal_call_duration_seconds_sum{{method="{label}"}} {total:.9f}')
+            lines.append(f'pawpal_call_duration_seconds_count{{method="{label}"}} {calls}')
+        lines += [
+            "# HELP pawpal_call_errors_total Calls that raised an exception",
+            "# TYPE pawpal_call_errors_total counter",
+        ]
+        lines += [f'pawpal_call_errors_total{{method="{row[0]}"}} {row[2]}' for row in rows]
+        for metric, help_text, sum_at in (
+            ("pawpal_call_tasks", "Tasks stored when the method was called", 5),
+            ("pawpal_call_result_size", "Length of the result: tasks, conflicts or plan length", 7),
+        ):
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} summary"]
+            for row in rows:
+                if row[sum_at + 1]:
+                    lines.append(f'{metric}_sum{{method="{row[0]}"}} {row[sum_at]}')
+                    lines.append(f'{metric}_count{{method="{row[0]}"}} {row[sum_at + 1]}')
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide instance used by the app
+METRICS = Metrics()
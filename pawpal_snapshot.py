@@ -0,0 +1,449 @@
+"""
+PawPal+ Binary Snapshots
+Versioned, memory-mapped snapshot files for loading large schedules instantly
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from datetime import date, time
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+
+from pawpal_system import Task, TaskManager
+from pawpal_store import Categories
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; filters fall back to scanning the columns in Python
+    np = None
+
+MAGIC = b"PAWSNAP\0"
+FORMAT_VERSION = 2
+
+# magic, format version, section count, column byte order, row count.
+# The header is little-endian; columns are written in the writer's native
+# byte order (recorded as b"<" or b">") so they can be mapped without copying.
+_HEADER = struct.Struct("<8sHHc3xQ")
+_BYTE_ORDER = b"<" if sys.byteorder == "little" else b">"
+# section name, typecode, offset, length in bytes
+_SECTION = struct.Struct("<16s4sQQ")
+_ALIGN = 8
+
+# Fixed-width record columns: name -> array typecode
+_COLUMNS = {
+    'start': 'H',        # start minute
+    'duration': 'I',
+    'priority': 'i',
+    'completed': 'B',    # current occurrence completed (0/1)
+    'start_date': 'I',   # date ordinal
+    'due_date': 'I',     # date ordinal
+    'id': 'I',           # codes into the string tables below
+    'name': 'I',
+    'description': 'I',
+    'time': 'I',
+    'type': 'I',
+    'pet': 'I',
+    'recurrence': 'I',
+    'bits': 'I',         # completion bits as a decimal string ("" for none)
+    'done_at': 'I',      # completed time as ISO text
+}
+# String tables, each stored as an offsets section and a UTF-8 blob section
+_TABLES = ('id', 'name', 'description', 'time', 'type', 'pet', 'recurrence', 'bits', 'done_at')
+
+
+def write_snapshot(tasks: Iterable[Task], path: str) -> int:
+    """
+    Write tasks to a snapshot file.
+
+    The tasks are read once, into typed column arrays and string tables,
+    and the file is then written front to back: header, section directory,
+    every column, every string table.
+
+    Args:
+        tasks: Tasks to store, e.g. task_manager.get_all_tasks()
+        path: File to write
+
+    Returns:
+        Number of tasks written
+    """
+    columns = {name: array(typecode) for name, typecode in _COLUMNS.items()}
+    tables = {name: Categories() for name in _TABLES}
+    rows = 0
+    for task in tasks:
+        data = task.to_dict()
+        columns['start'].append(task.get_start_minute())
+        columns['duration'].append(data['duration'])
+        columns['priority'].append(data['priority'])
+        columns['completed'].append(1 if task.is_completed() else 0)
+        columns['start_date'].append(date.fromisoformat(data['start_date']).toordinal())
+        columns['due_date'].append(date.fromisoformat(data['due_date']).toordinal())
+        columns['id'].append(tables['id'].encode(data['task_id']))
+        columns['name'].append(tables['name'].encode(data['task_name']))
+        columns['description'].append(tables['description'].encode(data['description']))
+        columns['time'].append(tables['time'].encode(data['time']))
+        columns['type'].append(tables['type'].encode(data['task_type']))
+        columns['pet'].append(tables['pet'].encode(data['pet_id']))
+        columns['recurrence'].append(tables['recurrence'].encode(data['recurrence']))
+        bits = data['completion_bits']
+        columns['bits'].append(tables['bits'].encode(str(bits)) if bits else 0)
+        columns['done_at'].append(tables['done_at'].encode(data['completed_time']))
+        rows += 1
+
+    sections: List[tuple[str, str, bytes]] = [
+        (name, column.typecode, column.tobytes()) for name, column in columns.items()
+    ]
+    for name, table in tables.items():
+        offsets = array('Q', [0])
+        blob = bytearray()
+        for value in table.values()[1:]:  # code 0 is None and has no text
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+        sections.append((f"{name}.off", 'Q', offsets.tobytes()))
+        sections.append((f"{name}.txt", 'B', bytes(blob)))
+
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    directory = []
+    for name, typecode, payload in sections:
+        offset += -offset % _ALIGN
+        directory.append(_SECTION.pack(name.encode(), typecode.encode(), offset, len(payload)))
+        offset += len(payload)
+
+    with open(path, "wb") as f:
+        position = f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), _BYTE_ORDER, rows))
+        position += f.write(b"".join(directory))
+        for name, _, payload in sections:
+            position += _pad(f, position)
+            position += f.write(payload)
+    return rows
+
+
+def _pad(f: BinaryIO, position: int) -> int:
+    """Write zero bytes up to the next aligned position"""
+    return f.write(b"\0" * (-position % _ALIGN))
+
+
+class _MappedStrings:
+    """A string table read straight from the mapped file"""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        """
+        Initialize a table
+
+        Args:
+            offsets: End offset of every string, after a leading 0
+            blob: UTF-8 text of all strings back to back
+        """
+        self._offsets = offsets
+        self._blob = blob
+        self._codes: Optional[Dict[str, int]] = None
+
+    def decode(self, code: int) -> Optional[str]:
+        """Get the string for a code (0 is None)"""
+        if code == 0:
+            return None
+        return str(self._blob[self._offsets[code - 1]:self._offsets[code]], "utf-8")
+
+    def lookup(self, value: Optional[str]) -> Optional[int]:
+        """Get the code for a string, or None if the table does not hold it"""
+        if value is None:
+            return 0
+        if self._codes is None:
+            # Built on first use only; lookups go to small tables like pets and types
+            self._codes = {self.decode(code): code for code in range(1, len(self._offsets))}
+        return self._codes.get(value)
+
+
+class SnapshotTask:
+    """
+    Read-only Task-like view of one row in a Snapshot.
+
+    Views hold only the snapshot and a row number; every getter reads the
+    mapped columns. load() turns a view into a real Task when one is needed.
+    """
+
+    __slots__ = ('_snapshot', '_row')
+
+    def __init__(self, snapshot: "Snapshot", row: int):
+        """
+        Initialize a view
+
+        Args:
+            snapshot: The Snapshot holding the row
+            row: Row number in the snapshot
+        """
+        self._snapshot = snapshot
+        self._row = row
+
+    def _text(self, name: str) -> Optional[str]:
+        """Decode this row's entry of a string column"""
+        return self._snapshot._tables[name].decode(self._snapshot._columns[name][self._row])
+
+    def get_task_id(self) -> str:
+        """Get the task's unique ID"""
+        return self._text('id')
+
+    def get_task_name(self) -> str:
+        """Get the task name"""
+        return self._text('name')
+
+    def get_description(self) -> str:
+        """Get the task description"""
+        return self._text('description')
+
+    def get_time(self) -> str:
+        """Get the scheduled time"""
+        return self._text('time')
+
+    def get_time_obj(self) -> time:
+        """Get the scheduled time as a time object"""
+        return time(*divmod(self.get_start_minute(), 60))
+
+    def get_end_time_obj(self) -> time:
+        """Get the end time of the task"""
+        return time(*divmod(self.get_end_minute() % Task.DAY_MINUTES, 60))
+
+    def get_start_minute(self) -> int:
+        """Get the scheduled time in minutes since midnight"""
+        return self._snapshot._columns['start'][self._row]
+
+    def get_end_minute(self) -> int:
+        """Get the end time in minutes since midnight of the start day"""
+        return self.get_start_minute() + self.get_duration()
+
+    def crosses_midnight(self) -> bool:
+        """Check if the task runs past midnight into the next day"""
+        return self.get_end_minute() > Task.DAY_MINUTES
+
+    def get_priority(self) -> int:
+        """Get the task priority"""
+        return self._snapshot._columns['priority'][self._row]
+
+    def get_duration(self) -> int:
+        """Get the task duration in minutes"""
+        return self._snapshot._columns['duration'][self._row]
+
+    def get_task_type(self) -> str:
+        """Get the task type"""
+        return self._text('type')
+
+    def get_recurrence(self) -> Optional[str]:
+        """Get the task recurrence pattern"""
+        return self._text('recurrence')
+
+    def get_pet_id(self) -> Optional[str]:
+        """Get the pet ID associated with this task"""
+        return self._text('pet')
+
+    def get_start_date(self) -> date:
+        """Get the date of the first (or only) occurrence"""
+        return date.fromordinal(self._snapshot._columns['start_date'][self._row])
+
+    def get_due_date(self) -> date:
+        """Get the date of the current occurrence"""
+        return date.fromordinal(self._snapshot._columns['due_date'][self._row])
+
+    def is_completed(self) -> bool:
+        """Check if task is completed"""
+        return bool(self._snapshot._columns['completed'][self._row])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the row to the dictionary format of Task.to_dict"""
+        return {
+            'task_id': self.get_task_id(),
+            'task_name': self.get_task_name(),
+            'description': self.get_description(),
+            'time': self.get_time(),
+            'priority': self.get_priority(),
+            'duration': self.get_duration(),
+            'task_type': self.get_task_type(),
+            'recurrence': self.get_recurrence(),
+            'pet_id': self.get_pet_id(),
+            'start_date': self.get_start_date().isoformat(),
+            'due_date': self.get_due_date().isoformat(),
+            'completion_bits': int(self._text('bits') or 0),
+            'completed_time': self._text('done_at'),
+        }
+
+    def load(self) -> Task:
+        """Create a real Task from this row"""
+        return Task.from_dict(self.to_dict())
+
+    def __repr__(self) -> str:
+        """String representation of the view"""
+        status = "✓" if self.is_completed() else " "
+        return (f"SnapshotTask(row={self._row}, name='{self.get_task_name()}', "
+                f"time='{self.get_time()}', priority={self.get_priority()}, "
+                f"duration={self.get_duration()}min, completed=[{status}])")
+
+
+class Snapshot:
+    """
+    A snapshot file opened with mmap.
+
+    Opening only reads the header and section directory, so it costs the
+    same for ten tasks or a million. Columns are typed views over the mapped
+    pages, filters scan them (with NumPy when installed), and SnapshotTask
+    views or Task objects are only created for the rows a caller asks for.
+    Snapshots are read-only and work as a task source for DailyPlanner.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a snapshot
+
+        Args:
+            path: Snapshot file written by write_snapshot
+
+        Raises:
+            ValueError: If the file is not a snapshot, has an unsupported
+                version or was written on a host with the other byte order
+        """
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open_sections()
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def _open_sections(self) -> None:
+        """Read the header and directory and map every section"""
+        if len(self._mm) < _HEADER.size:
+            raise ValueError("Not a PawPal snapshot: file too short")
+        magic, version, section_count, byte_order, self._rows = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a PawPal snapshot: bad magic number")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version} (expected {FORMAT_VERSION})")
+        if byte_order != _BYTE_ORDER:
+            raise ValueError("Snapshot columns use the other byte order; rewrite it on this host")
+
+        buffer = memoryview(self._mm)
+        self._views: List[memoryview] = [buffer]
+        sections: Dict[str, memoryview] = {}
+        for i in range(section_count):
+            raw_name, raw_type, offset, length = _SECTION.unpack_from(self._mm, _HEADER.size + i * _SECTION.size)
+            if offset + length > len(self._mm):
+                raise ValueError("Snapshot is truncated")
+            view = buffer[offset:offset + length].cast(raw_type.rstrip(b"\0").decode())
+            self._views.append(view)
+            sections[raw_name.rstrip(b"\0").decode()] = view
+
+        self._columns = {name: sections[name] for name in _COLUMNS}
+        self._tables = {name: _MappedStrings(sections[f"{name}.off"], sections[f"{name}.txt"]) for name in _TABLES}
+        self._id_rows: Optional[Dict[str, int]] = None
+
+    def close(self) -> None:
+        """Release the column views and unmap the file"""
+        for view in reversed(getattr(self, '_views', [])):
+            view.release()
+        self._views = []
+        self._mm.close()
+
+    def __enter__(self) -> "Snapshot":
+        """Use the snapshot as a context manager that unmaps it on exit"""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the snapshot"""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of tasks in the snapshot"""
+        return self._rows
+
+    def get_version(self) -> int:
+        """Snapshots never change, so the version is always 0 (for the plan cache)"""
+        return 0
+
+    def _rows_where(self, column: str, predicate) -> List[SnapshotTask]:
+        """
+        Get views of the rows whose column value satisfies a predicate
+
+        Args:
+            column: Column name
+            predicate: Called with the column (a NumPy array when installed,
+                otherwise each value) and returning a boolean (mask)
+        """
+        values = self._columns[column]
+        if np is not None and self._rows:
+            rows = np.flatnonzero(predicate(np.frombuffer(values, dtype=values.format))).tolist()
+        else:
+            rows = [row for row, value in enumerate(values) if predicate(value)]
+        return [SnapshotTask(self, row) for row in rows]
+
+    def get_all_tasks(self) -> List[SnapshotTask]:
+        """Get views of every task in stored order"""
+        return [SnapshotTask(self, row) for row in range(self._rows)]
+
+    def get_task_by_id(self, task_id: str) -> Optional[SnapshotTask]:
+        """Get a view of a task by ID (the ID index is built on first use)"""
+        if self._id_rows is None:
+            ids = self._tables['id']
+            self._id_rows = {ids.decode(code): row for row, code in enumerate(self._columns['id'])}
+        row = self._id_rows.get(task_id)
+        return SnapshotTask(self, row) if row is not None else None
+
+    def _rows_with_text(self, column: str, value: Optional[str]) -> List[SnapshotTask]:
+        """Get views of the rows whose string column equals a value"""
+        code = self._tables[column].lookup(value)
+        if code is None:
+            return []
+        return self._rows_where(column, lambda values: values == code)
+
+    def get_tasks_by_type(self, task_type: str) -> List[SnapshotTask]:
+        """Get views of all tasks of a specific type"""
+        return self._rows_with_text('type', task_type.lower())
+
+    def get_tasks_by_pet(self, pet_id: Optional[str]) -> List[SnapshotTask]:
+        """Get views of all tasks for a pet"""
+        return self._rows_with_text('pet', pet_id)
+
+    def get_tasks_by_priority(self, min_priority: int) -> List[SnapshotTask]:
+        """Get views of all tasks with priority >= min_priority"""
+        return self._rows_where('priority', lambda values: values >= min_priority)
+
+    def get_completed_tasks(self) -> List[SnapshotTask]:
+        """Get views of all completed tasks"""
+        return self._rows_where('completed', lambda values: values == 1)
+
+    def get_pending_tasks(self) -> List[SnapshotTask]:
+        """Get views of all pending tasks"""
+        return self._rows_where('completed', lambda values: values == 0)
+
+    def get_recurring_tasks(self) -> List[SnapshotTask]:
+        """Get views of all tasks with a recurrence pattern"""
+        return self._rows_where('recurrence', lambda values: values != 0)
+
+    def get_tasks_sorted_by_time(self) -> List[SnapshotTask]:
+        """Get views of all tasks sorted by start minute (ties in stored order)"""
+        starts = self._columns['start']
+        if np is not None and self._rows:
+            order = np.argsort(np.frombuffer(starts, dtype=starts.format), kind="stable").tolist()
+        else:
+            order = sorted(range(self._rows), key=starts.__getitem__)
+        return [SnapshotTask(self, row) for row in order]
+
+    def get_total_duration(self, include_completed: bool = True) -> int:
+        """Total duration in minutes, read straight from the duration column"""
+        durations = self._columns['duration']
+        if include_completed:
+            return sum(durations)
+        completed = self._columns['completed']
+        return sum(d for d, done in zip(durations, completed) if not done)
+
+    def load_task_manager(self) -> TaskManager:
+        """
+        Create a TaskManager holding real Task objects for every row
+
+        Returns:
+            A new TaskManager with the tasks in stored order
+        """
+        task_manager = TaskManager()
+        task_manager.add_tasks([view.load() for view in self.get_all_tasks()])
+        return task_manager
+
+    def nbytes(self) -> int:
+        """Size of the mapped file in bytes"""
+        return len(self._mm)
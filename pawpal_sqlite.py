@@ -0,0 +1,658 @@
+"""
+PawPal+ SQLite Task Manager
+Persistent TaskManager backed by the standard-library sqlite3 module
+"""
+
+import heapq
+import sqlite3
+import weakref
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set
+
+from pawpal_archive import TaskArchive
+from pawpal_system import Task, TaskManager, TaskOccurrence
+
+
+class SqliteTaskManager:
+    """
+    TaskManager with the same public API, storing tasks in SQLite.
+
+    The database runs in WAL mode so several processes can share one file,
+    and every query is answered from an index: pet, type, completion,
+    start minute, end minute, priority and name/time.
+
+    By default every write is committed at once, so other connections see
+    it immediately and never find the database locked for long. With a
+    batch_size above 1, writes are committed in batches (and on
+    commit/close), which makes long runs of edits cheaper. The cost is that
+    the open write transaction holds SQLite's write lock. Other processes
+    then get "database is locked" on their writes and do not see the batch
+    until it is committed. Only batch in a process that has the file to
+    itself, or call commit() before handing control elsewhere.
+
+    Task objects handed out are kept in an identity map while referenced,
+    and changes made directly on them are written back to their row. When
+    another connection commits to the same file, the objects still held are
+    reloaded from their rows and the version moves on.
+    """
+
+    _COLUMNS = (
+        'task_id', 'task_name', 'description', 'time', 'priority', 'duration', 'task_type',
+        'recurrence', 'pet_id', 'start_minute', 'end_minute', 'start_date', 'due_date',
+        'completion_bits', 'completed', 'completed_time'
+    )
+    _SELECT = f"SELECT {', '.join(_COLUMNS)} FROM tasks"
+    _INSERT = f"INSERT INTO tasks ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+    _UPDATE = f"UPDATE tasks SET {', '.join(c + ' = ?' for c in _COLUMNS[1:])} WHERE task_id = ?"
+
+    _SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS tasks (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id TEXT NOT NULL UNIQUE,
+            task_name TEXT NOT NULL,
+            description TEXT NOT NULL,
+            time TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            duration INTEGER NOT NULL,
+            task_type TEXT NOT NULL,
+            recurrence TEXT,
+            pet_id TEXT,
+            start_minute INTEGER NOT NULL,
+            end_minute INTEGER NOT NULL,
+            start_date TEXT NOT NULL,
+            due_date TEXT NOT NULL,
+            completion_bits TEXT NOT NULL,
+            completed INTEGER NOT NULL,
+            completed_time TEXT
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_pet ON tasks (pet_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_type ON tasks (task_type)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_start ON tasks (start_minute)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_end ON tasks (end_minute)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_duration ON tasks (duration)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_name_time ON tasks (task_name, time)",
+    )
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 1):
+        """
+        Open (or create) a task database
+
+        Args:
+            path: SQLite database file, or ":memory:" for a private in-memory database
+            batch_size: Number of writes to collect before committing
+                (1 commits every write; see the class docstring for the trade-off)
+        """
+        # Streamlit reruns scripts on different threads, so the connection may move between them
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in self._SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+        self._batch_size = max(1, batch_size)
+        self._pending_writes = 0
+        self._identity: "weakref.WeakValueDictionary[str, Task]" = weakref.WeakValueDictionary()
+        self._version = 0  # bumped on every local mutation and every commit seen from other connections
+        (self._data_version,) = self._conn.execute("PRAGMA data_version").fetchone()
+        self._subscribers: List[Callable[[str, Task], None]] = []
+        self._archive: Optional[TaskArchive] = None
+        self._archive_after_days = 30
+        self._compact_threshold = 0
+        self._compact_floor = 0
+
+    def commit(self) -> None:
+        """Commit any writes still waiting for their batch"""
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the database"""
+        self.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "SqliteTaskManager":
+        """Use the manager as a context manager that closes the database on exit"""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Commit and close the database"""
+        self.close()
+
+    def _wrote(self, count: int = 1) -> None:
+        """Record writes and commit once a batch is full"""
+        self._version += 1
+        self._pending_writes += count
+        if self._pending_writes >= self._batch_size:
+            self.commit()
+
+    @staticmethod
+    def _row_values(task: Task) -> tuple:
+        """Convert a task to a row in _COLUMNS order"""
+        data = task.to_dict()
+        return (
+            data['task_id'], data['task_name'], data['description'], data['time'], data['priority'],
+            data['duration'], data['task_type'], data['recurrence'], data['pet_id'],
+            task.get_start_minute(), task.get_end_minute(), data['start_date'], data['due_date'],
+            str(data['completion_bits']), int(task.is_completed()), data['completed_time']
+        )
+
+    def _task_from_row(self, row: tuple) -> Task:
+        """Get the Task for a row, reusing the object already handed out if there is one"""
+        task = self._identity.get(row[0])
+        if task is None:
+            task = Task.from_dict(dict(zip(self._COLUMNS, row)))
+            task._listener = self._on_task_changed
+            self._identity[row[0]] = task
+        return task
+
+    def _fetch(self, where: str = "", params: Iterable[Any] = (), order: str = "seq") -> List[Task]:
+        """Run a SELECT over the tasks table and return Task objects"""
+        self._sync()
+        sql = f"{self._SELECT} {where} ORDER BY {order}"
+        return [self._task_from_row(row) for row in self._conn.execute(sql, tuple(params))]
+
+    def _fetch_by_seq(self, seqs: Set[int]) -> Dict[int, Task]:
+        """Load the tasks with the given row numbers, in chunks of IN lists"""
+        self._sync()
+        found: Dict[int, Task] = {}
+        seqs = sorted(seqs)
+        for i in range(0, len(seqs), 500):
+            chunk = seqs[i:i + 500]
+            sql = f"SELECT seq, {', '.join(self._COLUMNS)} FROM tasks WHERE seq IN ({', '.join('?' * len(chunk))})"
+            for seq, *row in self._conn.execute(sql, chunk):
+                found[seq] = self._task_from_row(tuple(row))
+        return found
+
+    def subscribe(self, callback: Callable[[str, Task], None]) -> None:
+        """
+        Register a callback for task mutations
+
+        Args:
+            callback: Called as callback(event, task) with event "created",
+                "deleted" or "changed"
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, Task], None]) -> None:
+        """Remove a callback registered with subscribe"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _publish(self, event: str, task: Task) -> None:
+        """Tell every subscriber about a task mutation"""
+        for callback in list(self._subscribers):
+            callback(event, task)
+
+    def get_version(self) -> int:
+        """
+        Get a counter that changes whenever a task is created, edited,
+        deleted or completed, through this manager or through any other
+        connection to the same database (PRAGMA data_version)
+
+        Returns:
+            Monotonic mutation counter
+        """
+        self._sync()
+        return self._version
+
+    def _sync(self) -> None:
+        """Pick up commits made by other connections since the last check"""
+        (data_version,) = self._conn.execute("PRAGMA data_version").fetchone()
+        if data_version == self._data_version:
+            return
+        self._data_version = data_version
+        self._version += 1
+        # Reload the task objects still held so they match their rows again
+        held = {task_id: task for task_id, task in self._identity.items()}
+        found = set()
+        ids = list(held)
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            sql = f"{self._SELECT} WHERE task_id IN ({', '.join('?' * len(chunk))})"
+            for row in self._conn.execute(sql, chunk):
+                task = held[row[0]]
+                fresh = Task.from_dict(dict(zip(self._COLUMNS, row)))
+                fresh._listener = task._listener
+                task.__dict__.update(fresh.__dict__)
+                found.add(row[0])
+        for task_id in held.keys() - found:
+            # Deleted by another connection
+            self._identity.pop(task_id, None)
+            held[task_id]._listener = None
+
+    def _on_task_changed(self, task: Task, field: str) -> None:
+        """Write a modified task back to its row"""
+        values = self._row_values(task)
+        self._conn.execute(self._UPDATE, values[1:] + values[:1])
+        self._wrote()
+        self._publish("changed", task)
+
+    def has_duplicate_task(self, task_name: str, time: str) -> bool:
+        """
+        Check if a task with the same name and time already exists
+
+        Args:
+            task_name: Name of the task to check
+            time: Scheduled time to check
+
+        Returns:
+            True if duplicate exists, False otherwise
+        """
+        row = self._conn.execute("SELECT 1 FROM tasks WHERE task_name = ? AND time = ? LIMIT 1",
+                                 (task_name, time)).fetchone()
+        return row is not None
+
+    def create_task(
+        self,
+        task_name: str,
+        description: str,
+        time: str,
+        priority: int,
+        duration: int,
+        task_type: str,
+        recurrence: Optional[str] = None,
+        pet_id: Optional[str] = None,
+        allow_duplicates: bool = False,
+        warn_conflicts: bool = False,
+        start_date: Optional[date] = None
+    ) -> Task:
+        """
+        Create a new task and store it
+
+        Args:
+            task_name: Name of the task
+            description: Detailed description
+            time: Scheduled time
+            priority: Priority level
+            duration: Duration in minutes
+            task_type: Type of task
+            recurrence: Recurrence pattern (None, "daily", "weekly", etc.)
+            pet_id: Optional pet ID to associate with this task
+            allow_duplicates: If False, prevents creating duplicate tasks
+            warn_conflicts: If True, prints warning messages for scheduling conflicts
+            start_date: Date of the first (or only) occurrence, defaults to today
+
+        Returns:
+            The created Task object
+
+        Raises:
+            ValueError: If duplicate task exists and allow_duplicates is False
+        """
+        task = Task(task_name, description, time, priority, duration, task_type, recurrence, pet_id, start_date)
+        # Compare the normalized name and time, as stored
+        if not allow_duplicates and self.has_duplicate_task(task.get_task_name(), task.get_time()):
+            raise ValueError(
+                f"Task '{task.get_task_name()}' at {task.get_time()} already exists. "
+                "Set allow_duplicates=True to override."
+            )
+
+        self._conn.execute(self._INSERT, self._row_values(task))
+        task._listener = self._on_task_changed
+        self._identity[task.get_task_id()] = task
+        self._wrote()
+        self._publish("created", task)
+
+        if warn_conflicts:
+            conflicts = self.check_task_conflicts(task)
+            if conflicts:
+                print(f"⚠️  WARNING: '{task_name}' at {time} has {len(conflicts)} conflict(s):")
+                for conflicting_task, reason in conflicts:
+                    print(f"   - Conflicts with '{conflicting_task.get_task_name()}' "
+                          f"at {conflicting_task.get_time()}: {reason}")
+
+        return task
+
+    def create_tasks_bulk(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        allow_duplicates: bool = False
+    ) -> tuple[List[Task], List[tuple[int, str]]]:
+        """
+        Create many tasks with one executemany and one commit
+
+        Args:
+            rows: Iterable of dicts with create_task arguments
+            allow_duplicates: If False, rows matching an existing task or an
+                earlier row by name and time are rejected
+
+        Returns:
+            Tuple (created_tasks, errors) where errors is a list of
+            (row_number, message) for every rejected row
+        """
+        created: List[Task] = []
+        errors: List[tuple[int, str]] = []
+        batch_keys: Set[tuple[str, str]] = set()
+
+        for row_number, row in enumerate(rows):
+            try:
+                if not isinstance(row, Mapping):
+                    raise ValueError("Row must be a mapping of task fields")
+                task = Task(**row)
+                key = (task.get_task_name(), task.get_time())
+                if not allow_duplicates and (key in batch_keys or self.has_duplicate_task(*key)):
+                    raise ValueError(f"Task '{key[0]}' at {key[1]} already exists")
+            except (TypeError, ValueError, AttributeError) as e:
+                errors.append((row_number, str(e)))
+                continue
+            batch_keys.add(key)
+            created.append(task)
+
+        self.add_tasks(created)
+        return created, errors
+
+    def add_tasks(self, tasks: List[Task]) -> None:
+        """
+        Store already built tasks (e.g. restored from a file) with one
+        executemany and one commit, keeping their IDs and completion state
+
+        Args:
+            tasks: Tasks to store
+
+        Raises:
+            ValueError: If a task ID is already stored or repeated in the batch
+        """
+        if not tasks:
+            return
+        # Commit earlier writes first so a rejected batch rolls back only itself
+        self.commit()
+        try:
+            self._conn.executemany(self._INSERT, (self._row_values(task) for task in tasks))
+        except sqlite3.IntegrityError:
+            self._conn.rollback()
+            raise ValueError("Task IDs must be unique")
+        for task in tasks:
+            task._listener = self._on_task_changed
+            self._identity[task.get_task_id()] = task
+        self._version += 1
+        self.commit()
+        for task in tasks:
+            self._publish("created", task)
+
+    def edit_task(self, task_id: str, **kwargs) -> Optional[Task]:
+        """
+        Edit an existing task
+
+        Args:
+            task_id: ID of the task to edit
+            **kwargs: Task attributes to update (time, priority, duration, etc.)
+
+        Returns:
+            The edited Task object, or None if task not found
+        """
+        task = self.get_task_by_id(task_id)
+        if task:
+            if 'time' in kwargs:
+                task.set_time(kwargs['time'])
+            if 'priority' in kwargs:
+                task.set_priority(kwargs['priority'])
+            if 'duration' in kwargs:
+                task.set_duration(kwargs['duration'])
+        return task
+
+    def delete_task(self, task_id: str) -> bool:
+        """
+        Delete a task from the database
+
+        Args:
+            task_id: ID of the task to delete
+
+        Returns:
+            True if task was deleted, False if not found
+        """
+        task = self.get_task_by_id(task_id)
+        if task is None:
+            return False
+        self._conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+        self._identity.pop(task_id, None)
+        task._listener = None
+        self._wrote()
+        self._publish("deleted", task)
+        return True
+
+    def get_all_tasks(self) -> List[Task]:
+        """Get all tasks as a list"""
+        return self._fetch()
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """Generate all tasks in insertion order, reading rows from the cursor as they are needed"""
+        self._sync()
+        for row in self._conn.execute(f"{self._SELECT} ORDER BY seq"):
+            yield self._task_from_row(row)
+
+    def get_task_by_id(self, task_id: str) -> Optional[Task]:
+        """
+        Get a specific task by ID
+
+        Args:
+            task_id: ID of the task to find
+
+        Returns:
+            The Task object if found, None otherwise
+        """
+        tasks = self._fetch("WHERE task_id = ?", (task_id,))
+        return tasks[0] if tasks else None
+
+    def get_insertion_rank(self, task_id: str) -> Optional[int]:
+        """
+        Get a task's position in insertion order (its row's seq, which
+        AUTOINCREMENT never reuses)
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            The insertion rank, or None if the task is not stored
+        """
+        row = self._conn.execute("SELECT seq FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return row[0] if row else None
+
+    def get_tasks_by_type(self, task_type: str) -> List[Task]:
+        """Get all tasks of a specific type"""
+        return self._fetch("WHERE task_type = ?", (task_type.lower(),))
+
+    def get_tasks_by_priority(self, min_priority: int) -> List[Task]:
+        """Get all tasks with priority >= min_priority"""
+        return self._fetch("WHERE priority >= ?", (min_priority,))
+
+    def get_completed_tasks(self) -> List[Task]:
+        """Get all completed tasks"""
+        return self._fetch("WHERE completed = 1")
+
+    def get_pending_tasks(self) -> List[Task]:
+        """Get all pending (not completed) tasks"""
+        return self._fetch("WHERE completed = 0")
+
+    def get_recurring_tasks(self) -> List[Task]:
+        """Get all recurring tasks"""
+        return self._fetch("WHERE recurrence IS NOT NULL")
+
+    def get_tasks_by_pet(self, pet_id: str) -> List[Task]:
+        """Get all tasks associated with a specific pet"""
+        if pet_id is None:
+            return self._fetch("WHERE pet_id IS NULL")
+        return self._fetch("WHERE pet_id = ?", (pet_id,))
+
+    def get_tasks_sorted_by_time(self) -> List[Task]:
+        """Get all tasks sorted by scheduled time (ties in insertion order)"""
+        return self._fetch(order="start_minute, seq")
+
+    def _overlapping_seqs(self, task: Task) -> Set[int]:
+        """Find the rows whose tasks overlap a task on the daily clock, with range queries"""
+        (max_duration,) = self._conn.execute("SELECT COALESCE(MAX(duration), 0) FROM tasks").fetchone()
+        seqs: Set[int] = set()
+        for start, end in TaskManager._intervals(task):
+            # Rows starting in [start - max_duration, end) that are still running at start
+            seqs.update(seq for (seq,) in self._conn.execute(
+                "SELECT seq FROM tasks WHERE start_minute > ? AND start_minute < ? AND end_minute > ?",
+                (start - max_duration, end, start)))
+            # Rows from the evening before whose run past midnight reaches into [start, end)
+            seqs.update(seq for (seq,) in self._conn.execute(
+                "SELECT seq FROM tasks WHERE end_minute > ?", (start + Task.DAY_MINUTES,)))
+        return seqs
+
+    def check_task_conflicts(self, task: Task) -> List[tuple[Task, str]]:
+        """
+        Check if a task conflicts with any stored task (time overlap)
+
+        Args:
+            task: The task to check for conflicts
+
+        Returns:
+            List of tuples (conflicting_task, reason) describing each conflict
+        """
+        found = self._fetch_by_seq(self._overlapping_seqs(task))
+        return [
+            (other, TaskManager._overlap_reason(task, other))
+            for _, other in sorted(found.items())
+            if other.get_task_id() != task.get_task_id()
+        ]
+
+    def get_all_conflicts(self) -> List[tuple[Task, Task, str]]:
+        """
+        Find all scheduling conflicts with one self-join over the start index
+
+        Returns:
+            List of tuples (task1, task2, reason) for each conflict pair
+        """
+        pairs = self._conn.execute(
+            """SELECT MIN(a.seq, b.seq), MAX(a.seq, b.seq) FROM tasks a JOIN tasks b
+                   ON b.start_minute >= a.start_minute AND b.start_minute < a.end_minute
+                   AND (b.start_minute > a.start_minute OR b.seq > a.seq)
+               UNION
+               SELECT MIN(a.seq, b.seq), MAX(a.seq, b.seq) FROM tasks a JOIN tasks b
+                   ON a.end_minute > ? AND b.start_minute < a.end_minute - ? AND b.seq != a.seq
+               ORDER BY 1, 2""",
+            (Task.DAY_MINUTES, Task.DAY_MINUTES)
+        ).fetchall()
+        found = self._fetch_by_seq({seq for pair in pairs for seq in pair})
+        return [
+            (found[seq1], found[seq2], TaskManager._conflict_reason(found[seq1], found[seq2]))
+            for seq1, seq2 in pairs
+        ]
+
+    def mark_task_completed(self, task_id: str) -> Optional[Task]:
+        """
+        Mark a task as completed. A recurring task records the completion for
+        its current occurrence and stays completed until roll_over_recurring
+        reaches its next one.
+
+        Args:
+            task_id: ID of the task to mark as completed
+
+        Returns:
+            The task if recurring, None otherwise
+        """
+        task = self.get_task_by_id(task_id)
+        if not task:
+            return None
+        task.mark_completed()
+        self.run_auto_compaction()
+        return task if task.is_recurring() else None
+
+    def roll_over_recurring(self, on_date: Optional[date] = None) -> int:
+        """
+        Move completed recurring tasks on to their latest occurrence on or
+        before a date (defaults to today)
+
+        Returns:
+            Number of tasks moved
+        """
+        on_date = on_date or date.today()
+        return sum(task.roll_over(on_date) for task in self._fetch("WHERE completed = 1 AND recurrence IS NOT NULL"))
+
+    def iter_occurrences(self, start: date, end: Optional[date] = None) -> Iterable[TaskOccurrence]:
+        """
+        Generate every task occurrence between two dates, inclusive
+
+        Returns:
+            Iterator of occurrences ordered by date, then task insertion order
+        """
+        end = start if end is None else end
+        streams = [task.occurrences(start, end) for task in self.get_all_tasks()]
+        return heapq.merge(*streams, key=TaskOccurrence.get_date)
+
+    def get_occurrences_on(self, on_date: date) -> List[TaskOccurrence]:
+        """Get the occurrences of all tasks on one date"""
+        return [TaskOccurrence(task, on_date) for task in self.iter_tasks() if task.occurs_on(on_date)]
+
+    def compact(self, archive: TaskArchive, older_than_days: int = 30, now: Optional[datetime] = None) -> int:
+        """
+        Move completed one-off tasks older than a number of days into an
+        archive, like TaskManager.compact
+
+        Returns:
+            Number of tasks archived
+
+        Raises:
+            ValueError: If older_than_days is negative
+        """
+        if older_than_days < 0:
+            raise ValueError("older_than_days cannot be negative")
+        cutoff = (now or datetime.now()) - timedelta(days=older_than_days)
+        stale = []
+        for task in self._fetch("WHERE completed = 1"):
+            if task.is_recurring():
+                continue
+            finished = task.get_completed_time() or datetime.combine(task.get_start_date(), task.get_time_obj())
+            if finished <= cutoff:
+                stale.append(task)
+
+        if stale:
+            archive.append(stale)
+            self._conn.executemany("DELETE FROM tasks WHERE task_id = ?",
+                                   [(task.get_task_id(),) for task in stale])
+            for task in stale:
+                self._identity.pop(task.get_task_id(), None)
+                task._listener = None
+            self._version += 1
+            self.commit()
+            for task in stale:
+                self._publish("deleted", task)
+        (self._compact_floor,) = self._conn.execute("SELECT COUNT(*) FROM tasks WHERE completed = 1").fetchone()
+        return len(stale)
+
+    def set_auto_compaction(
+        self,
+        archive: Optional[TaskArchive],
+        older_than_days: int = 30,
+        threshold: int = 1000
+    ) -> None:
+        """
+        Compact automatically once enough completed tasks have built up,
+        like TaskManager.set_auto_compaction
+        """
+        self._archive = archive
+        self._archive_after_days = older_than_days
+        self._compact_threshold = threshold
+        self._compact_floor = 0
+
+    def run_auto_compaction(self) -> int:
+        """
+        Compact if automatic compaction is due, like
+        TaskManager.run_auto_compaction
+
+        Returns:
+            Number of tasks archived
+        """
+        if self._archive is None:
+            return 0
+        (completed,) = self._conn.execute("SELECT COUNT(*) FROM tasks WHERE completed = 1").fetchone()
+        if completed < self._compact_floor + self._compact_threshold:
+            return 0
+        return self.compact(self._archive, self._archive_after_days)
+
+    def get_total_duration(self, include_completed: bool = True) -> int:
+        """
+        Calculate total duration of all tasks
+
+        Args:
+            include_completed: If True, includes completed tasks in calculation
+
+        Returns:
+            Total duration in minutes
+        """
+        where = "" if include_completed else " WHERE completed = 0"
+        (total,) = self._conn.execute(f"SELECT COALESCE(SUM(duration), 0) FROM tasks{where}").fetchone()
+        return total
@@ -0,0 +1,604 @@
+"""
+PawPal+ Columnar Task Store
+Array-backed task storage for very large task sets
+"""
+
+import sys
+from array import array
+from datetime import date, time, timedelta
+from typing import List, Dict, Optional, Iterator
+
+from pawpal_system import Task, TaskManager
+
+
+class Categories:
+    """
+    Maps repeated strings to small integer codes.
+
+    Used for TaskStore's string columns and for the string tables of
+    pawpal_snapshot files.
+    """
+
+    def __init__(self):
+        """Initialize with code 0 reserved for None"""
+        self._values: List[Optional[str]] = [None]
+        self._codes: Dict[Optional[str], int] = {None: 0}
+
+    def encode(self, value: Optional[str]) -> int:
+        """Get the code for a value, adding it if it is new"""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._values.append(value)
+            self._codes[value] = code
+        return code
+
+    def lookup(self, value: Optional[str]) -> Optional[int]:
+        """Get the code for a value without adding it"""
+        return self._codes.get(value)
+
+    def decode(self, code: int) -> Optional[str]:
+        """Get the value for a code"""
+        return self._values[code]
+
+    def values(self) -> List[Optional[str]]:
+        """Get every value in code order, starting with None for code 0"""
+        return list(self._values)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the table"""
+        return (sys.getsizeof(self._values) + sys.getsizeof(self._codes)
+                + sum(sys.getsizeof(value) for value in self._values))
+
+
+class TaskView:
+    """
+    Lightweight Task-like view of one row in a TaskStore.
+
+    Views hold only the store and a row number; every getter reads the
+    columns, and setters write back to them.
+    """
+
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store: "TaskStore", row: int):
+        """
+        Initialize a view
+
+        Args:
+            store: The TaskStore holding the row
+            row: Row number in the store
+        """
+        self._store = store
+        self._row = row
+
+    def get_task_id(self) -> str:
+        """Get the task's unique ID (its row number)"""
+        return str(self._row)
+
+    def get_task_name(self) -> str:
+        """Get the task name"""
+        return self._store._names.decode(self._store._name_code[self._row])
+
+    def get_description(self) -> str:
+        """Get the task description"""
+        return self._store._descriptions.decode(self._store._description_code[self._row])
+
+    def get_time(self) -> str:
+        """Get the scheduled time (HH:MM)"""
+        start = self._store._start[self._row]
+        return f"{start // 60:02d}:{start % 60:02d}"
+
+    def get_time_obj(self) -> time:
+        """Get the scheduled time as a time object"""
+        start = self._store._start[self._row]
+        return time(start // 60, start % 60)
+
+    def get_end_time_obj(self) -> time:
+        """Get the end time of the task"""
+        return time(*divmod(self.get_end_minute() % Task.DAY_MINUTES, 60))
+
+    def get_start_minute(self) -> int:
+        """Get the scheduled time in minutes since midnight"""
+        return self._store._start[self._row]
+
+    def get_end_minute(self) -> int:
+        """Get the end time in minutes since midnight of the start day"""
+        return self._store._start[self._row] + self._store._duration[self._row]
+
+    def crosses_midnight(self) -> bool:
+        """Check if the task runs past midnight into the next day"""
+        return self.get_end_minute() > Task.DAY_MINUTES
+
+    def get_priority(self) -> int:
+        """Get the task priority"""
+        return self._store._priority[self._row]
+
+    def get_duration(self) -> int:
+        """Get the task duration in minutes"""
+        return self._store._duration[self._row]
+
+    def get_task_type(self) -> str:
+        """Get the task type"""
+        return self._store._types.decode(self._store._type_code[self._row])
+
+    def get_recurrence(self) -> Optional[str]:
+        """Get the task recurrence pattern"""
+        return self._store._recurrences.decode(self._store._recurrence_code[self._row])
+
+    def get_pet_id(self) -> Optional[str]:
+        """Get the pet ID associated with this task"""
+        return self._store._pets.decode(self._store._pet_code[self._row])
+
+    def get_start_date(self) -> date:
+        """Get the date of the first (or only) occurrence"""
+        return date.fromordinal(self._store._start_date[self._row])
+
+    def get_due_date(self) -> date:
+        """Get the date of the current occurrence, the one is_completed reports on"""
+        return date.fromordinal(self._store._due_date[self._row])
+
+    def is_recurring(self) -> bool:
+        """Check if the task repeats (daily or weekly)"""
+        return self.get_recurrence() in Task.RECURRENCE_DAYS
+
+    def is_completed(self) -> bool:
+        """Check if task (its current occurrence, for a series) is completed"""
+        return self._store._get_bit(self._store._completed, self._row)
+
+    def is_completed_on(self, on_date: date) -> bool:
+        """Check if the occurrence on a date is completed"""
+        index = self._store._occurrence_index(self._row, on_date.toordinal())
+        return index is not None and bool(self._store._completion_bits.get(self._row, 0) >> index & 1)
+
+    def mark_completed(self) -> None:
+        """Mark task as completed"""
+        self._store._set_completed(self._row, self._store._due_date[self._row], True)
+
+    def mark_incomplete(self) -> None:
+        """Mark task as not completed"""
+        self._store._set_completed(self._row, self._store._due_date[self._row], False)
+
+    def set_time(self, time: str) -> None:
+        """Set the scheduled time"""
+        start = Task._parse_minutes(time)
+        self._store._count_name_time(self._row, -1)
+        self._store._start[self._row] = start
+        self._store._count_name_time(self._row, 1)
+        self._store._version += 1
+
+    def set_priority(self, priority: int) -> None:
+        """Set the task priority
+
+        Raises:
+            ValueError: If priority is negative
+        """
+        if priority < 0:
+            raise ValueError("Task priority cannot be negative")
+        self._store._priority[self._row] = priority
+        self._store._version += 1
+
+    def set_duration(self, duration: int) -> None:
+        """Set the task duration
+
+        Raises:
+            ValueError: If duration is not positive
+        """
+        if duration <= 0:
+            raise ValueError("Task duration must be positive")
+        self._store._duration[self._row] = duration
+        self._store._version += 1
+
+    def set_pet_id(self, pet_id: Optional[str]) -> None:
+        """Set the pet ID for this task"""
+        self._store._pet_code[self._row] = self._store._pets.encode(pet_id)
+        self._store._version += 1
+
+    def __eq__(self, other: object) -> bool:
+        """Views are equal when they point at the same row of the same store"""
+        return isinstance(other, TaskView) and other._store is self._store and other._row == self._row
+
+    def __hash__(self) -> int:
+        """Hash by store identity and row"""
+        return hash((id(self._store), self._row))
+
+    def __repr__(self) -> str:
+        """String representation of the view"""
+        status = "✓" if self.is_completed() else " "
+        return (f"TaskView(row={self._row}, name='{self.get_task_name()}', "
+                f"time='{self.get_time()}', priority={self.get_priority()}, "
+                f"duration={self.get_duration()}min, completed=[{status}])")
+
+
+class TaskStore:
+    """
+    Columnar alternative to TaskManager for very large task sets.
+
+    Each task is one row spread over typed arrays: start minute, duration,
+    priority, start and due dates, bitmaps for completion and deletion, and
+    integer codes into shared string tables for name, description, type,
+    recurrence and pet. Task-like views are only created when a caller asks
+    for tasks, so a stored task costs a few dozen bytes instead of a full
+    Task object.
+
+    Recurring tasks follow TaskManager's model: one row per series, whose
+    due date is the current occurrence. Completions are kept as per-row
+    occurrence bits, only for rows that have any, and the completion bitmap
+    mirrors the current occurrence for fast filters. Like TaskManager, the
+    store counts (name, start minute) pairs for O(1) duplicate checks and
+    bumps a version on every mutation.
+    """
+
+    def __init__(self):
+        """Initialize an empty store"""
+        self._start = array('H')        # minutes since midnight
+        self._duration = array('I')     # minutes
+        self._priority = array('i')
+        self._name_code = array('I')
+        self._description_code = array('I')
+        self._type_code = array('H')
+        self._pet_code = array('I')
+        self._recurrence_code = array('B')
+        self._start_date = array('I')   # date ordinal of the first occurrence
+        self._due_date = array('I')     # date ordinal of the current occurrence
+        self._completion_bits: Dict[int, int] = {}  # row -> bit k set = occurrence k completed
+        self._name_time_counts: Dict[tuple[int, int], int] = {}  # (name code, start) -> live rows
+        self._completed = bytearray()   # 1 bit per row, for the current occurrence
+        self._deleted = bytearray()     # 1 bit per row
+        self._names = Categories()
+        self._descriptions = Categories()
+        self._types = Categories()
+        self._pets = Categories()
+        self._recurrences = Categories()
+        self._live_count = 0
+        self._version = 0
+
+    def get_version(self) -> int:
+        """
+        Get the mutation version of the store.
+        It increases whenever a row is added, deleted or changed, so equal
+        versions mean nothing changed in between.
+
+        Returns:
+            Monotonic mutation counter
+        """
+        return self._version
+
+    @staticmethod
+    def _get_bit(bitmap: bytearray, row: int) -> bool:
+        """Read one bit from a bitmap"""
+        return bool(bitmap[row >> 3] & (1 << (row & 7)))
+
+    @staticmethod
+    def _set_bit(bitmap: bytearray, row: int, value: bool) -> None:
+        """Write one bit of a bitmap"""
+        if value:
+            bitmap[row >> 3] |= 1 << (row & 7)
+        else:
+            bitmap[row >> 3] &= ~(1 << (row & 7)) & 0xFF
+
+    def _count_name_time(self, row: int, delta: int) -> None:
+        """Add delta to the duplicate count of a row's (name, start) pair"""
+        key = (self._name_code[row], self._start[row])
+        count = self._name_time_counts.get(key, 0) + delta
+        if count:
+            self._name_time_counts[key] = count
+        else:
+            del self._name_time_counts[key]
+
+    def _occurrence_index(self, row: int, ordinal: int) -> Optional[int]:
+        """Get the number of a row's occurrence on a date ordinal, or None, like Task._occurrence_index"""
+        offset = ordinal - self._start_date[row]
+        step = Task.RECURRENCE_DAYS.get(self._recurrences.decode(self._recurrence_code[row]))
+        if offset < 0 or (step is None and offset > 0) or (step is not None and offset % step):
+            return None
+        return offset // step if step else 0
+
+    def _set_completed(self, row: int, ordinal: int, completed: bool) -> None:
+        """Record the completion of a row's occurrence and refresh the current-occurrence bit"""
+        index = self._occurrence_index(row, ordinal)
+        if index is None:
+            raise ValueError(f"Task '{TaskView(self, row).get_task_name()}' does not occur on "
+                             f"{date.fromordinal(ordinal).isoformat()}")
+        bits = self._completion_bits.get(row, 0)
+        bits = bits | 1 << index if completed else bits & ~(1 << index)
+        if bits:
+            self._completion_bits[row] = bits
+        else:
+            self._completion_bits.pop(row, None)
+        if ordinal == self._due_date[row]:
+            self._set_bit(self._completed, row, completed)
+        self._version += 1
+
+    def _row_for(self, task_id: str) -> Optional[int]:
+        """Convert a task ID to a live row number"""
+        try:
+            row = int(task_id)
+        except (TypeError, ValueError):
+            return None
+        if 0 <= row < len(self._start) and not self._get_bit(self._deleted, row):
+            return row
+        return None
+
+    def _live_rows(self) -> Iterator[int]:
+        """Iterate live row numbers in insertion order"""
+        deleted = self._deleted
+        for row in range(len(self._start)):
+            if not deleted[row >> 3] & (1 << (row & 7)):
+                yield row
+
+    def __len__(self) -> int:
+        """Number of live tasks"""
+        return self._live_count
+
+    def has_duplicate_task(self, task_name: str, time: str) -> bool:
+        """
+        Check if a live task with the same name and time exists (O(1) lookup)
+
+        Args:
+            task_name: Name of the task to check
+            time: Scheduled time to check
+
+        Returns:
+            True if duplicate exists, False otherwise
+        """
+        name_code = self._names.lookup(task_name)
+        if name_code is None:
+            return False
+        try:
+            start = Task._parse_minutes(time)
+        except ValueError:
+            return False
+        return (name_code, start) in self._name_time_counts
+
+    def create_task(
+        self,
+        task_name: str,
+        description: str,
+        time: str,
+        priority: int,
+        duration: int,
+        task_type: str,
+        recurrence: Optional[str] = None,
+        pet_id: Optional[str] = None,
+        start_date: Optional[date] = None
+    ) -> TaskView:
+        """
+        Validate a task and append it as a new row
+
+        Args:
+            task_name: Name of the task
+            description: Detailed description
+            time: Scheduled time (HH:MM)
+            priority: Priority level
+            duration: Duration in minutes
+            task_type: Type of task
+            recurrence: Recurrence pattern (None, "daily", "weekly", etc.)
+            pet_id: Optional pet ID to associate with this task
+            start_date: Date of the first (or only) occurrence, defaults to today
+
+        Returns:
+            A view of the new row
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        Task._validate(task_name, description, priority, duration, task_type)
+        start = Task._parse_minutes(time)
+
+        row = len(self._start)
+        self._start.append(start)
+        self._duration.append(duration)
+        self._priority.append(priority)
+        self._name_code.append(self._names.encode(task_name.strip()))
+        self._description_code.append(self._descriptions.encode(description.strip()))
+        self._type_code.append(self._types.encode(task_type.strip().lower()))
+        self._pet_code.append(self._pets.encode(pet_id))
+        self._recurrence_code.append(self._recurrences.encode(recurrence))
+        ordinal = (start_date or date.today()).toordinal()
+        self._start_date.append(ordinal)
+        self._due_date.append(ordinal)
+        if row % 8 == 0:
+            self._completed.append(0)
+            self._deleted.append(0)
+        self._count_name_time(row, 1)
+        self._live_count += 1
+        self._version += 1
+        return TaskView(self, row)
+
+    @classmethod
+    def from_task_manager(cls, task_manager: TaskManager) -> "TaskStore":
+        """
+        Copy every task of a TaskManager into a new store
+
+        Args:
+            task_manager: The TaskManager to copy
+
+        Returns:
+            A TaskStore with one row per task, in insertion order, keeping
+            each task's dates and completed occurrences
+        """
+        store = cls()
+        for task in task_manager.iter_tasks():
+            view = store.create_task(
+                task.get_task_name(), task.get_description(), task.get_time(),
+                task.get_priority(), task.get_duration(), task.get_task_type(),
+                task.get_recurrence(), task.get_pet_id(), task.get_start_date()
+            )
+            row = view._row
+            store._due_date[row] = task.get_due_date().toordinal()
+            bits = task.to_dict()['completion_bits']
+            if bits:
+                store._completion_bits[row] = bits
+            store._set_bit(store._completed, row, task.is_completed())
+        return store
+
+    def delete_task(self, task_id: str) -> bool:
+        """
+        Delete a task by marking its row as deleted
+
+        Args:
+            task_id: ID of the task to delete
+
+        Returns:
+            True if task was deleted, False if not found
+        """
+        row = self._row_for(task_id)
+        if row is None:
+            return False
+        self._set_bit(self._deleted, row, True)
+        self._count_name_time(row, -1)
+        self._completion_bits.pop(row, None)
+        self._live_count -= 1
+        self._version += 1
+        return True
+
+    def get_task_by_id(self, task_id: str) -> Optional[TaskView]:
+        """Get a view of a task by ID"""
+        row = self._row_for(task_id)
+        return TaskView(self, row) if row is not None else None
+
+    def get_all_tasks(self) -> List[TaskView]:
+        """Get views of all live tasks"""
+        return [TaskView(self, row) for row in self._live_rows()]
+
+    def iter_tasks(self) -> Iterator[TaskView]:
+        """Generate views of all live tasks in insertion order without building a list"""
+        for row in self._live_rows():
+            yield TaskView(self, row)
+
+    def get_tasks_by_type(self, task_type: str) -> List[TaskView]:
+        """Get views of all tasks of a specific type"""
+        code = self._types.lookup(task_type.lower())
+        if code is None:
+            return []
+        return [TaskView(self, row) for row in self._live_rows() if self._type_code[row] == code]
+
+    def get_tasks_by_priority(self, min_priority: int) -> List[TaskView]:
+        """Get views of all tasks with priority >= min_priority"""
+        return [TaskView(self, row) for row in self._live_rows() if self._priority[row] >= min_priority]
+
+    def get_completed_tasks(self) -> List[TaskView]:
+        """Get views of all completed tasks"""
+        return [TaskView(self, row) for row in self._live_rows() if self._get_bit(self._completed, row)]
+
+    def get_pending_tasks(self) -> List[TaskView]:
+        """Get views of all pending tasks"""
+        return [TaskView(self, row) for row in self._live_rows() if not self._get_bit(self._completed, row)]
+
+    def get_recurring_tasks(self) -> List[TaskView]:
+        """Get views of all recurring tasks"""
+        return [TaskView(self, row) for row in self._live_rows() if self._recurrence_code[row] != 0]
+
+    def get_tasks_by_pet(self, pet_id: str) -> List[TaskView]:
+        """Get views of all tasks for a specific pet"""
+        code = self._pets.lookup(pet_id)
+        if code is None:
+            return []
+        return [TaskView(self, row) for row in self._live_rows() if self._pet_code[row] == code]
+
+    def get_tasks_sorted_by_time(self) -> List[TaskView]:
+        """Get views of all tasks sorted by scheduled time"""
+        rows = sorted(self._live_rows(), key=self._start.__getitem__)
+        return [TaskView(self, row) for row in rows]
+
+    def get_all_conflicts(self) -> List[tuple[TaskView, TaskView, str]]:
+        """
+        Find all overlapping task pairs with TaskManager's sweep line,
+        including tasks that run past midnight
+
+        Returns:
+            List of tuples (task1, task2, reason) in insertion order
+        """
+        views = [TaskView(self, row) for row in self._live_rows()]
+        pairs = TaskManager._find_overlapping_pairs(views)
+
+        conflicts = []
+        for i, j in pairs:
+            task1, task2 = views[i], views[j]
+            conflicts.append((task1, task2, TaskManager._conflict_reason(task1, task2)))
+        return conflicts
+
+    def mark_task_completed(self, task_id: str) -> Optional[TaskView]:
+        """
+        Mark a task as completed. A recurring task (daily/weekly) records
+        the completion for its current occurrence; no new row is stored.
+        It stays completed until roll_over_recurring reaches its next
+        occurrence, as in TaskManager.
+
+        Args:
+            task_id: ID of the task to mark as completed
+
+        Returns:
+            The task's view if recurring, None otherwise
+        """
+        task = self.get_task_by_id(task_id)
+        if task is None:
+            return None
+        task.mark_completed()
+        return task if task.is_recurring() else None
+
+    def roll_over_recurring(self, on_date: Optional[date] = None) -> int:
+        """
+        Move completed recurring tasks on to their latest occurrence on or
+        before a date, so they are pending again once that occurrence is due
+
+        Args:
+            on_date: The date to roll over to (defaults to today)
+
+        Returns:
+            Number of tasks moved
+        """
+        ordinal = (on_date or date.today()).toordinal()
+        moved = 0
+        for row in list(self._completion_bits):
+            step = Task.RECURRENCE_DAYS.get(self._recurrences.decode(self._recurrence_code[row]))
+            offset = ordinal - self._due_date[row]
+            if step is None or offset < step or not self._get_bit(self._completed, row):
+                continue
+            self._due_date[row] += offset // step * step
+            index = self._occurrence_index(row, self._due_date[row])
+            self._set_bit(self._completed, row, bool(self._completion_bits[row] >> index & 1))
+            moved += 1
+        if moved:
+            self._version += 1
+        return moved
+
+    def get_total_duration(self, include_completed: bool = True) -> int:
+        """Calculate the total duration of live tasks in minutes"""
+        if include_completed:
+            return sum(self._duration[row] for row in self._live_rows())
+        return sum(self._duration[row] for row in self._live_rows()
+                   if not self._get_bit(self._completed, row))
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Get the bytes held by each column and string table
+
+        Returns:
+            Dictionary of component name -> bytes
+        """
+        usage: Dict[str, int] = {}
+        for name in ('_start', '_duration', '_priority', '_name_code', '_description_code',
+                     '_type_code', '_pet_code', '_recurrence_code', '_start_date', '_due_date'):
+            column = getattr(self, name)
+            usage[name.lstrip('_')] = column.itemsize * len(column)
+        usage['completed'] = len(self._completed)
+        usage['deleted'] = len(self._deleted)
+        usage['completion_bits'] = sys.getsizeof(self._completion_bits) + sum(
+            sys.getsizeof(bits) for bits in self._completion_bits.values())
+        usage['name_time_counts'] = sys.getsizeof(self._name_time_counts) + sum(
+            sys.getsizeof(key) for key in self._name_time_counts)
+        for name in ('_names', '_descriptions', '_types', '_pets', '_recurrences'):
+            usage[name.lstrip('_') + '_table'] = getattr(self, name).nbytes()
+        return usage
+
+    def bytes_per_task(self) -> float:
+        """
+        Average bytes of storage per row
+
+        Returns:
+            Total bytes from memory_usage() divided by the row count
+        """
+        rows = len(self._start)
+        return sum(self.memory_usage().values()) / rows if rows else 0.0
@@ -3,9 +3,23 @@ PawPal+ System Classes
 Pet care task scheduling system
 """
 
+import bisect
+import heapq
+import operator
 import uuid
-from typing import List, Dict, Optional, Any
-from datetime import datetime, time, timedelta
+from collections import OrderedDict
+from contextlib import nullcontext
+from itertools import compress, islice
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Callable, ContextManager, Set, Iterable, Iterator, Mapping
+from datetime import date, datetime, time, timedelta
+
+if TYPE_CHECKING:
+    from pawpal_archive import TaskArchive  # imports this module
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the planner falls back to pure Python
+    np = None
 
 
 class Pet:
@@ -64,6 +78,23 @@ class Pet:
         """Set the pet's animal type"""
         self._animal_type = animal_type
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the pet to a JSON-friendly dictionary"""
+        return {'name': self._name, 'age': self._age, 'animal_type': self._animal_type}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Pet":
+        """
+        Rebuild a pet from to_dict output
+
+        Raises:
+            ValueError: If a field is missing or invalid
+        """
+        try:
+            return cls(data['name'], data['age'], data['animal_type'])
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid pet record: {e}")
+
     def __repr__(self) -> str:
         """String representation of the Pet"""
         return f"Pet(name='{self._name}', age={self._age}, type='{self._animal_type}')"
@@ -200,14 +231,51 @@ class Owner:
         """
         return [pet.get_name() for pet in self._pets]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the owner and their pets to a JSON-friendly dictionary"""
+        return {
+            'owner_id': self._owner_id,
+            'name': self._name,
+            'email': self._email,
+            'phone': self._phone,
+            'pets': [pet.to_dict() for pet in self._pets],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Owner":
+        """
+        Rebuild an owner and their pets from to_dict output, keeping the owner ID
+
+        Raises:
+            ValueError: If a field is missing or invalid
+        """
+        try:
+            owner = cls(data['name'], data['email'], data.get('phone'))
+            if data.get('owner_id'):
+                owner._owner_id = data['owner_id']
+            for pet in data.get('pets', []):
+                owner.add_pet(Pet.from_dict(pet))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid owner record: {e}")
+        return owner
+
     def __repr__(self) -> str:
         """String representation of the Owner"""
         return f"Owner(name='{self._name}', email='{self._email}', pets={len(self._pets)})"
 
 
+# Field updates of tasks without a guard run in this reusable no-op context
+_NO_GUARD = nullcontext()
+
+
 class Task:
     """Represents a pet care task"""
 
+    DAY_MINUTES = 1440
+
+    # Days between occurrences for each recurrence rule that repeats
+    RECURRENCE_DAYS = {"daily": 1, "weekly": 7}
+
     def __init__(
         self,
         task_name: str,
@@ -217,10 +285,15 @@ class Task:
         duration: int,
         task_type: str,
         recurrence: Optional[str] = None,
-        pet_id: Optional[str] = None
+        pet_id: Optional[str] = None,
+        start_date: Optional[date] = None
     ):
         """
-        Initialize a Task instance
+        Initialize a Task instance.
+
+        A daily or weekly task is a series: one object stands for every
+        occurrence from start_date on, and only the completion state of
+        each occurrence is stored, as bits of an int.
 
         Args:
             task_name: Name of the task
@@ -231,10 +304,43 @@ class Task:
             task_type: Type of task (walk, feed, medication, grooming, playtime, etc.)
             recurrence: Recurrence pattern (None, "daily", "weekly", etc.)
             pet_id: Optional pet ID to associate task with a specific pet
+            start_date: Date of the first (or only) occurrence, defaults to today
 
         Raises:
             ValueError: If parameters are invalid
         """
+        self._validate(task_name, description, priority, duration, task_type)
+
+        # Parse and validate time once; everything else compares these minutes
+        self._start_minute = self._parse_minutes(time)
+        self._end_minute = self._start_minute + duration
+
+        self._task_id = str(uuid.uuid4())
+        self._task_name = task_name.strip()
+        self._description = description.strip()
+        self._time = self._format_minutes(self._start_minute)
+        self._priority = priority
+        self._duration = duration
+        self._task_type = task_type.strip().lower()
+        self._recurrence = recurrence
+        self._pet_id = pet_id
+        self._start_date = start_date or date.today()
+        self._due_date = self._start_date  # occurrence that is_completed and mark_completed refer to
+        self._completion_bits = 0  # bit k set = occurrence k is completed
+        self._completed_time: Optional[datetime] = None
+        # Called as listener(task, field) after an indexed field changes
+        self._listener: Optional[Callable[["Task", str], None]] = None
+        # Called as guard(task) for a context every field update runs in (see _changing)
+        self._guard: Optional[Callable[["Task"], ContextManager[None]]] = None
+
+    @staticmethod
+    def _validate(task_name: str, description: str, priority: int, duration: int, task_type: str) -> None:
+        """
+        Validate task fields
+
+        Raises:
+            ValueError: If any field is invalid
+        """
         if not task_name or not task_name.strip():
             raise ValueError("Task name cannot be empty")
         if not description or not description.strip():
@@ -246,41 +352,47 @@ class Task:
         if not task_type or not task_type.strip():
             raise ValueError("Task type cannot be empty")
 
-        # Parse and validate time
-        self._time_obj = self._parse_time(time)
+    def _changing(self) -> ContextManager[None]:
+        """
+        Get the context a field update runs in: the owner's guard if it set
+        one (ConcurrentTaskManager locks and freezes snapshot copies there),
+        otherwise a no-op
+        """
+        return self._guard(self) if self._guard is not None else _NO_GUARD
 
-        self._task_id = str(uuid.uuid4())
-        self._task_name = task_name.strip()
-        self._description = description.strip()
-        self._time = time.strip()
-        self._priority = priority
-        self._duration = duration
-        self._task_type = task_type.strip().lower()
-        self._recurrence = recurrence
-        self._pet_id = pet_id
-        self._completed = False
-        self._completed_time: Optional[datetime] = None
+    def _notify(self, field: str) -> None:
+        """Tell the owning TaskManager that an indexed field changed"""
+        if self._listener is not None:
+            self._listener(self, field)
 
     @staticmethod
-    def _parse_time(time_str: str) -> time:
+    def _parse_minutes(time_str: str) -> int:
         """
-        Parse time string in HH:MM format
+        Parse time string in HH:MM format into minutes since midnight.
+        Accepts one or two digits per field, like strptime's %H:%M.
 
         Args:
             time_str: Time string to parse
 
         Returns:
-            time object
+            Minutes since midnight (0-1439)
 
         Raises:
             ValueError: If time format is invalid
         """
-        try:
-            time_str = time_str.strip()
-            parsed = datetime.strptime(time_str, "%H:%M")
-            return parsed.time()
-        except ValueError:
-            raise ValueError(f"Invalid time format '{time_str}'. Expected HH:MM (e.g., '07:30')")
+        time_str = time_str.strip()
+        hours, sep, minutes = time_str.partition(":")
+        if (sep and 0 < len(hours) <= 2 and 0 < len(minutes) <= 2
+                and hours.isascii() and hours.isdigit() and minutes.isascii() and minutes.isdigit()):
+            hour, minute = int(hours), int(minutes)
+            if hour < 24 and minute < 60:
+                return hour * 60 + minute
+        raise ValueError(f"Invalid time format '{time_str}'. Expected HH:MM (e.g., '07:30')")
+
+    @staticmethod
+    def _format_minutes(minutes: int) -> str:
+        """Format minutes since midnight as zero-padded HH:MM, so equal times are equal strings"""
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
 
     def get_task_id(self) -> str:
         """Get the task's unique ID"""
@@ -312,7 +424,22 @@ class Task:
 
     def get_time_obj(self) -> time:
         """Get the scheduled time as a time object"""
-        return self._time_obj
+        return time(*divmod(self._start_minute, 60))
+
+    def get_start_minute(self) -> int:
+        """Get the scheduled time in minutes since midnight"""
+        return self._start_minute
+
+    def get_end_minute(self) -> int:
+        """
+        Get the end time in minutes since midnight of the start day.
+        Larger than DAY_MINUTES when the task runs past midnight.
+        """
+        return self._end_minute
+
+    def crosses_midnight(self) -> bool:
+        """Check if the task runs past midnight into the next day"""
+        return self._end_minute > self.DAY_MINUTES
 
     def get_recurrence(self) -> Optional[str]:
         """Get the task recurrence pattern"""
@@ -324,11 +451,114 @@ class Task:
 
     def set_pet_id(self, pet_id: Optional[str]) -> None:
         """Set the pet ID for this task"""
-        self._pet_id = pet_id
+        with self._changing():
+            self._pet_id = pet_id
+            self._notify('pet_id')
+
+    def get_start_date(self) -> date:
+        """Get the date of the first (or only) occurrence"""
+        return self._start_date
+
+    def get_due_date(self) -> date:
+        """Get the date of the current occurrence, the one is_completed reports on"""
+        return self._due_date
+
+    def is_recurring(self) -> bool:
+        """Check if the task repeats (daily or weekly)"""
+        return self._recurrence in self.RECURRENCE_DAYS
+
+    def _occurrence_index(self, on_date: date) -> Optional[int]:
+        """Get the number of the occurrence on a date, or None if there is none"""
+        offset = (on_date - self._start_date).days
+        step = self.RECURRENCE_DAYS.get(self._recurrence)
+        if offset < 0 or (step is None and offset > 0) or (step is not None and offset % step):
+            return None
+        return offset // step if step else 0
+
+    def occurs_on(self, on_date: date) -> bool:
+        """Check if the task has an occurrence on a date"""
+        return self._occurrence_index(on_date) is not None
+
+    def is_completed_on(self, on_date: date) -> bool:
+        """Check if the occurrence on a date is completed"""
+        index = self._occurrence_index(on_date)
+        return index is not None and bool(self._completion_bits >> index & 1)
+
+    def set_completed_on(self, on_date: date, completed: bool = True) -> None:
+        """
+        Record the completion state of the occurrence on a date
+
+        Raises:
+            ValueError: If the task does not occur on that date
+        """
+        index = self._occurrence_index(on_date)
+        if index is None:
+            raise ValueError(f"Task '{self._task_name}' does not occur on {on_date.isoformat()}")
+        with self._changing():
+            if completed:
+                self._completion_bits |= 1 << index
+            else:
+                self._completion_bits &= ~(1 << index)
+            self._notify('completed')
+
+    def occurrences(self, start: date, end: date) -> Iterable["TaskOccurrence"]:
+        """
+        Generate the task's occurrences between two dates, inclusive,
+        without storing them
+
+        Args:
+            start: First date to include
+            end: Last date to include
+
+        Yields:
+            A TaskOccurrence per matching date, in date order
+        """
+        step = self.RECURRENCE_DAYS.get(self._recurrence)
+        if step is None:
+            if start <= self._start_date <= end:
+                yield TaskOccurrence(self, self._start_date)
+            return
+        offset = max((start - self._start_date).days, 0)
+        current = self._start_date + timedelta(days=-(-offset // step) * step)
+        interval = timedelta(days=step)
+        while current <= end:
+            yield TaskOccurrence(self, current)
+            current += interval
+
+    def next_occurrence(self) -> Optional["TaskOccurrence"]:
+        """Get the occurrence after the current one, or None if the task does not repeat"""
+        step = self.RECURRENCE_DAYS.get(self._recurrence)
+        if step is None:
+            return None
+        return TaskOccurrence(self, self._due_date + timedelta(days=step))
+
+    def roll_over(self, on_date: date) -> bool:
+        """
+        Move a completed series on to its latest occurrence on or before a
+        date. Until then the completed occurrence stays the current one, so
+        the task reports is_completed() the way a one-off task does.
+
+        Args:
+            on_date: The date to roll over to (usually today)
+
+        Returns:
+            True if the current occurrence moved
+        """
+        step = self.RECURRENCE_DAYS.get(self._recurrence)
+        if step is None or not self.is_completed():
+            return False
+        offset = (on_date - self._due_date).days
+        if offset < step:
+            return False
+        with self._changing():
+            self._due_date += timedelta(days=offset // step * step)
+            self._completed_time = None
+            self._notify('completed')
+        return True
 
     def is_completed(self) -> bool:
-        """Check if task is completed"""
-        return self._completed
+        """Check if task (its current occurrence, for a series) is completed"""
+        return self.is_completed_on(self._due_date)
 
     def get_completed_time(self) -> Optional[datetime]:
         """Get the time when task was completed"""
@@ -336,18 +566,24 @@ class Task:
 
     def mark_completed(self) -> None:
         """Mark task as completed with current timestamp"""
-        self._completed = True
-        self._completed_time = datetime.now()
+        with self._changing():
+            self._completed_time = datetime.now()
+            self.set_completed_on(self._due_date, True)
 
     def mark_incomplete(self) -> None:
         """Mark task as not completed"""
-        self._completed = False
-        self._completed_time = None
+        with self._changing():
+            self._completed_time = None
+            self.set_completed_on(self._due_date, False)
 
     def set_time(self, time: str) -> None:
         """Set the scheduled time"""
-        self._time_obj = self._parse_time(time)
-        self._time = time.strip()
+        start = self._parse_minutes(time)
+        with self._changing():
+            self._start_minute = start
+            self._end_minute = start + self._duration
+            self._time = self._format_minutes(start)
+            self._notify('time')
 
     def set_priority(self, priority: int) -> None:
         """Set the task priority
@@ -357,7 +593,9 @@ class Task:
         """
         if priority < 0:
             raise ValueError("Task priority cannot be negative")
-        self._priority = priority
+        with self._changing():
+            self._priority = priority
+            self._notify('priority')
 
     def set_duration(self, duration: int) -> None:
         """Set the task duration
@@ -367,28 +605,319 @@ class Task:
         """
         if duration <= 0:
             raise ValueError("Task duration must be positive")
-        self._duration = duration
+        with self._changing():
+            self._duration = duration
+            self._end_minute = self._start_minute + duration
+            self._notify('duration')
 
     def get_end_time_obj(self) -> time:
         """
         Calculate and return the end time of the task
 
         Returns:
-            time object representing when task ends
+            time object representing when task ends (the next day's clock
+            time if it runs past midnight, see crosses_midnight)
+        """
+        return time(*divmod(self._end_minute % self.DAY_MINUTES, 60))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the task to a JSON-friendly dictionary
+
+        Returns:
+            Dictionary with every field needed by from_dict
+        """
+        return {
+            'task_id': self._task_id,
+            'task_name': self._task_name,
+            'description': self._description,
+            'time': self._time,
+            'priority': self._priority,
+            'duration': self._duration,
+            'task_type': self._task_type,
+            'recurrence': self._recurrence,
+            'pet_id': self._pet_id,
+            'start_date': self._start_date.isoformat(),
+            'due_date': self._due_date.isoformat(),
+            'completion_bits': self._completion_bits,
+            'completed_time': self._completed_time.isoformat() if self._completed_time else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Task":
+        """
+        Rebuild a task from to_dict output, keeping its ID and completion state
+
+        Args:
+            data: Dictionary produced by to_dict
+
+        Returns:
+            The restored Task
+
+        Raises:
+            ValueError: If a field is missing or invalid
         """
-        start = datetime.combine(datetime.today(), self._time_obj)
-        end = start + timedelta(minutes=self._duration)
-        return end.time()
+        try:
+            task = cls(data['task_name'], data['description'], data['time'], data['priority'],
+                       data['duration'], data['task_type'], data.get('recurrence'), data.get('pet_id'),
+                       date.fromisoformat(data['start_date']) if data.get('start_date') else None)
+            if data.get('task_id'):
+                task._task_id = data['task_id']
+            if data.get('due_date'):
+                task._due_date = date.fromisoformat(data['due_date'])
+            task._completion_bits = int(data.get('completion_bits', 0))
+            if data.get('completed_time'):
+                task._completed_time = datetime.fromisoformat(data['completed_time'])
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid task record: {e}")
+        return task
 
     def __repr__(self) -> str:
         """String representation of the Task"""
-        status = "✓" if self._completed else " "
+        status = "✓" if self.is_completed() else " "
         recur = f", recur={self._recurrence}" if self._recurrence else ""
         return (f"Task(name='{self._task_name}', type='{self._task_type}', "
                 f"time='{self._time}', priority={self._priority}, "
                 f"duration={self._duration}min{recur}, completed=[{status}])")
 
 
+class TaskOccurrence:
+    """
+    One dated occurrence of a task, produced on demand by Task.occurrences.
+
+    Holds only the task and the date. Getters read the task, and completion
+    reads and writes the task's per-occurrence state, so occurrences are
+    never stored.
+    """
+
+    __slots__ = ('_task', '_date')
+
+    def __init__(self, task: Task, on_date: date):
+        """
+        Initialize an occurrence view
+
+        Args:
+            task: The task (series) this is an occurrence of
+            on_date: Date of the occurrence
+        """
+        self._task = task
+        self._date = on_date
+
+    def get_task(self) -> Task:
+        """Get the task this is an occurrence of"""
+        return self._task
+
+    def get_date(self) -> date:
+        """Get the date of the occurrence"""
+        return self._date
+
+    def get_task_id(self) -> str:
+        """Get an ID unique to this occurrence (task ID and date)"""
+        return f"{self._task.get_task_id()}@{self._date.isoformat()}"
+
+    def get_task_name(self) -> str:
+        """Get the task name"""
+        return self._task.get_task_name()
+
+    def get_description(self) -> str:
+        """Get the task description"""
+        return self._task.get_description()
+
+    def get_time(self) -> str:
+        """Get the scheduled time"""
+        return self._task.get_time()
+
+    def get_time_obj(self) -> time:
+        """Get the scheduled time as a time object"""
+        return self._task.get_time_obj()
+
+    def get_end_time_obj(self) -> time:
+        """Get the end time of the occurrence"""
+        return self._task.get_end_time_obj()
+
+    def get_start_minute(self) -> int:
+        """Get the scheduled time in minutes since midnight"""
+        return self._task.get_start_minute()
+
+    def get_end_minute(self) -> int:
+        """Get the end time in minutes since midnight of the occurrence's day"""
+        return self._task.get_end_minute()
+
+    def crosses_midnight(self) -> bool:
+        """Check if the occurrence runs past midnight into the next day"""
+        return self._task.crosses_midnight()
+
+    def get_priority(self) -> int:
+        """Get the task priority"""
+        return self._task.get_priority()
+
+    def get_duration(self) -> int:
+        """Get the task duration in minutes"""
+        return self._task.get_duration()
+
+    def get_task_type(self) -> str:
+        """Get the task type"""
+        return self._task.get_task_type()
+
+    def get_recurrence(self) -> Optional[str]:
+        """Get the task recurrence pattern"""
+        return self._task.get_recurrence()
+
+    def get_pet_id(self) -> Optional[str]:
+        """Get the pet ID associated with the task"""
+        return self._task.get_pet_id()
+
+    def is_completed(self) -> bool:
+        """Check if this occurrence is completed"""
+        return self._task.is_completed_on(self._date)
+
+    def mark_completed(self) -> None:
+        """Mark this occurrence as completed"""
+        self._task.set_completed_on(self._date, True)
+
+    def mark_incomplete(self) -> None:
+        """Mark this occurrence as not completed"""
+        self._task.set_completed_on(self._date, False)
+
+    def __eq__(self, other: object) -> bool:
+        """Occurrences are equal when they share a task and a date"""
+        if not isinstance(other, TaskOccurrence):
+            return NotImplemented
+        return self._task is other._task and self._date == other._date
+
+    def __hash__(self) -> int:
+        """Hash by task ID and date"""
+        return hash((self._task.get_task_id(), self._date))
+
+    def __repr__(self) -> str:
+        """String representation of the occurrence"""
+        status = "✓" if self.is_completed() else " "
+        return (f"TaskOccurrence(name='{self.get_task_name()}', date={self._date.isoformat()}, "
+                f"time='{self.get_time()}', completed=[{status}])")
+
+
+def _writable_bucket(index: Dict[Any, Any], key: Any, owned: Optional[Set[int]], factory: Callable[[], Any]) -> Any:
+    """
+    Get index[key] for writing, creating it with factory() if missing.
+
+    When owned is not None the index's buckets may be shared with a published
+    snapshot, so a bucket not listed in owned (by id) is copied before it is
+    written; the copy is recorded as owned.
+    """
+    bucket = index.get(key)
+    if bucket is None:
+        bucket = index[key] = factory()
+    elif owned is None or id(bucket) in owned:
+        return bucket
+    else:
+        bucket = index[key] = bucket.copy()
+    if owned is not None:
+        owned.add(id(bucket))
+    return bucket
+
+
+class _IntervalIndex:
+    """
+    Interval index over task start minutes for overlap queries.
+
+    A segment tree over the 1440 start minutes of the day stores the latest
+    end minute in each subtree. Every leaf keeps the tasks that start in that
+    minute sorted by end, so an overlap query only visits branches that can
+    contain a hit: O(log n + k) for k overlapping tasks.
+    """
+
+    _SIZE = 2048  # number of leaves, must be >= 1440 start minutes
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._max_end = [0] * (2 * self._SIZE)  # 0 = empty, task ends are always > 0
+        self._buckets: Dict[int, List[tuple[int, int, str]]] = {}  # start -> [(end, seq, task_id)]
+        self._entries: Dict[str, List[tuple[int, int, int]]] = {}  # task_id -> [(start, end, seq)]
+        self._owned: Optional[Set[int]] = None  # see share()
+
+    @classmethod
+    def build(cls, entries: Iterable[tuple[str, int, int, int]]) -> "_IntervalIndex":
+        """
+        Build an index from (task_id, start, end, seq) entries in one pass.
+        A task may appear once per interval it occupies.
+
+        Sorting each bucket once and filling the tree bottom-up is cheaper
+        than adding the intervals one at a time.
+        """
+        index = cls()
+        for task_id, start, end, seq in entries:
+            index._buckets.setdefault(start, []).append((end, seq, task_id))
+            index._entries.setdefault(task_id, []).append((start, end, seq))
+        for start, bucket in index._buckets.items():
+            bucket.sort()
+            index._max_end[start + cls._SIZE] = bucket[-1][0]
+        for pos in range(cls._SIZE - 1, 0, -1):
+            index._max_end[pos] = max(index._max_end[2 * pos], index._max_end[2 * pos + 1])
+        return index
+
+    def share(self) -> "_IntervalIndex":
+        """
+        Copy the index for a read-only snapshot. The buckets are shared, and
+        from now on this index copies a bucket before its first write to it.
+        """
+        index = _IntervalIndex()
+        index._max_end = list(self._max_end)
+        index._buckets = dict(self._buckets)
+        index._entries = dict(self._entries)
+        self._owned = set()
+        return index
+
+    def add(self, task_id: str, start: int, end: int, seq: int) -> None:
+        """Add the interval [start, end) for a task"""
+        bisect.insort(_writable_bucket(self._buckets, start, self._owned, list), (end, seq, task_id))
+        _writable_bucket(self._entries, task_id, self._owned, list).append((start, end, seq))
+        self._update(start)
+
+    def remove(self, task_id: str) -> None:
+        """Remove all of a task's intervals if it is indexed"""
+        for start, end, seq in self._entries.pop(task_id, ()):
+            bucket = _writable_bucket(self._buckets, start, self._owned, list)
+            bucket.pop(bisect.bisect_left(bucket, (end, seq, task_id)))
+            if not bucket:
+                del self._buckets[start]
+            self._update(start)
+
+    def _update(self, start: int) -> None:
+        """Recompute the max end minute on the path from a leaf to the root"""
+        pos = start + self._SIZE
+        bucket = self._buckets.get(start)
+        self._max_end[pos] = bucket[-1][0] if bucket else 0
+        pos //= 2
+        while pos:
+            self._max_end[pos] = max(self._max_end[2 * pos], self._max_end[2 * pos + 1])
+            pos //= 2
+
+    def overlapping(self, start: int, end: int) -> List[tuple[int, str]]:
+        """
+        Find indexed intervals overlapping [start, end)
+
+        Returns:
+            List of (seq, task_id) pairs in no particular order
+        """
+        result = []
+        stack = [(1, 0, self._SIZE)]
+        while stack:
+            node, lo, hi = stack.pop()
+            # Skip branches that start too late or end too early
+            if lo >= end or self._max_end[node] <= start:
+                continue
+            if node >= self._SIZE:
+                for task_end, seq, task_id in reversed(self._buckets[lo]):
+                    if task_end <= start:
+                        break
+                    result.append((seq, task_id))
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node, lo, mid))
+            stack.append((2 * node + 1, mid, hi))
+        return result
+
+
 class TaskManager:
     """Manages pet care tasks - creating, editing, and deleting"""
 
@@ -396,14 +925,232 @@ class TaskManager:
         """Initialize TaskManager with an empty task dictionary"""
         self._tasks: Dict[str, Task] = {}  # task_id -> Task
         self._total_duration_cache: Optional[int] = None
+        self._version = 0  # bumped on every mutation
+        self._subscribers: List[Callable[[str, Task], None]] = []
+        self._seq: Dict[str, int] = {}  # task_id -> insertion order
+        self._next_seq = 0
+        self._interval_index = _IntervalIndex()
+        # (version, overlapping id pairs) from the last get_all_conflicts sweep
+        self._conflict_pairs_cache: Optional[tuple[int, List[tuple[str, str]]]] = None
+        # Secondary indexes for the filter methods
+        self._by_pet: Dict[Optional[str], Set[str]] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_completed: Dict[bool, Set[str]] = {True: set(), False: set()}
+        self._recurring: Set[str] = set()
+        self._by_priority: List[tuple[int, int, str]] = []  # sorted (priority, seq, task_id)
+        self._name_time_counts: Dict[tuple[str, str], int] = {}  # (task_name, time) -> count
+        self._attribute_keys: Dict[str, tuple[Optional[str], str, bool, int, tuple[str, str]]] = {}
+        # Automatic compaction (see set_auto_compaction)
+        self._archive: Optional["TaskArchive"] = None
+        self._archive_after_days = 30
+        self._compact_threshold = 0
+        self._compact_floor = 0  # completed tasks left behind by the last compaction
+        self._owned_buckets: Optional[Set[int]] = None  # see _share
 
     def _invalidate_cache(self) -> None:
         """Invalidate the total duration cache"""
         self._total_duration_cache = None
 
+    def subscribe(self, callback: Callable[[str, Task], None]) -> None:
+        """
+        Register a callback for task mutations
+
+        Args:
+            callback: Called as callback(event, task) after every change,
+                where event is "created", "deleted" or "changed"
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, Task], None]) -> None:
+        """Remove a callback registered with subscribe()"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _publish(self, event: str, task: Task) -> None:
+        """Notify subscribers of a mutation"""
+        for callback in self._subscribers:
+            callback(event, task)
+
+    def get_version(self) -> int:
+        """
+        Get the mutation version of the task store.
+        It increases whenever a task is added, removed or changed, so equal
+        versions mean nothing changed in between.
+
+        Returns:
+            Monotonic mutation counter
+        """
+        return self._version
+
+    @staticmethod
+    def _intervals(task: Task) -> List[tuple[int, int]]:
+        """
+        Get the [start, end) minute ranges a task occupies on the daily clock.
+
+        A task that runs past midnight wraps onto the early morning, so it is
+        split in two; one that lasts a whole day or more covers all of it.
+        """
+        start, end = task.get_start_minute(), task.get_end_minute()
+        if end <= Task.DAY_MINUTES:
+            return [(start, end)]
+        if end - start >= Task.DAY_MINUTES:
+            return [(0, Task.DAY_MINUTES)]
+        return [(start, Task.DAY_MINUTES), (0, end - Task.DAY_MINUTES)]
+
+    def _add_task(self, task: Task, priority_batch: Optional[list] = None, index_interval: bool = True) -> None:
+        """
+        Store a task and add it to the indexes
+
+        Args:
+            task: The task to store
+            priority_batch: Collects priority entries for a batch insert (see _index_attributes)
+            index_interval: If False, the caller rebuilds the interval index afterwards
+        """
+        task_id = task.get_task_id()
+        self._tasks[task_id] = task
+        self._seq[task_id] = self._next_seq
+        self._next_seq += 1
+        self._version += 1
+        task._listener = self._on_task_changed
+        task._guard = None
+        if index_interval:
+            self._index_interval(task)
+        self._index_attributes(task, priority_batch)
+        self._publish("created", task)
+
+    def _remove_task(self, task_id: str) -> Task:
+        """Remove a task and drop it from the indexes"""
+        task = self._tasks.pop(task_id)
+        self._version += 1
+        self._unindex_interval(task_id)
+        self._unindex_attributes(task_id)
+        del self._seq[task_id]
+        task._listener = None
+        task._guard = None
+        self._publish("deleted", task)
+        return task
+
+    def _index_interval(self, task: Task) -> None:
+        """Add a task's intervals to the interval index"""
+        task_id = task.get_task_id()
+        seq = self._seq[task_id]
+        for start, end in self._intervals(task):
+            self._interval_index.add(task_id, start, end, seq)
+
+    def _unindex_interval(self, task_id: str) -> None:
+        """Remove a task from the interval index"""
+        self._interval_index.remove(task_id)
+
+    def _index_attributes(self, task: Task, priority_batch: Optional[list] = None) -> None:
+        """
+        Add a task to the secondary indexes (pet, type, status, recurrence,
+        priority and name/time uniqueness)
+
+        Args:
+            task: The stored task to index
+            priority_batch: If given, the priority entry is appended here so
+                the caller can sort it into the priority index once per batch
+        """
+        task_id = task.get_task_id()
+        name_time = (task.get_task_name(), task.get_time())
+        keys = (task.get_pet_id(), task.get_task_type(), task.is_completed(), task.get_priority(), name_time)
+        pet_id, task_type, completed, priority, _ = keys
+        self._attribute_keys[task_id] = keys
+        owned = self._owned_buckets
+        _writable_bucket(self._by_pet, pet_id, owned, set).add(task_id)
+        _writable_bucket(self._by_type, task_type, owned, set).add(task_id)
+        _writable_bucket(self._by_completed, completed, owned, set).add(task_id)
+        if task.get_recurrence() is not None:
+            self._recurring.add(task_id)
+        self._name_time_counts[name_time] = self._name_time_counts.get(name_time, 0) + 1
+        entry = (priority, self._seq[task_id], task_id)
+        if priority_batch is None:
+            bisect.insort(self._by_priority, entry)
+        else:
+            priority_batch.append(entry)
+
+    def _unindex_attributes(self, task_id: str) -> None:
+        """Remove a task from the secondary indexes using the keys it was stored under"""
+        pet_id, task_type, completed, priority, name_time = self._attribute_keys.pop(task_id)
+        self._discard_from(self._by_pet, pet_id, task_id)
+        self._discard_from(self._by_type, task_type, task_id)
+        _writable_bucket(self._by_completed, completed, self._owned_buckets, set).discard(task_id)
+        self._recurring.discard(task_id)
+        if self._name_time_counts[name_time] == 1:
+            del self._name_time_counts[name_time]
+        else:
+            self._name_time_counts[name_time] -= 1
+        entry = (priority, self._seq[task_id], task_id)
+        del self._by_priority[bisect.bisect_left(self._by_priority, entry)]
+
+    def _discard_from(self, index: Dict[Any, Set[str]], key: Any, task_id: str) -> None:
+        """Remove a task id from an index bucket, dropping the bucket when empty"""
+        bucket = _writable_bucket(index, key, self._owned_buckets, set)
+        bucket.discard(task_id)
+        if not bucket:
+            del index[key]
+
+    def _tasks_in_order(self, task_ids) -> List[Task]:
+        """Look up task ids and return the tasks in insertion order"""
+        return [self._tasks[task_id] for task_id in sorted(task_ids, key=self._seq.__getitem__)]
+
+    def _on_task_changed(self, task: Task, field: str) -> None:
+        """Keep indexes in sync when a stored task is modified"""
+        self._version += 1
+        if field in ('time', 'duration'):
+            self._unindex_interval(task.get_task_id())
+            self._index_interval(task)
+        if field in ('time', 'pet_id', 'completed', 'priority'):
+            self._unindex_attributes(task.get_task_id())
+            self._index_attributes(task)
+        self._publish("changed", task)
+        if field == 'duration':
+            self._invalidate_cache()
+
+    def _share(self, cls: Optional[type] = None) -> "TaskManager":
+        """
+        Copy the store for a read-only snapshot (see pawpal_concurrent).
+
+        Only the top-level dictionaries and lists are copied; the Task objects
+        and index buckets are shared. From now on this manager copies a bucket
+        before its first write to it, so the snapshot never changes.
+
+        Args:
+            cls: TaskManager subclass to create, defaults to this class
+
+        Returns:
+            The snapshot, without subscribers or automatic compaction
+        """
+        clone = (cls or type(self)).__new__(cls or type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._tasks = dict(self._tasks)
+        clone._subscribers = []
+        clone._seq = dict(self._seq)
+        clone._interval_index = self._interval_index.share()
+        clone._by_pet = dict(self._by_pet)
+        clone._by_type = dict(self._by_type)
+        clone._by_completed = dict(self._by_completed)
+        clone._recurring = set(self._recurring)
+        clone._by_priority = list(self._by_priority)
+        clone._name_time_counts = dict(self._name_time_counts)
+        clone._attribute_keys = dict(self._attribute_keys)
+        clone._archive = None
+        clone._owned_buckets = None
+        self._owned_buckets = set()
+        return clone
+
+    def _rebuild_interval_index(self) -> None:
+        """Rebuild the interval index from scratch in one pass"""
+        self._interval_index = _IntervalIndex.build(
+            (task_id, start, end, self._seq[task_id])
+            for task_id, task in self._tasks.items()
+            for start, end in self._intervals(task)
+        )
+
     def has_duplicate_task(self, task_name: str, time: str) -> bool:
         """
-        Check if a task with the same name and time already exists
+        Check if a task with the same name and time already exists (O(1) lookup)
 
         Args:
             task_name: Name of the task to check
@@ -412,10 +1159,7 @@ class TaskManager:
         Returns:
             True if duplicate exists, False otherwise
         """
-        for task in self._tasks.values():
-            if task.get_task_name() == task_name and task.get_time() == time:
-                return True
-        return False
+        return (task_name, time) in self._name_time_counts
 
     def create_task(
         self,
@@ -428,7 +1172,8 @@ class TaskManager:
         recurrence: Optional[str] = None,
         pet_id: Optional[str] = None,
         allow_duplicates: bool = False,
-        warn_conflicts: bool = False
+        warn_conflicts: bool = False,
+        start_date: Optional[date] = None
     ) -> Task:
         """
         Create a new task and add it to the task list
@@ -444,6 +1189,7 @@ class TaskManager:
             pet_id: Optional pet ID to associate with this task
             allow_duplicates: If False, prevents creating duplicate tasks
             warn_conflicts: If True, prints warning messages for scheduling conflicts
+            start_date: Date of the first (or only) occurrence, defaults to today
 
         Returns:
             The created Task object
@@ -451,15 +1197,15 @@ class TaskManager:
         Raises:
             ValueError: If duplicate task exists and allow_duplicates is False
         """
-        # Check for duplicates
-        if not allow_duplicates and self.has_duplicate_task(task_name, time):
+        task = Task(task_name, description, time, priority, duration, task_type, recurrence, pet_id, start_date)
+        # Compare the normalized name and time, as stored
+        if not allow_duplicates and self.has_duplicate_task(task.get_task_name(), task.get_time()):
             raise ValueError(
-                f"Task '{task_name}' at {time} already exists. "
+                f"Task '{task.get_task_name()}' at {task.get_time()} already exists. "
                 "Set allow_duplicates=True to override."
             )
 
-        task = Task(task_name, description, time, priority, duration, task_type, recurrence, pet_id)
-        self._tasks[task.get_task_id()] = task
+        self._add_task(task)
         self._invalidate_cache()
 
         # Check for conflicts if requested
@@ -473,6 +1219,80 @@ class TaskManager:
 
         return task
 
+    def create_tasks_bulk(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        allow_duplicates: bool = False
+    ) -> tuple[List[Task], List[tuple[int, str]]]:
+        """
+        Create many tasks in one batch.
+
+        Every row is validated on its own and bad rows are reported instead
+        of aborting the batch. Indexes and caches are updated once for the
+        whole batch, so importing a large schedule is not quadratic.
+
+        Args:
+            rows: Iterable of dicts with create_task arguments (task_name,
+                description, time, priority, duration, task_type, and
+                optionally recurrence and pet_id)
+            allow_duplicates: If False, rows matching an existing task or an
+                earlier row by name and time are rejected
+
+        Returns:
+            Tuple (created_tasks, errors) where errors is a list of
+            (row_number, message) for every rejected row
+        """
+        created: List[Task] = []
+        errors: List[tuple[int, str]] = []
+        batch_keys: Set[tuple[str, str]] = set()
+
+        for row_number, row in enumerate(rows):
+            try:
+                if not isinstance(row, Mapping):
+                    raise ValueError("Row must be a mapping of task fields")
+                task = Task(**row)
+                key = (task.get_task_name(), task.get_time())
+                if not allow_duplicates and (key in self._name_time_counts or key in batch_keys):
+                    raise ValueError(f"Task '{key[0]}' at {key[1]} already exists")
+            except (TypeError, ValueError, AttributeError) as e:
+                errors.append((row_number, str(e)))
+                continue
+            batch_keys.add(key)
+            created.append(task)
+
+        self.add_tasks(created)
+        return created, errors
+
+    def add_tasks(self, tasks: List[Task]) -> None:
+        """
+        Store already built tasks (e.g. restored from a file) in one batch,
+        keeping their IDs and completion state. Indexes and caches are
+        updated once for the whole batch.
+
+        Args:
+            tasks: Tasks to store
+
+        Raises:
+            ValueError: If a task ID is already stored or repeated in the batch
+        """
+        if not tasks:
+            return
+        ids = [task.get_task_id() for task in tasks]
+        if len(set(ids)) != len(ids) or any(task_id in self._tasks for task_id in ids):
+            raise ValueError("Task IDs must be unique")
+
+        rebuild = len(tasks) > len(self._tasks)
+        priority_batch: List[tuple[int, int, str]] = []
+        for task in tasks:
+            self._add_task(task, priority_batch, index_interval=not rebuild)
+
+        self._by_priority.extend(priority_batch)
+        self._by_priority.sort()
+        if rebuild:
+            # Large batches are cheaper to sweep once than to insert one by one
+            self._rebuild_interval_index()
+        self._invalidate_cache()
+
     def edit_task(self, task_id: str, **kwargs) -> Optional[Task]:
         """
         Edit an existing task
@@ -492,7 +1312,6 @@ class TaskManager:
                 task.set_priority(kwargs['priority'])
             if 'duration' in kwargs:
                 task.set_duration(kwargs['duration'])
-                self._invalidate_cache()
         return task
 
     def delete_task(self, task_id: str) -> bool:
@@ -506,15 +1325,91 @@ class TaskManager:
             True if task was deleted, False if not found
         """
         if task_id in self._tasks:
-            del self._tasks[task_id]
+            self._remove_task(task_id)
             self._invalidate_cache()
             return True
         return False
 
+    def compact(self, archive: "TaskArchive", older_than_days: int = 30, now: Optional[datetime] = None) -> int:
+        """
+        Move completed one-off tasks older than a number of days out of the
+        manager and into an archive, so filters, sorts and conflict checks
+        only pay for live tasks. Recurring tasks are never archived.
+
+        Args:
+            archive: Archive to append the tasks to
+            older_than_days: Archive tasks completed (or, without a completion
+                time, dated) at least this many days ago
+            now: Reference time, defaults to now
+
+        Returns:
+            Number of tasks archived
+
+        Raises:
+            ValueError: If older_than_days is negative
+        """
+        if older_than_days < 0:
+            raise ValueError("older_than_days cannot be negative")
+        cutoff = (now or datetime.now()) - timedelta(days=older_than_days)
+        stale = []
+        for task in self._tasks_in_order(self._by_completed[True]):
+            if task.is_recurring():
+                continue
+            finished = task.get_completed_time() or datetime.combine(task.get_start_date(), task.get_time_obj())
+            if finished <= cutoff:
+                stale.append(task)
+
+        if stale:
+            archive.append(stale)
+            for task in stale:
+                self._remove_task(task.get_task_id())
+            self._invalidate_cache()
+        self._compact_floor = len(self._by_completed[True])
+        return len(stale)
+
+    def set_auto_compaction(
+        self,
+        archive: Optional["TaskArchive"],
+        older_than_days: int = 30,
+        threshold: int = 1000
+    ) -> None:
+        """
+        Compact automatically once enough completed tasks have built up.
+        The check runs when mark_task_completed returns, never in the middle
+        of a change; after completing Task objects directly, call
+        run_auto_compaction.
+
+        Args:
+            archive: Archive to move tasks into, or None to turn automatic compaction off
+            older_than_days: Age passed to compact
+            threshold: Run compact when this many more completed tasks are
+                held than after the last compaction
+        """
+        self._archive = archive
+        self._archive_after_days = older_than_days
+        self._compact_threshold = threshold
+        self._compact_floor = 0
+
+    def run_auto_compaction(self) -> int:
+        """
+        Compact if automatic compaction is on and threshold more completed
+        tasks are held than after the last compaction
+
+        Returns:
+            Number of tasks archived
+        """
+        if self._archive is None or len(self._by_completed[True]) < self._compact_floor + self._compact_threshold:
+            return 0
+        return self.compact(self._archive, self._archive_after_days)
+
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks as a list"""
         return list(self._tasks.values())
 
+    def iter_tasks(self) -> Iterator[Task]:
+        """Generate all tasks in insertion order without building a list (do not modify tasks meanwhile)"""
+        return iter(self._tasks.values())
+
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """
         Get a specific task by ID (O(1) lookup)
@@ -527,6 +1422,20 @@ class TaskManager:
         """
         return self._tasks.get(task_id)
 
+    def get_insertion_rank(self, task_id: str) -> Optional[int]:
+        """
+        Get a task's position in insertion order, for breaking ties the way
+        get_all_tasks orders them. Ranks only grow, so a task added later
+        always ranks after every task already stored.
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            The insertion rank, or None if the task is not stored
+        """
+        return self._seq.get(task_id)
+
     def get_tasks_by_type(self, task_type: str) -> List[Task]:
         """
         Get all tasks of a specific type
@@ -537,7 +1446,7 @@ class TaskManager:
         Returns:
             List of tasks matching the type
         """
-        return [task for task in self._tasks.values() if task.get_task_type() == task_type.lower()]
+        return self._tasks_in_order(self._by_type.get(task_type.lower(), ()))
 
     def get_tasks_by_priority(self, min_priority: int) -> List[Task]:
         """
@@ -549,7 +1458,8 @@ class TaskManager:
         Returns:
             List of tasks with sufficient priority
         """
-        return [task for task in self._tasks.values() if task.get_priority() >= min_priority]
+        start = bisect.bisect_left(self._by_priority, (min_priority,))
+        return self._tasks_in_order(task_id for _, _, task_id in self._by_priority[start:])
 
     def get_completed_tasks(self) -> List[Task]:
         """
@@ -558,7 +1468,7 @@ class TaskManager:
         Returns:
             List of completed tasks
         """
-        return [task for task in self._tasks.values() if task.is_completed()]
+        return self._tasks_in_order(self._by_completed[True])
 
     def get_pending_tasks(self) -> List[Task]:
         """
@@ -567,7 +1477,7 @@ class TaskManager:
         Returns:
             List of pending tasks
         """
-        return [task for task in self._tasks.values() if not task.is_completed()]
+        return self._tasks_in_order(self._by_completed[False])
 
     def get_recurring_tasks(self) -> List[Task]:
         """
@@ -576,7 +1486,7 @@ class TaskManager:
         Returns:
             List of recurring tasks
         """
-        return [task for task in self._tasks.values() if task.get_recurrence() is not None]
+        return self._tasks_in_order(self._recurring)
 
     def get_tasks_by_pet(self, pet_id: str) -> List[Task]:
         """
@@ -588,7 +1498,7 @@ class TaskManager:
         Returns:
             List of tasks for the specified pet
         """
-        return [task for task in self._tasks.values() if task.get_pet_id() == pet_id]
+        return self._tasks_in_order(self._by_pet.get(pet_id, ()))
 
     def get_tasks_sorted_by_time(self) -> List[Task]:
         """
@@ -597,12 +1507,13 @@ class TaskManager:
         Returns:
             List of tasks sorted by time
         """
-        return sorted(self._tasks.values(), key=lambda t: t.get_time_obj())
+        return sorted(self._tasks.values(), key=lambda t: t.get_start_minute())
 
     def check_task_conflicts(self, task: Task) -> List[tuple[Task, str]]:
         """
         Check if a task conflicts with any existing tasks (time overlap).
         Light conflict detection - returns warnings but doesn't prevent creation.
+        Answered from the interval index in O(log n + k).
 
         Args:
             task: The task to check for conflicts
@@ -610,105 +1521,178 @@ class TaskManager:
         Returns:
             List of tuples (conflicting_task, reason) describing each conflict
         """
+        task_id = task.get_task_id()
+        # A task past midnight is queried once per interval, so one task can be hit twice
+        overlaps = sorted({
+            (seq, other_id)
+            for start, end in self._intervals(task)
+            for seq, other_id in self._interval_index.overlapping(start, end)
+            if other_id != task_id
+        })
+
         conflicts = []
-        task_start = datetime.combine(datetime.today(), task.get_time_obj())
-        task_end = task_start + timedelta(minutes=task.get_duration())
+        for _, other_id in overlaps:
+            existing_task = self._tasks[other_id]
+            conflicts.append((existing_task, self._overlap_reason(task, existing_task)))
 
-        for existing_task in self._tasks.values():
-            # Skip comparing task with itself
-            if existing_task.get_task_id() == task.get_task_id():
-                continue
+        return conflicts
 
-            # Calculate existing task's time range
-            existing_start = datetime.combine(datetime.today(), existing_task.get_time_obj())
-            existing_end = existing_start + timedelta(minutes=existing_task.get_duration())
+    @staticmethod
+    def _overlap_reason(task: Task, existing_task: Task) -> str:
+        """Describe why a task conflicts with an existing one, for check_task_conflicts"""
+        # Determine conflict type
+        same_pet = (task.get_pet_id() and existing_task.get_pet_id() and
+                    task.get_pet_id() == existing_task.get_pet_id())
+
+        if same_pet:
+            return f"Same pet ({task.get_pet_id()}) has overlapping tasks"
+        pet1 = task.get_pet_id() or "unknown"
+        pet2 = existing_task.get_pet_id() or "unknown"
+        return f"Tasks for different pets ({pet1} and {pet2}) overlap"
 
-            # Check for time overlap
-            if not (task_end <= existing_start or existing_end <= task_start):
-                # Determine conflict type
-                same_pet = (task.get_pet_id() and existing_task.get_pet_id() and
-                           task.get_pet_id() == existing_task.get_pet_id())
+    @staticmethod
+    def _conflict_reason(task1: Task, task2: Task) -> str:
+        """Describe the conflict between two overlapping tasks"""
+        same_pet = (task1.get_pet_id() and task2.get_pet_id() and
+                    task1.get_pet_id() == task2.get_pet_id())
 
-                if same_pet:
-                    reason = f"Same pet ({task.get_pet_id()}) has overlapping tasks"
-                else:
-                    pet1 = task.get_pet_id() or "unknown"
-                    pet2 = existing_task.get_pet_id() or "unknown"
-                    reason = f"Tasks for different pets ({pet1} and {pet2}) overlap"
+        if same_pet:
+            return f"⚠️  Same pet ({task1.get_pet_id()}) double-booked"
+        pet1 = task1.get_pet_id() or "unknown"
+        pet2 = task2.get_pet_id() or "unknown"
+        return f"ℹ️  Owner juggling: {pet1} and {pet2} at same time"
 
-                conflicts.append((existing_task, reason))
+    @staticmethod
+    def _find_overlapping_pairs(tasks: List[Task]) -> List[tuple[int, int]]:
+        """
+        Find every pair of overlapping tasks with a sweep line.
 
-        return conflicts
+        Intervals are visited in order of start minute while a heap keeps the
+        ones still running, so the cost is O(n log n + k) for k overlapping
+        pairs instead of comparing every pair. Tasks that run past midnight
+        contribute both of their intervals.
 
-    def get_all_conflicts(self) -> List[tuple[Task, Task, str]]:
+        Args:
+            tasks: Tasks to check against each other
+
+        Returns:
+            Sorted list of index pairs (i, j) with i < j
+        """
+        intervals = []
+        wrapped = False
+        for i, task in enumerate(tasks):
+            start, end = task.get_start_minute(), task.get_end_minute()
+            if end <= Task.DAY_MINUTES:
+                intervals.append((start, end, i))
+            else:
+                wrapped = True
+                intervals.extend((lo, hi, i) for lo, hi in TaskManager._intervals(task))
+        intervals.sort()
+
+        pairs = []
+        active: List[tuple[int, int]] = []  # heap of (end minute, index)
+        for start, end, i in intervals:
+            # Drop intervals that finished at or before this start
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for _, j in active:
+                pairs.append((j, i) if j < i else (i, j))
+            heapq.heappush(active, (end, i))
+
+        if wrapped:
+            # Two wrapped tasks can overlap both before and after midnight
+            pairs = list(set(pairs))
+        pairs.sort()
+        return pairs
+
+    def get_all_conflicts(self) -> List[tuple[Task, Task, str]]:
         """
         Find all scheduling conflicts in the entire task system.
+        Uses a sweep line over start times (O(n log n + k)); the pairs are
+        kept until the next mutation, so repeated calls skip the sweep.
 
         Returns:
             List of tuples (task1, task2, reason) for each conflict pair
         """
-        conflicts = []
-        tasks_list = list(self._tasks.values())
-
-        for i, task1 in enumerate(tasks_list):
-            for task2 in tasks_list[i + 1:]:
-                # Calculate time ranges
-                start1 = datetime.combine(datetime.today(), task1.get_time_obj())
-                end1 = start1 + timedelta(minutes=task1.get_duration())
-
-                start2 = datetime.combine(datetime.today(), task2.get_time_obj())
-                end2 = start2 + timedelta(minutes=task2.get_duration())
-
-                # Check for overlap
-                if not (end1 <= start2 or end2 <= start1):
-                    same_pet = (task1.get_pet_id() and task2.get_pet_id() and
-                               task1.get_pet_id() == task2.get_pet_id())
-
-                    if same_pet:
-                        reason = f"⚠️  Same pet ({task1.get_pet_id()}) double-booked"
-                    else:
-                        pet1 = task1.get_pet_id() or "unknown"
-                        pet2 = task2.get_pet_id() or "unknown"
-                        reason = f"ℹ️  Owner juggling: {pet1} and {pet2} at same time"
-
-                    conflicts.append((task1, task2, reason))
+        cached = self._conflict_pairs_cache
+        if cached is None or cached[0] != self._version:
+            tasks = list(self._tasks.values())
+            task_ids = [task.get_task_id() for task in tasks]
+            # Pairs come back sorted by index, which is insertion order
+            pairs = [(task_ids[i], task_ids[j]) for i, j in self._find_overlapping_pairs(tasks)]
+            cached = self._conflict_pairs_cache = (self._version, pairs)
 
+        conflicts = []
+        for task_id, other_id in cached[1]:
+            task1 = self._tasks[task_id]
+            task2 = self._tasks[other_id]
+            conflicts.append((task1, task2, self._conflict_reason(task1, task2)))
         return conflicts
 
     def mark_task_completed(self, task_id: str) -> Optional[Task]:
         """
-        Mark a task as completed. If it's a recurring task (daily/weekly),
-        automatically creates a new instance for the next occurrence.
+        Mark a task as completed. A recurring task (daily/weekly) records
+        the completion for its current occurrence; no new task is stored.
+        It stays completed until roll_over_recurring reaches its next
+        occurrence (see Task.next_occurrence).
 
         Args:
             task_id: ID of the task to mark as completed
 
         Returns:
-            The newly created task if recurring, None otherwise
+            The task if recurring, None otherwise
         """
         task = self.get_task_by_id(task_id)
         if not task:
             return None
 
-        # Mark the current task as completed
+        # Mark the current occurrence as completed, then compact once it is stored
         task.mark_completed()
+        self.run_auto_compaction()
+        return task if task.is_recurring() else None
 
-        # If it's a recurring task, create a new instance for next occurrence
-        if task.get_recurrence() in ["daily", "weekly"]:
-            new_task = self.create_task(
-                task_name=task.get_task_name(),
-                description=task.get_description(),
-                time=task.get_time(),
-                priority=task.get_priority(),
-                duration=task.get_duration(),
-                task_type=task.get_task_type(),
-                recurrence=task.get_recurrence(),
-                pet_id=task.get_pet_id(),
-                allow_duplicates=True  # Allow duplicate since this is a new occurrence
-            )
-            return new_task
+    def roll_over_recurring(self, on_date: Optional[date] = None) -> int:
+        """
+        Move completed recurring tasks on to their latest occurrence on or
+        before a date, so they are pending again once that occurrence is due
 
-        return None
+        Args:
+            on_date: The date to roll over to (defaults to today)
+
+        Returns:
+            Number of tasks moved
+        """
+        on_date = on_date or date.today()
+        return sum(task.roll_over(on_date) for task in self.get_recurring_tasks())
+
+    def iter_occurrences(self, start: date, end: Optional[date] = None) -> Iterable[TaskOccurrence]:
+        """
+        Generate every task occurrence between two dates, inclusive, without
+        storing them. Each task yields its own dates lazily and the streams
+        are merged, so the cost grows with the occurrences consumed.
+
+        Args:
+            start: First date to include
+            end: Last date to include (defaults to start)
+
+        Returns:
+            Iterator of occurrences ordered by date, then task insertion order
+        """
+        end = start if end is None else end
+        streams = [task.occurrences(start, end) for task in self._tasks.values()]
+        return heapq.merge(*streams, key=TaskOccurrence.get_date)
+
+    def get_occurrences_on(self, on_date: date) -> List[TaskOccurrence]:
+        """
+        Get the occurrences of all tasks on one date
+
+        Args:
+            on_date: The date to list
+
+        Returns:
+            Occurrences in task insertion order
+        """
+        return [TaskOccurrence(task, on_date) for task in self._tasks.values() if task.occurs_on(on_date)]
 
     def get_total_duration(self, include_completed: bool = True) -> int:
         """
@@ -732,10 +1716,729 @@ class TaskManager:
             return sum(task.get_duration() for task in self._tasks.values() if not task.is_completed())
 
 
+class _KnapsackTable:
+    """
+    Exact 0/1 knapsack over task minutes: the best total score for every
+    budget from 0 to capacity.
+
+    Tasks with the same duration and score are interchangeable, so they are
+    grouped and each group is split into power-of-two bundles (bounded
+    knapsack). Only the best capacity // duration tasks of each duration can
+    ever be used, so the rest are dropped before the DP runs. The DP keeps
+    one row of best scores plus, per budget, the head of a persistent linked
+    list of the bundles used, so any budget's plan can be read back without
+    storing a full decision table.
+    """
+
+    def __init__(self, ranked_tasks: List[tuple[int, Task]], capacity: int):
+        """
+        Build the table
+
+        Args:
+            ranked_tasks: (score, task) pairs in planner rank order
+            capacity: Largest budget in minutes
+        """
+        self._capacity = capacity
+        self._rank = {task.get_task_id(): rank for rank, (_, task) in enumerate(ranked_tasks)}
+
+        # Keep the best capacity // duration tasks of each duration (score > 0 only)
+        by_duration: Dict[int, List[tuple[int, Task]]] = {}
+        for score, task in ranked_tasks:
+            duration = task.get_duration()
+            if score <= 0 or duration > capacity:
+                continue
+            kept = by_duration.setdefault(duration, [])
+            if len(kept) < capacity // duration:
+                kept.append((score, task))
+
+        # Group interchangeable tasks and split each group into bundles
+        self._groups: List[List[Task]] = []
+        group_index: Dict[tuple[int, int], int] = {}
+        for duration, kept in by_duration.items():
+            for score, task in kept:
+                key = (duration, score)
+                if key not in group_index:
+                    group_index[key] = len(self._groups)
+                    self._groups.append([])
+                self._groups[group_index[key]].append(task)
+
+        self._bundles: List[tuple[int, int]] = []  # (group, count)
+        weights = []
+        values = []
+        for (duration, score), group in group_index.items():
+            remaining = len(self._groups[group])
+            size = 1
+            while remaining > 0:
+                count = min(size, remaining)
+                self._bundles.append((group, count))
+                weights.append(duration * count)
+                values.append(score * count)
+                remaining -= count
+                size *= 2
+
+        if np is not None:
+            self._solve_vectorized(weights, values)
+        else:
+            self._solve(weights, values)
+
+    def _solve(self, weights: List[int], values: List[int]) -> None:
+        """Run the DP in pure Python"""
+        capacity = self._capacity
+        best = [0] * (capacity + 1)
+        used = [0] * (capacity + 1)
+        heads = [-1] * (capacity + 1)
+        node_bundle: List[int] = []
+        node_next: List[int] = []
+        for bundle, (weight, value) in enumerate(zip(weights, values)):
+            if weight > capacity:
+                continue
+            # Walk budgets downwards so each bundle is used at most once
+            for budget in range(capacity, weight - 1, -1):
+                candidate = best[budget - weight] + value
+                if candidate > best[budget]:
+                    best[budget] = candidate
+                    used[budget] = used[budget - weight] + weight
+                    node_bundle.append(bundle)
+                    node_next.append(heads[budget - weight])
+                    heads[budget] = len(node_bundle) - 1
+        self._best = best
+        self._used = used
+        self._heads = heads
+        self._node_bundle = node_bundle
+        self._node_next = node_next
+
+    def _solve_vectorized(self, weights: List[int], values: List[int]) -> None:
+        """Run the DP with one NumPy row operation per bundle"""
+        capacity = self._capacity
+        best = np.zeros(capacity + 1, dtype=np.int64)
+        used = np.zeros(capacity + 1, dtype=np.int64)
+        heads = np.full(capacity + 1, -1, dtype=np.int64)
+        bundle_chunks = []
+        next_chunks = []
+        node_count = 0
+        for bundle, (weight, value) in enumerate(zip(weights, values)):
+            if weight > capacity:
+                continue
+            candidate = best[:capacity + 1 - weight] + value
+            improved = np.flatnonzero(candidate > best[weight:])
+            if not improved.size:
+                continue
+            targets = improved + weight
+            # Read the previous row's list heads before overwriting any of them
+            next_chunks.append(heads[improved])
+            bundle_chunks.append(np.full(improved.size, bundle, dtype=np.int64))
+            best[targets] = candidate[improved]
+            used[targets] = used[improved] + weight
+            heads[targets] = np.arange(node_count, node_count + improved.size)
+            node_count += improved.size
+        self._best = best.tolist()
+        self._used = used.tolist()
+        self._heads = heads.tolist()
+        self._node_bundle = np.concatenate(bundle_chunks).tolist() if bundle_chunks else []
+        self._node_next = np.concatenate(next_chunks).tolist() if next_chunks else []
+
+    def best_score(self, budget: int) -> int:
+        """Best total score using at most budget minutes"""
+        return self._best[min(budget, self._capacity)]
+
+    def minutes_used(self, budget: int) -> int:
+        """Minutes used by the optimal plan for a budget"""
+        return self._used[min(budget, self._capacity)]
+
+    def select(self, budget: int) -> List[Task]:
+        """
+        Get the optimal task set for a budget
+
+        Returns:
+            Chosen tasks in planner rank order
+        """
+        counts: Dict[int, int] = {}
+        node = self._heads[min(budget, self._capacity)]
+        while node != -1:
+            group, count = self._bundles[self._node_bundle[node]]
+            counts[group] = counts.get(group, 0) + count
+            node = self._node_next[node]
+        # Interchangeable tasks: take the best-ranked ones of each group
+        chosen = [task for group, count in counts.items() for task in self._groups[group][:count]]
+        chosen.sort(key=lambda task: self._rank[task.get_task_id()])
+        return chosen
+
+
+class _FreeSlots:
+    """
+    Free minutes of one pet's day, kept as sorted disjoint [start, end)
+    intervals so reserving a slot is a bisect rather than a rescan of
+    everything already placed.
+
+    A max tree over the minutes of the day holds each free interval's
+    length at its start minute, so the nearest interval long enough for a
+    task is found in O(log minutes) without walking past shorter gaps.
+    """
+
+    DAY_MINUTES = 1440
+    _LEAVES = 2048  # power of two covering DAY_MINUTES
+
+    def __init__(self):
+        """Initialize with the whole day free"""
+        self._starts = [0]
+        self._ends = [self.DAY_MINUTES]
+        self._longest = [0] * (2 * self._LEAVES)  # node -> longest free interval starting in its range
+        self._set_length(0, self.DAY_MINUTES)
+
+    def _set_length(self, minute: int, length: int) -> None:
+        """Record the length of the free interval starting at a minute (0 for none)"""
+        tree = self._longest
+        i = minute + self._LEAVES
+        tree[i] = length
+        i //= 2
+        while i:
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+            i //= 2
+
+    def _last_fitting(self, minute: int, duration: int) -> int:
+        """Get the latest interval start at or before minute that fits duration, or -1"""
+        tree = self._longest
+        i = minute + self._LEAVES
+        if tree[i] >= duration:
+            return minute
+        while i > 1:
+            if i & 1 and tree[i - 1] >= duration:
+                i -= 1
+                while i < self._LEAVES:
+                    i = 2 * i + 1 if tree[2 * i + 1] >= duration else 2 * i
+                return i - self._LEAVES
+            i //= 2
+        return -1
+
+    def _first_fitting(self, minute: int, duration: int) -> int:
+        """Get the earliest interval start at or after minute that fits duration, or -1"""
+        if minute >= self._LEAVES:
+            return -1
+        tree = self._longest
+        i = minute + self._LEAVES
+        if tree[i] >= duration:
+            return minute
+        while i > 1:
+            if not i & 1 and tree[i + 1] >= duration:
+                i += 1
+                while i < self._LEAVES:
+                    i = 2 * i if tree[2 * i] >= duration else 2 * i + 1
+                return i - self._LEAVES
+            i //= 2
+        return -1
+
+    def nearest(self, start: int, duration: int) -> Optional[int]:
+        """
+        Find the free start minute closest to the requested one
+
+        Args:
+            start: Requested start minute
+            duration: Minutes the task needs
+
+        Returns:
+            Start minute of the closest free slot (earlier wins a tie), or
+            None if no free interval is long enough
+        """
+        start = min(max(start, 0), self.DAY_MINUTES - 1)
+        duration = max(duration, 1)
+        best: Optional[int] = None
+        # Closest candidate at or before the request: the last interval starting there that fits
+        i = self._last_fitting(start, duration)
+        if i >= 0:
+            best = max(i, min(start, i + self._longest[i + self._LEAVES] - duration))
+            if best == start:
+                return best
+        # Closest candidate after the request, if it beats the left one
+        j = self._first_fitting(start + 1, duration)
+        if j >= 0 and (best is None or j - start < start - best):
+            return j
+        return best
+
+    def reserve(self, start: int, end: int) -> None:
+        """Mark [start, end) as busy (clipped to the day)"""
+        start = max(start, 0)
+        end = min(end, self.DAY_MINUTES)
+        if start >= end:
+            return
+        starts, ends = self._starts, self._ends
+        first = bisect.bisect_right(ends, start)
+        last = bisect.bisect_left(starts, end)
+        if first >= last:
+            return
+        # Keep the parts of the first and last overlapping intervals outside [start, end)
+        pieces = []
+        if starts[first] < start:
+            pieces.append((starts[first], start))
+        if ends[last - 1] > end:
+            pieces.append((end, ends[last - 1]))
+        for k in range(first, last):
+            self._set_length(starts[k], 0)
+        for lo, hi in pieces:
+            self._set_length(lo, hi - lo)
+        starts[first:last] = [lo for lo, _ in pieces]
+        ends[first:last] = [hi for _, hi in pieces]
+
+
+class _StreamingGreedy:
+    """
+    Greedy plan over a stream of tasks that keeps only tasks that can still
+    be chosen.
+
+    A task of duration d can be dropped as soon as higher-ranked tasks of
+    duration <= d add up to more than budget - d: if they are all chosen,
+    fewer than d minutes are left when its turn comes, and if one of them
+    is not chosen, fewer than its duration (<= d) were left at that point.
+    Dropped tasks are never chosen, so they never change the other
+    decisions. Candidates are pruned with one rank-order sweep over a
+    Fenwick tree indexed by duration whenever their count doubles.
+
+    At most budget / d candidates of each duration d survive a sweep, so
+    the candidates are bounded by the budget (budget * H(budget), about
+    1,450 for a 240-minute day) however long the stream is.
+    """
+
+    # Candidates collected before the first sweep
+    MIN_CAPACITY = 1024
+
+    def __init__(self, budget: int):
+        """
+        Initialize an empty stream
+
+        Args:
+            budget: Available minutes
+        """
+        self._budget = budget
+        self._entries: List[tuple[int, int, int, Task]] = []  # (-score, arrival, duration, task)
+        self._capacity = self.MIN_CAPACITY
+        self._seen = 0
+        self._peak = 0
+
+    def add(self, score: int, task: Task) -> None:
+        """Offer the next task of the stream with its score"""
+        duration = task.get_duration()
+        self._seen += 1
+        if duration > self._budget:
+            return
+        # Arrival order breaks score ties, as in DailyPlanner._rank_tasks
+        self._entries.append((-score, self._seen, duration, task))
+        if len(self._entries) >= self._capacity:
+            self._prune()
+            self._capacity = max(self.MIN_CAPACITY, 2 * len(self._entries))
+
+    def _prune(self) -> None:
+        """Sort the candidates into rank order and drop the ones that can no longer fit"""
+        entries = self._entries
+        self._peak = max(self._peak, len(entries))
+        entries.sort()
+        budget = self._budget
+        tree = [0] * (budget + 1)  # Fenwick tree: minutes of kept tasks by duration
+        kept = []
+        for entry in entries:
+            duration = entry[2]
+            above, i = 0, duration
+            while i:
+                above += tree[i]
+                i &= i - 1
+            if above > budget - duration:
+                continue
+            kept.append(entry)
+            i = duration
+            while i <= budget:
+                tree[i] += duration
+                i += i & -i
+        self._entries = kept
+
+    def selected(self) -> List[Task]:
+        """
+        Finish the stream and run the greedy pass over the candidates
+
+        Returns:
+            Chosen tasks in rank order
+        """
+        self._prune()
+        remaining = self._budget
+        selected = []
+        for _, _, duration, task in self._entries:
+            if duration <= remaining:
+                selected.append(task)
+                remaining -= duration
+        return selected
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of tasks seen, the most candidates held at once and the candidates left"""
+        return {'seen': self._seen, 'candidates_peak': max(self._peak, len(self._entries)),
+                'candidates': len(self._entries)}
+
+
+class _IncrementalGreedy:
+    """
+    Greedy plan state that can be repaired after a single task changes.
+
+    Tasks are kept sorted by (-score, insertion order), the planner's rank,
+    together with each task's greedy decision and the minutes left just
+    before it was decided. When one task is added, removed or rescored, the
+    decisions are replayed from its position only until the minutes left
+    match the old run again; past that point every decision is unchanged.
+
+    The state is parallel Python lists, so an update still costs O(n) for
+    the insert and delete shifts (a memmove, cheap next to rescoring every
+    task) plus O(k log n) for the k replayed decisions. selected() is
+    O(plan size); excluded() is O(n), as is the copy generate_plan keeps of
+    its result.
+    """
+
+    def __init__(
+        self,
+        ranked_tasks: List[tuple[int, Task]],
+        rank_of: Callable[[str], Optional[int]],
+        budget: int,
+        preferred_types: Set[str],
+        avoided_types: Set[str]
+    ):
+        """
+        Build the state with one full greedy pass
+
+        Args:
+            ranked_tasks: (score, task) pairs in planner rank order
+            rank_of: The manager's get_insertion_rank
+            budget: Available minutes
+            preferred_types: Task types that get the preference bonus
+            avoided_types: Task types that get the penalty
+        """
+        self.budget = budget
+        self.preferred_types = preferred_types
+        self.avoided_types = avoided_types
+        self._keys = [(-score, rank_of(task.get_task_id()), task.get_task_id()) for score, task in ranked_tasks]
+        self._tasks = [task for _, task in ranked_tasks]
+        self._durations = [task.get_duration() for task in self._tasks]
+        self._chosen = [False] * len(self._keys)
+        self._remaining_before: List[Optional[int]] = [None] * len(self._keys)
+        self._key_of = {key[2]: key for key in self._keys}
+        self._selected: List[tuple[int, int, str]] = []  # sorted keys of chosen tasks
+        self._task_by_id = {task.get_task_id(): task for task in self._tasks}
+        self._replay(0, len(self._keys))
+
+    def score(self, task: Task) -> int:
+        """Score a task like DailyPlanner._rank_tasks"""
+        score = task.get_priority()
+        if task.get_task_type() in self.preferred_types:
+            score += 10
+        if task.get_task_type() in self.avoided_types:
+            score -= 5
+        return score
+
+    def update(self, task_id: str, task: Optional[Task], seq: Optional[int] = None) -> None:
+        """
+        Apply one task change and repair the decisions (O(n) list shifts
+        plus O(k log n) for the k decisions replayed)
+
+        Args:
+            task_id: The task that changed
+            task: The task's current state, or None if it was deleted
+            seq: The task's insertion order (needed when task is given)
+        """
+        old_pos = None
+        old_key = self._key_of.get(task_id)
+        if old_key is not None:
+            old_pos = bisect.bisect_left(self._keys, old_key)
+            if (task is not None and old_key[0] == -self.score(task)
+                    and self._durations[old_pos] == task.get_duration()):
+                return  # Rank and duration unchanged, so is every decision
+            if self._chosen[old_pos]:
+                del self._selected[bisect.bisect_left(self._selected, old_key)]
+            for column in (self._keys, self._tasks, self._durations, self._chosen, self._remaining_before):
+                del column[old_pos]
+            del self._key_of[task_id]
+            del self._task_by_id[task_id]
+
+        new_pos = None
+        if task is not None:
+            key = (-self.score(task), seq, task_id)
+            new_pos = bisect.bisect_left(self._keys, key)
+            self._keys.insert(new_pos, key)
+            self._tasks.insert(new_pos, task)
+            self._durations.insert(new_pos, task.get_duration())
+            self._chosen.insert(new_pos, False)
+            self._remaining_before.insert(new_pos, None)
+            self._key_of[task_id] = key
+            self._task_by_id[task_id] = task
+
+        if old_pos is None and new_pos is None:
+            return
+        # Entries from resync_from on are the same tasks, in the same order, as in the old run
+        if new_pos is None:
+            start = resync_from = old_pos
+        elif old_pos is None:
+            start, resync_from = new_pos, new_pos + 1
+        else:
+            shifted_old = old_pos + 1 if new_pos <= old_pos else old_pos
+            start = min(new_pos, shifted_old)
+            resync_from = max(new_pos + 1, shifted_old)
+        self._replay(start, resync_from)
+
+    def _replay(self, start: int, resync_from: int) -> None:
+        """Re-decide entries from start until the state matches the old run"""
+        if start == 0:
+            remaining = self.budget
+        else:
+            remaining = self._remaining_before[start - 1]
+            if self._chosen[start - 1]:
+                remaining -= self._durations[start - 1]
+
+        for i in range(start, len(self._keys)):
+            if i >= resync_from and remaining == self._remaining_before[i]:
+                break
+            self._remaining_before[i] = remaining
+            fits = self._durations[i] <= remaining
+            if fits != self._chosen[i]:
+                self._chosen[i] = fits
+                if fits:
+                    bisect.insort(self._selected, self._keys[i])
+                else:
+                    del self._selected[bisect.bisect_left(self._selected, self._keys[i])]
+            if fits:
+                remaining -= self._durations[i]
+
+    def selected(self) -> List[Task]:
+        """Chosen tasks in rank order (O(plan size))"""
+        return [self._task_by_id[task_id] for _, _, task_id in self._selected]
+
+    def excluded(self) -> List[Task]:
+        """Tasks that did not fit, in rank order (O(n): rebuilt from the decisions on each call)"""
+        return list(compress(self._tasks, map(operator.not_, self._chosen)))
+
+
+class BudgetPlans:
+    """
+    Optimal plans for every available time from 0 to max_budget minutes,
+    computed in one pass by DailyPlanner.plan_for_all_budgets().
+
+    Holds a single knapsack table, so switching budgets needs no
+    recomputation: plan_for(budget) rebuilds a plan in O(plan size).
+    """
+
+    def __init__(self, table: _KnapsackTable, max_budget: int, sort_by_time: bool = False):
+        """
+        Initialize BudgetPlans
+
+        Args:
+            table: Knapsack table built for max_budget
+            max_budget: Largest budget covered
+            sort_by_time: If True, plans are returned sorted by scheduled time
+        """
+        self._table = table
+        self._max_budget = max_budget
+        self._sort_by_time = sort_by_time
+
+    def get_max_budget(self) -> int:
+        """Get the largest budget covered"""
+        return self._max_budget
+
+    def _check_budget(self, budget: int) -> None:
+        """
+        Raises:
+            ValueError: If budget is outside 0..max_budget
+        """
+        if not 0 <= budget <= self._max_budget:
+            raise ValueError(f"Budget must be between 0 and {self._max_budget} minutes")
+
+    def plan_for(self, budget: int) -> List[Task]:
+        """
+        Get the optimal plan for an available time
+
+        Args:
+            budget: Available time in minutes
+
+        Returns:
+            Scheduled tasks in score order, or by time if requested
+        """
+        self._check_budget(budget)
+        plan = self._table.select(budget)
+        if self._sort_by_time:
+            plan.sort(key=lambda t: t.get_start_minute())
+        return plan
+
+    def score_for(self, budget: int) -> int:
+        """Get the best total score for an available time"""
+        self._check_budget(budget)
+        return self._table.best_score(budget)
+
+    def minutes_for(self, budget: int) -> int:
+        """Get the minutes the optimal plan uses for an available time"""
+        self._check_budget(budget)
+        return self._table.minutes_used(budget)
+
+    def utilization_curve(self) -> List[float]:
+        """
+        Get the time utilization (percent) of the optimal plan for every budget
+
+        Returns:
+            List indexed by budget in minutes (budget 0 reports 0)
+        """
+        return [
+            (self._table.minutes_used(budget) / budget * 100) if budget else 0
+            for budget in range(self._max_budget + 1)
+        ]
+
+
+def page_bounds(total: int, page: int, page_size: int) -> tuple[int, int, int]:
+    """
+    Get the slice of rows shown on a page
+
+    Args:
+        total: Number of rows
+        page: Page number starting at 1 (clamped to the valid range)
+        page_size: Rows per page
+
+    Returns:
+        Tuple (start, end, page_count) with rows[start:end] on the page
+
+    Raises:
+        ValueError: If page_size is not positive
+    """
+    if page_size <= 0:
+        raise ValueError("Page size must be positive")
+    page_count = max(1, -(-total // page_size))
+    page = min(max(page, 1), page_count)
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total), page_count
+
+
+class PlanTrace:
+    """
+    The decisions optimize_schedule made for one plan, in rank order.
+
+    Each decision is stored as a compact tuple (task, priority, score,
+    reason code, minutes); the text of a decision is only built when a page
+    of the trace is rendered. Recorded by DailyPlanner while explanations
+    are enabled (see DailyPlanner.enable_explanations).
+    """
+
+    FIT = "fit"                    # selected: fits, minutes = time left after it
+    NO_FIT = "no_fit"              # excluded: minutes = time left when it was reached
+    BEST = "best"                  # selected: part of the best-scoring combination
+    NOT_BEST = "not_best"          # excluded: the best combination leaves it out
+    NON_POSITIVE = "non_positive"  # excluded: optimal mode never picks a score <= 0
+    TOO_LONG = "too_long"          # excluded: minutes = available time
+
+    _SELECTED = frozenset({FIT, BEST})
+
+    _BONUS_TEXT = {10: " +10 preferred", -5: " -5 avoided", 5: " +10 preferred -5 avoided"}
+
+    def __init__(self, mode: str, available_time: int):
+        """
+        Initialize an empty trace
+
+        Args:
+            mode: Planning mode that produced the decisions
+            available_time: Time budget in minutes
+        """
+        self._mode = mode
+        self._available_time = available_time
+        self._decisions: List[tuple] = []
+        self._unplaced: Set[str] = set()
+        self._placements: Dict[str, int] = {}
+
+    def add(self, task: Task, score: int, reason: str, minutes: int = 0) -> None:
+        """Record one decision"""
+        self._decisions.append((task, task.get_priority(), score, reason, minutes))
+
+    def set_placements(self, placements: Dict[str, int], unplaced: List[Task]) -> None:
+        """Record the start times given to selected tasks and the ones with no free slot"""
+        self._placements = placements
+        self._unplaced = {task.get_task_id() for task in unplaced}
+
+    def get_mode(self) -> str:
+        """Get the planning mode that produced the decisions"""
+        return self._mode
+
+    def __len__(self) -> int:
+        """Number of decisions"""
+        return len(self._decisions)
+
+    def is_selected(self, index: int) -> bool:
+        """Check whether a decision kept its task in the final plan"""
+        task, _, _, reason, _ = self._decisions[index]
+        return reason in self._SELECTED and task.get_task_id() not in self._unplaced
+
+    def reason(self, index: int) -> str:
+        """
+        Describe why a task was selected or excluded
+
+        Args:
+            index: Decision index in rank order
+
+        Returns:
+            Text such as "did not fit: 25 min left"
+        """
+        task, _, score, reason, minutes = self._decisions[index]
+        task_id = task.get_task_id()
+        if task_id in self._unplaced:
+            return "dropped: no free slot for this pet that day"
+        if reason == self.FIT:
+            text = f"selected: fits, {minutes} min left after it"
+        elif reason == self.BEST:
+            text = "selected: part of the best-scoring combination"
+        elif reason == self.NO_FIT:
+            return f"did not fit: {minutes} min left"
+        elif reason == self.TOO_LONG:
+            return f"did not fit: longer than the {minutes} min available"
+        elif reason == self.NON_POSITIVE:
+            return f"excluded: score {score} is not positive"
+        else:
+            return "excluded: a higher total score without it"
+        start = self._placements.get(task_id)
+        if start is not None and start != task.get_start_minute():
+            text += f", moved to {start // 60:02d}:{start % 60:02d}"
+        return text
+
+    def describe(self, index: int) -> str:
+        """
+        Render one decision as a line
+
+        Args:
+            index: Decision index in rank order
+
+        Returns:
+            Task, score components and reason
+        """
+        task, priority, score, _, _ = self._decisions[index]
+        return (f"{task.get_task_name()} [{task.get_task_type()}] "
+                f"{task.get_duration()} min, score {score} = priority {priority}"
+                f"{self._BONUS_TEXT.get(score - priority, '')}: {self.reason(index)}")
+
+    def render(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """
+        Render a slice of the decisions
+
+        Args:
+            start: First decision index
+            stop: Index after the last decision (defaults to the end)
+
+        Returns:
+            One numbered line per decision
+        """
+        return [f"{index + 1}. {self.describe(index)}"
+                for index in range(*slice(start, stop).indices(len(self._decisions)))]
+
+
 class DailyPlanner:
     """Generates optimized daily care plans using AI"""
 
-    def __init__(self, pet: Pet, task_manager: TaskManager, buffer_minutes: int = 5):
+    # Largest available time covered by plan_for_all_budgets (one day)
+    MAX_BUDGET = 1440
+
+    PLANNING_MODES = ("greedy", "optimal")
+
+    _MODE_TEXT = {
+        "greedy": "highest score first, while each task still fits the available time",
+        "optimal": "the highest total score that fits the available time",
+    }
+
+    # Task count from which optimize_schedule scores with NumPy (when installed)
+    VECTORIZE_MIN_TASKS = 2000
+
+    def __init__(self, pet: Pet, task_manager: TaskManager, buffer_minutes: int = 5, cache_size: int = 32):
         """
         Initialize DailyPlanner
 
@@ -743,6 +2446,7 @@ class DailyPlanner:
             pet: The Pet object
             task_manager: The TaskManager containing all tasks
             buffer_minutes: Minutes of buffer time to add between consecutive tasks
+            cache_size: Number of generated plans to keep (0 disables the plan cache)
         """
         self._pet = pet
         self._task_manager = task_manager
@@ -752,6 +2456,21 @@ class DailyPlanner:
         self._excluded_tasks: List[Task] = []
         self._buffer_minutes = buffer_minutes
         self._conflicts: List[tuple[Task, Task]] = []
+        self._mode = "greedy"
+        self._ranked_tasks: List[tuple[int, Task]] = []  # (score, task) from the last optimization
+        self._placements: Dict[str, int] = {}  # task_id -> placed start minute
+        self._plan_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # LRU, most recent last
+        self._cache_size = cache_size
+        self._cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._incremental: Optional[_IncrementalGreedy] = None
+        self._incremental_enabled = False
+        self._verify_incremental = False
+        self._optimal_score: Optional[int] = None
+        self._optimality: Dict[str, Any] = {}  # gap of the last plan, filled on request and shared with its cache entry
+        self._plan_date: Optional[date] = None
+        self._explain = False
+        self._plan_trace: Optional[PlanTrace] = None
+        self._stream_stats: Dict[str, int] = {}
 
     def set_available_time(self, time: int) -> None:
         """
@@ -767,6 +2486,25 @@ class DailyPlanner:
             raise ValueError("Available time cannot be negative")
         self._available_time = time
 
+    def set_plan_date(self, plan_date: Optional[date]) -> None:
+        """
+        Plan the task occurrences on one date instead of the stored tasks
+
+        Args:
+            plan_date: Date to plan, or None to plan every stored task
+        """
+        self._plan_date = plan_date
+
+    def get_plan_date(self) -> Optional[date]:
+        """Get the date being planned, or None when planning every stored task"""
+        return self._plan_date
+
+    def _candidate_tasks(self) -> List[Task]:
+        """Get the tasks to plan: the plan date's occurrences, or every stored task"""
+        if self._plan_date is not None:
+            return self._task_manager.get_occurrences_on(self._plan_date)
+        return self._task_manager.get_all_tasks()
+
     def set_preferences(self, preferences: Dict[str, Any]) -> None:
         """
         Set owner preferences for scheduling
@@ -776,29 +2514,271 @@ class DailyPlanner:
         """
         self._preferences = preferences
 
-    def generate_plan(self) -> List[Task]:
+    def generate_plan(self, mode: str = "greedy") -> List[Task]:
         """
         Generate an optimized daily care plan based on available tasks,
         time constraints, and preferences
 
+        Args:
+            mode: "greedy" (highest score first) or "optimal" (maximum total
+                score that fits the available time)
+
         Returns:
             List of scheduled tasks in optimal order
 
         Raises:
-            ValueError: If available_time is not set
+            ValueError: If available_time is not set or mode is unknown
         """
         if self._available_time is None:
             raise ValueError("Available time must be set before generating a plan")
 
-        # Get all tasks and optimize them
-        optimized_tasks = self.optimize_schedule()
+        # Reuse the plan if nothing changed since it was generated
+        cache_key = self._plan_cache_key(mode)
+        if cache_key is not None and cache_key in self._plan_cache:
+            self._plan_cache.move_to_end(cache_key)
+            self._cache_stats['hits'] += 1
+            self._restore_plan(self._plan_cache[cache_key])
+            return list(self._last_plan)
+        self._cache_stats['misses'] += 1
+
+        # Get all tasks and optimize them (the incremental state keeps no per-decision trace)
+        if self._incremental_enabled and mode == "greedy" and self._plan_date is None and not self._explain:
+            optimized_tasks = self._optimize_incrementally()
+        else:
+            optimized_tasks = self.optimize_schedule(mode)
+
+        # Give every chosen task a start time; tasks that cannot be placed are dropped
+        self._placements, unplaced = self._place_tasks(optimized_tasks)
+        if self._plan_trace is not None:
+            self._plan_trace.set_placements(self._placements, unplaced)
+        if unplaced:
+            optimized_tasks = [task for task in optimized_tasks if task.get_task_id() in self._placements]
+            self._excluded_tasks.extend(unplaced)
 
         # Store the plan for explanation
         self._last_plan = optimized_tasks
 
+        if cache_key is not None and self._cache_size > 0:
+            self._plan_cache[cache_key] = self._snapshot_plan()
+            if len(self._plan_cache) > self._cache_size:
+                self._plan_cache.popitem(last=False)
+                self._cache_stats['evictions'] += 1
+
         return optimized_tasks
 
-    def optimize_schedule(self) -> List[Task]:
+    @classmethod
+    def _freeze(cls, value: Any) -> Any:
+        """Turn nested preference values into a hashable form"""
+        if isinstance(value, dict):
+            return tuple(sorted((key, cls._freeze(item)) for key, item in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(item) for item in value)
+        if isinstance(value, (set, frozenset)):
+            return frozenset(value)
+        return value
+
+    def _plan_cache_key(self, mode: str) -> Optional[tuple]:
+        """
+        Build the plan cache key from everything a plan depends on
+
+        Returns:
+            The key, or None if the preferences cannot be hashed
+        """
+        if self._cache_size <= 0:
+            return None
+        key = (
+            self._task_manager.get_version(),
+            self._available_time,
+            self._freeze(self._preferences),
+            (self._pet.get_name(), self._pet.get_animal_type(), self._pet.get_age()),
+            mode,
+            self._plan_date,
+            self._explain
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _snapshot_plan(self) -> tuple:
+        """Capture the planner state produced by generate_plan"""
+        return (tuple(self._last_plan), tuple(self._excluded_tasks), dict(self._placements),
+                tuple(self._ranked_tasks), self._optimal_score, self._optimality, self._mode, self._plan_trace)
+
+    def _restore_plan(self, snapshot: tuple) -> None:
+        """Restore planner state captured by _snapshot_plan"""
+        plan, excluded, placements, ranked, optimal_score, optimality, mode, plan_trace = snapshot
+        self._last_plan = list(plan)
+        self._excluded_tasks = list(excluded)
+        self._placements = dict(placements)
+        self._ranked_tasks = list(ranked)
+        self._optimal_score = optimal_score
+        self._optimality = optimality
+        self._mode = mode
+        self._plan_trace = plan_trace
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Get plan cache counters for sizing the cache
+
+        Returns:
+            Dictionary with hits, misses, evictions, size and max_size
+        """
+        return {**self._cache_stats, 'size': len(self._plan_cache), 'max_size': self._cache_size}
+
+    def clear_cache(self) -> None:
+        """Drop all cached plans (counters are kept)"""
+        self._plan_cache.clear()
+
+    def enable_incremental(self, verify: bool = False) -> None:
+        """
+        Keep the greedy plan up to date as tasks change instead of
+        re-scoring and re-sorting every task on each generate_plan.
+
+        Args:
+            verify: If True, every incremental result is checked against a
+                full rebuild and a mismatch raises RuntimeError
+        """
+        self._incremental_enabled = True
+        self._verify_incremental = verify
+        self._task_manager.subscribe(self._on_task_event)
+
+    def disable_incremental(self) -> None:
+        """Stop incremental replanning and drop its state"""
+        self._incremental_enabled = False
+        self._incremental = None
+        self._task_manager.unsubscribe(self._on_task_event)
+
+    def enable_explanations(self) -> None:
+        """
+        Record a PlanTrace of every selection decision from the next plan on,
+        for explain_plan. Greedy plans then always use the scoring loop
+        (not the vectorized or incremental paths), so this costs some speed
+        on large task lists.
+        """
+        self._explain = True
+
+    def disable_explanations(self) -> None:
+        """Stop recording decisions and drop the current trace"""
+        self._explain = False
+        self._plan_trace = None
+
+    def get_plan_trace(self) -> Optional[PlanTrace]:
+        """Get the decisions behind the last plan, or None if they were not recorded"""
+        return self._plan_trace
+
+    def _on_task_event(self, event: str, task: Task) -> None:
+        """Repair the incremental plan after a task mutation"""
+        if self._incremental is None:
+            return
+        task_id = task.get_task_id()
+        if event == "deleted":
+            self._incremental.update(task_id, None)
+        else:
+            self._incremental.update(task_id, task, self._task_manager.get_insertion_rank(task_id))
+
+    def _optimize_incrementally(self) -> List[Task]:
+        """
+        Read the greedy plan from the incremental state, building it first
+        if the budget or preferences changed
+
+        Returns:
+            Selected tasks, like optimize_schedule("greedy")
+
+        Raises:
+            RuntimeError: In verify mode, if the result differs from a full rebuild
+        """
+        preferred_types = set(self._preferences.get('preferred_task_types', []))
+        avoided_types = set(self._preferences.get('avoided_task_types', []))
+        engine = self._incremental
+        if (engine is None or engine.budget != self._available_time
+                or engine.preferred_types != preferred_types or engine.avoided_types != avoided_types):
+            ranked = self._rank_tasks(self._task_manager.get_all_tasks(), preferred_types, avoided_types)
+            engine = _IncrementalGreedy(ranked, self._task_manager.get_insertion_rank, self._available_time,
+                                        preferred_types, avoided_types)
+            self._incremental = engine
+
+        self._mode = "greedy"
+        self._ranked_tasks = []
+        self._optimal_score = None
+        self._optimality = {}
+        self._plan_trace = None
+        selected_tasks = engine.selected()
+        self._excluded_tasks = engine.excluded()
+
+        if self._verify_incremental:
+            expected = self._select_greedy(self._task_manager.get_all_tasks(), preferred_types, avoided_types)
+            if (selected_tasks, self._excluded_tasks) != expected:
+                raise RuntimeError("Incremental plan differs from a full rebuild")
+
+        if self._preferences.get('sort_by_time', False):
+            selected_tasks.sort(key=lambda t: t.get_start_minute())
+        return selected_tasks
+
+    def _place_tasks(self, tasks: List[Task]) -> tuple[Dict[str, int], List[Task]]:
+        """
+        Assign a start minute to each task, best-ranked first.
+
+        A task starts at its requested time when that is free for its pet;
+        otherwise it moves to the nearest free slot. Every placed task keeps
+        buffer_minutes clear on both sides for the same pet, so tasks for
+        one pet never run back to back. Tasks with no pet_id are placed
+        independently of every other task, as they are for conflicts.
+
+        Args:
+            tasks: Tasks in placement order
+
+        Returns:
+            Tuple (placements, unplaced) where placements maps task_id to
+            start minute and unplaced lists tasks with no free slot that day
+        """
+        free_by_pet: Dict[str, _FreeSlots] = {}
+        placements: Dict[str, int] = {}
+        unplaced: List[Task] = []
+        for task in tasks:
+            pet_id = task.get_pet_id()
+            # Tasks without a pet are not known to share one, so each gets a day of its own
+            free = free_by_pet.get(pet_id) if pet_id is not None else None
+            if free is None:
+                free = _FreeSlots()
+                if pet_id is not None:
+                    free_by_pet[pet_id] = free
+            requested = task.get_start_minute()
+            start = free.nearest(requested, task.get_duration())
+            if start is None:
+                unplaced.append(task)
+                continue
+            placements[task.get_task_id()] = start
+            free.reserve(start - self._buffer_minutes, start + task.get_duration() + self._buffer_minutes)
+        return placements, unplaced
+
+    def get_scheduled_time(self, task: Task) -> Optional[str]:
+        """
+        Get the start time the last plan assigned to a task
+
+        Args:
+            task: A task from the last plan
+
+        Returns:
+            Start time as HH:MM, or None if the task is not in the plan
+        """
+        start = self._placements.get(task.get_task_id())
+        if start is None:
+            return None
+        return f"{start // 60:02d}:{start % 60:02d}"
+
+    def get_schedule(self) -> List[tuple[str, Task]]:
+        """
+        Get the last plan as a timetable
+
+        Returns:
+            List of (start time HH:MM, task) sorted by assigned start
+        """
+        timetable = sorted(self._last_plan, key=lambda t: self._placements[t.get_task_id()])
+        return [(self.get_scheduled_time(task), task) for task in timetable]
+
+    def optimize_schedule(self, mode: str = "greedy") -> List[Task]:
         """
         Optimize the schedule based on constraints and priorities.
         Uses a greedy algorithm considering:
@@ -807,62 +2787,331 @@ class DailyPlanner:
         - User preferences for task types
         - Task duration fitting
 
+        With mode="optimal" the tasks are instead chosen by an exact
+        knapsack over minutes, maximizing the total score that fits the
+        available time. Tasks with a score of zero or less are never chosen
+        in that mode.
+
+        Args:
+            mode: "greedy" or "optimal"
+
         Returns:
             Optimized list of tasks that fit within time constraints
+
+        Raises:
+            ValueError: If mode is unknown
         """
-        all_tasks = self._task_manager.get_all_tasks()
+        if mode not in self.PLANNING_MODES:
+            raise ValueError(f"Unknown planning mode '{mode}'. Expected one of {', '.join(self.PLANNING_MODES)}")
+        self._mode = mode
+        self._ranked_tasks = []
+        self._optimal_score = None
+        self._optimality = {}
+        self._plan_trace = PlanTrace(mode, self._available_time or 0) if self._explain else None
+
+        all_tasks = self._candidate_tasks()
 
         if not all_tasks:
             self._excluded_tasks = []
             return []
 
         # Get preference settings
-        preferred_types = self._preferences.get('preferred_task_types', [])
-        avoided_types = self._preferences.get('avoided_task_types', [])
+        preferred_types = set(self._preferences.get('preferred_task_types', []))
+        avoided_types = set(self._preferences.get('avoided_task_types', []))
+
+        if mode == "optimal":
+            selected_tasks, self._excluded_tasks = self._select_optimal(
+                all_tasks, preferred_types, avoided_types)
+        elif np is not None and len(all_tasks) >= self.VECTORIZE_MIN_TASKS and self._plan_trace is None:
+            selected_tasks, self._excluded_tasks = self._select_vectorized(
+                all_tasks, preferred_types, avoided_types)
+        else:
+            selected_tasks, self._excluded_tasks = self._select_greedy(
+                all_tasks, preferred_types, avoided_types)
+
+        # Sort selected tasks by time if specified, otherwise keep priority order
+        if self._preferences.get('sort_by_time', False):
+            selected_tasks.sort(key=lambda t: t.get_start_minute())
+
+        return selected_tasks
+
+    def _select_greedy(
+        self,
+        tasks: List[Task],
+        preferred_types: Set[str],
+        avoided_types: Set[str]
+    ) -> tuple[List[Task], List[Task]]:
+        """
+        Score tasks and pick them greedily in a Python loop
+
+        Returns:
+            Tuple (selected_tasks, excluded_tasks), both in score order
+        """
+        scored_tasks = self._rank_tasks(tasks, preferred_types, avoided_types)
+        self._ranked_tasks = scored_tasks
+
+        # Select tasks that fit within available time using greedy approach
+        selected_tasks = []
+        excluded_tasks = []
+        total_time = 0
+        trace = self._plan_trace
 
+        for score, task in scored_tasks:
+            if self._available_time is not None and total_time + task.get_duration() <= self._available_time:
+                selected_tasks.append(task)
+                total_time += task.get_duration()
+                if trace is not None:
+                    trace.add(task, score, PlanTrace.FIT, self._available_time - total_time)
+            else:
+                excluded_tasks.append(task)
+                if trace is not None:
+                    trace.add(task, score, PlanTrace.NO_FIT, (self._available_time or 0) - total_time)
+
+        return selected_tasks, excluded_tasks
+
+    def _rank_tasks(
+        self,
+        tasks: List[Task],
+        preferred_types: Set[str],
+        avoided_types: Set[str]
+    ) -> List[tuple[int, Task]]:
+        """
+        Score tasks and sort them best first (ties keep insertion order)
+
+        Returns:
+            List of (score, task) pairs
+        """
         # Score each task based on priority and preferences
         scored_tasks = []
-        for task in all_tasks:
+        for task in tasks:
             score = task.get_priority()
 
             # Boost score for preferred task types
-            if preferred_types and task.get_task_type() in preferred_types:
+            if task.get_task_type() in preferred_types:
                 score += 10
 
             # Penalize avoided task types
-            if avoided_types and task.get_task_type() in avoided_types:
+            if task.get_task_type() in avoided_types:
                 score -= 5
 
             scored_tasks.append((score, task))
 
         # Sort by score (descending) - higher scores first
         scored_tasks.sort(key=lambda x: x[0], reverse=True)
+        return scored_tasks
 
-        # Select tasks that fit within available time using greedy approach
-        selected_tasks = []
-        total_time = 0
-        self._excluded_tasks = []
+    def _select_optimal(
+        self,
+        tasks: List[Task],
+        preferred_types: Set[str],
+        avoided_types: Set[str]
+    ) -> tuple[List[Task], List[Task]]:
+        """
+        Pick the set of tasks with the highest total score that fits
 
-        for score, task in scored_tasks:
-            if self._available_time is not None and total_time + task.get_duration() <= self._available_time:
-                selected_tasks.append(task)
-                total_time += task.get_duration()
-            else:
-                self._excluded_tasks.append(task)
+        Returns:
+            Tuple (selected_tasks, excluded_tasks), both in score order
+        """
+        ranked = self._rank_tasks(tasks, preferred_types, avoided_types)
+        self._ranked_tasks = ranked
+        budget = self._available_time or 0
+        table = _KnapsackTable(ranked, budget)
+        self._optimal_score = table.best_score(budget)
+
+        selected_tasks = table.select(budget)
+        chosen_ids = {task.get_task_id() for task in selected_tasks}
+        excluded_tasks = [task for _, task in ranked if task.get_task_id() not in chosen_ids]
+
+        trace = self._plan_trace
+        if trace is not None:
+            for score, task in ranked:
+                if task.get_task_id() in chosen_ids:
+                    trace.add(task, score, PlanTrace.BEST)
+                elif score <= 0:
+                    trace.add(task, score, PlanTrace.NON_POSITIVE)
+                elif task.get_duration() > budget:
+                    trace.add(task, score, PlanTrace.TOO_LONG, budget)
+                else:
+                    trace.add(task, score, PlanTrace.NOT_BEST)
+        return selected_tasks, excluded_tasks
 
-        # Sort selected tasks by time if specified, otherwise keep priority order
-        if self._preferences.get('sort_by_time', False):
-            selected_tasks.sort(key=lambda t: t.get_time())
+    def optimize_stream(self, tasks: Iterable[Task]) -> List[Task]:
+        """
+        Pick the greedy plan from any iterable of tasks without holding it
+        in memory. Gives the same tasks as optimize_schedule("greedy") over
+        the same tasks in the same order, but only tasks that can still fit
+        are kept, so memory is bounded by the available time, not by the
+        number of tasks. Does not change the last generated plan.
+
+        Args:
+            tasks: Tasks or occurrences to plan, e.g. a manager's iter_tasks()
+                or iter_occurrences(day, day)
 
+        Returns:
+            Selected tasks in score order, or by time if requested
+
+        Raises:
+            ValueError: If available_time is not set
+        """
+        if self._available_time is None:
+            raise ValueError("Available time must be set before generating a plan")
+        preferred_types = set(self._preferences.get('preferred_task_types', []))
+        avoided_types = set(self._preferences.get('avoided_task_types', []))
+
+        engine = _StreamingGreedy(self._available_time)
+        for task in tasks:
+            # Same scoring as _rank_tasks
+            score = task.get_priority()
+            task_type = task.get_task_type()
+            if task_type in preferred_types:
+                score += 10
+            if task_type in avoided_types:
+                score -= 5
+            engine.add(score, task)
+
+        selected_tasks = engine.selected()
+        self._stream_stats = {**engine.get_stats(), 'selected': len(selected_tasks)}
+        if self._preferences.get('sort_by_time', False):
+            selected_tasks.sort(key=lambda t: t.get_start_minute())
         return selected_tasks
 
-    def explain_plan(self) -> str:
+    def get_stream_stats(self) -> Dict[str, int]:
+        """
+        Get counters of the last optimize_stream call
+
+        Returns:
+            Dictionary with seen, candidates_peak, candidates and selected
+        """
+        return dict(self._stream_stats)
+
+    def plan_for_all_budgets(self) -> BudgetPlans:
+        """
+        Compute the optimal plan for every available time from 0 to
+        MAX_BUDGET minutes in a single pass, using the current preferences.
+        Does not change the last generated plan.
+
+        Returns:
+            BudgetPlans that rebuilds the plan for any budget on demand
+        """
+        preferred_types = set(self._preferences.get('preferred_task_types', []))
+        avoided_types = set(self._preferences.get('avoided_task_types', []))
+        ranked = self._rank_tasks(self._candidate_tasks(), preferred_types, avoided_types)
+        table = _KnapsackTable(ranked, self.MAX_BUDGET)
+        return BudgetPlans(table, self.MAX_BUDGET, self._preferences.get('sort_by_time', False))
+
+    def get_optimality_gap(self) -> Dict[str, Any]:
+        """
+        Compare the last plan's total score with the best achievable score
+
+        Outside optimal mode this solves the knapsack over every candidate
+        task (O(n * available_time)), so it is computed on the first call
+        after generate_plan and kept with the plan, including in the plan
+        cache.
+
+        Returns:
+            Dictionary with plan_score, optimal_score, optimality_gap and
+            optimality_gap_pct
+        """
+        if not self._optimality:
+            self._optimality.update(self._optimality_gap())
+        return dict(self._optimality)
+
+    def _optimality_gap(self) -> Dict[str, Any]:
+        """Score the last plan against the best achievable score"""
+        preferred_types = set(self._preferences.get('preferred_task_types', []))
+        avoided_types = set(self._preferences.get('avoided_task_types', []))
+        if not self._ranked_tasks:
+            # The vectorized path does not keep the ranking
+            self._ranked_tasks = self._rank_tasks(self._candidate_tasks(), preferred_types, avoided_types)
+        scores = {task.get_task_id(): score for score, task in self._ranked_tasks}
+        plan_score = sum(scores.get(task.get_task_id(), 0) for task in self._last_plan)
+
+        if self._optimal_score is None:
+            budget = self._available_time or 0
+            self._optimal_score = _KnapsackTable(self._ranked_tasks, budget).best_score(budget)
+        # The plan's positive-score tasks fit the budget, so plan_score <= optimal_score
+        optimal_score = self._optimal_score
+        gap = optimal_score - plan_score
+        return {
+            'plan_score': plan_score,
+            'optimal_score': optimal_score,
+            'optimality_gap': gap,
+            'optimality_gap_pct': (gap / optimal_score * 100) if optimal_score > 0 else 0
+        }
+
+    def _select_vectorized(
+        self,
+        tasks: List[Task],
+        preferred_types: Set[str],
+        avoided_types: Set[str]
+    ) -> tuple[List[Task], List[Task]]:
+        """
+        Score and pick tasks with NumPy; same result as _select_greedy.
+
+        Scores come from a priority array plus a bonus looked up by task type
+        code. After a stable descending sort, every task up to the point where
+        the cumulative duration passes the budget is taken at once, and the
+        rest of the budget is filled by scanning for the next task that fits.
+
+        Returns:
+            Tuple (selected_tasks, excluded_tasks), both in score order
+        """
+        count = len(tasks)
+        type_codes: Dict[str, int] = {}
+        codes = np.fromiter(
+            (type_codes.setdefault(task.get_task_type(), len(type_codes)) for task in tasks),
+            dtype=np.int64, count=count)
+        priorities = np.fromiter((task.get_priority() for task in tasks), dtype=np.int64, count=count)
+        durations = np.fromiter((task.get_duration() for task in tasks), dtype=np.int64, count=count)
+
+        bonus = np.zeros(len(type_codes), dtype=np.int64)
+        for task_type, code in type_codes.items():
+            bonus[code] = (10 if task_type in preferred_types else 0) - (5 if task_type in avoided_types else 0)
+        scores = priorities + bonus[codes]
+
+        # A stable sort on the negated score keeps insertion order for ties
+        order = np.argsort(-scores, kind='stable')
+        chosen = np.zeros(count, dtype=bool)
+
+        if self._available_time is not None:
+            sorted_durations = durations[order]
+            cumulative = np.cumsum(sorted_durations)
+            # Every task before the first overflow fits
+            prefix = int(np.searchsorted(cumulative, self._available_time, side='right'))
+            chosen[:prefix] = True
+            remaining = self._available_time - (int(cumulative[prefix - 1]) if prefix else 0)
+            position = prefix + 1
+            while position < count and remaining > 0:
+                fits = np.flatnonzero(sorted_durations[position:] <= remaining)
+                if not fits.size:
+                    break
+                position += int(fits[0])
+                chosen[position] = True
+                remaining -= int(sorted_durations[position])
+                position += 1
+
+        selected_tasks = [tasks[i] for i in order[chosen]]
+        excluded_tasks = [tasks[i] for i in order[~chosen]]
+        return selected_tasks, excluded_tasks
+
+    def explain_plan(self, page: int = 1, page_size: int = 50) -> str:
         """
         Explain the reasoning behind the generated plan with details
         about task selection, priorities, and time management
 
+        Only one page of the selected tasks and of the decision trace is
+        rendered, so long plans stay cheap to explain.
+
+        Args:
+            page: Page of selected tasks and decisions to show, starting at 1
+                (clamped to the valid range)
+            page_size: Tasks and decisions per page
+
         Returns:
             Detailed explanation string
+
+        Raises:
+            ValueError: If page_size is not positive
         """
         if not self._last_plan and not self._excluded_tasks:
             return "No plan has been generated yet. Call generate_plan() first."
@@ -883,14 +3132,21 @@ class DailyPlanner:
 
         # Explain selected tasks
         if self._last_plan:
-            explanation_parts.append("Selected Tasks (in priority order):")
-            for i, task in enumerate(self._last_plan, 1):
+            start, end, page_count = page_bounds(len(self._last_plan), page, page_size)
+            paging = f", page {min(max(page, 1), page_count)} of {page_count}" if page_count > 1 else ""
+            explanation_parts.append(f"Selected Tasks (in priority order{paging}):")
+            for i, task in enumerate(self._last_plan[start:end], start + 1):
+                placed = self._placements.get(task.get_task_id())
+                if placed in (None, task.get_start_minute()):
+                    time_text = task.get_time()
+                else:
+                    time_text = f"{self.get_scheduled_time(task)} (moved from {task.get_time()})"
                 explanation_parts.append(
                     f"  {i}. {task.get_task_name()} "
                     f"[{task.get_task_type()}] - "
                     f"{task.get_duration()} min, "
                     f"Priority: {task.get_priority()}, "
-                    f"Time: {task.get_time()}"
+                    f"Time: {time_text}"
                 )
         else:
             explanation_parts.append("No tasks could be scheduled within the available time.")
@@ -905,25 +3161,36 @@ class DailyPlanner:
             if self._preferences.get('sort_by_time'):
                 explanation_parts.append("  - Tasks sorted by scheduled time")
 
-        # Explain excluded tasks
+        # Explain excluded tasks, with the recorded reason when there is a trace
+        trace = self._plan_trace
         if self._excluded_tasks:
             explanation_parts.append(f"\nTasks Not Scheduled ({len(self._excluded_tasks)}):")
-            explanation_parts.append("  (Excluded due to time constraints or low priority)")
-            for task in self._excluded_tasks[:5]:  # Show first 5
-                explanation_parts.append(
-                    f"  - {task.get_task_name()} "
-                    f"({task.get_duration()} min, Priority: {task.get_priority()})"
-                )
+            if trace is not None:
+                excluded = (i for i in range(len(trace)) if not trace.is_selected(i))
+                for i in islice(excluded, 5):
+                    explanation_parts.append(f"  - {trace.describe(i)}")
+            else:
+                explanation_parts.append("  (Excluded due to time constraints or low priority)")
+                for task in self._excluded_tasks[:5]:  # Show first 5
+                    explanation_parts.append(
+                        f"  - {task.get_task_name()} "
+                        f"({task.get_duration()} min, Priority: {task.get_priority()})"
+                    )
             if len(self._excluded_tasks) > 5:
                 explanation_parts.append(f"  ... and {len(self._excluded_tasks) - 5} more")
 
-        # Optimization strategy explanation
-        explanation_parts.append("\n=== Optimization Strategy ===")
-        explanation_parts.append("This plan was optimized using a priority-based greedy algorithm:")
-        explanation_parts.append("1. Tasks scored by priority level")
-        explanation_parts.append("2. Preferred task types received bonus points")
-        explanation_parts.append("3. Tasks selected in order until time budget exhausted")
-        explanation_parts.append("4. High-priority tasks scheduled first to ensure completion")
+        # What the planner actually did for each task, in rank order
+        if trace is not None and len(trace):
+            start, end, page_count = page_bounds(len(trace), page, page_size)
+            explanation_parts.append(f"\n=== Decisions ({trace.get_mode()}, {start + 1}-{end} of {len(trace)}) ===")
+            explanation_parts.extend(f"  {line}" for line in trace.render(start, end))
+            if page_count > 1:
+                explanation_parts.append(f"  (page {min(max(page, 1), page_count)} of {page_count})")
+        else:
+            explanation_parts.append("\n=== Decisions ===")
+            explanation_parts.append(f"Mode: {self._mode} ({self._MODE_TEXT[self._mode]})")
+            explanation_parts.append("Per-task decisions were not recorded; call enable_explanations() "
+                                     "before generate_plan() to see why each task was selected or excluded.")
 
         return "\n".join(explanation_parts)
 
@@ -931,6 +3198,11 @@ class DailyPlanner:
         """
         Get a summary of the current plan as a dictionary
 
+        Includes the score gap to the optimal plan (see
+        get_optimality_gap). It is computed on the first summary of a plan
+        and kept in the plan's cache entry, so repeated summaries of the same
+        plan, including cache hits, do not solve the knapsack again.
+
         Returns:
             Dictionary with plan statistics
         """
@@ -948,15 +3220,22 @@ class DailyPlanner:
             task_type = task.get_task_type()
             task_types[task_type] = task_types.get(task_type, 0) + 1
 
-        return {
+        summary = {
             'pet_name': self._pet.get_name(),
             'total_tasks': len(self._last_plan),
             'total_time': total_time,
             'remaining_time': (self._available_time - total_time) if self._available_time else 0,
             'tasks_excluded': len(self._excluded_tasks),
             'task_types': task_types,
-            'time_utilization': (total_time / self._available_time * 100) if self._available_time else 0
+            'time_utilization': (total_time / self._available_time * 100) if self._available_time else 0,
+            'mode': self._mode,
+            'tasks_moved': sum(
+                1 for task in self._last_plan
+                if self._placements.get(task.get_task_id()) != task.get_start_minute()
+            )
         }
+        summary.update(self.get_optimality_gap())
+        return summary
 
     def get_last_plan(self) -> List[Task]:
         """
@@ -971,3 +3250,4 @@ class DailyPlanner:
         """Clear the current plan and excluded tasks"""
         self._last_plan = []
         self._excluded_tasks = []
+        self._placements = {}
@@ -0,0 +1,387 @@
+"""
+PawPal+ Trace Recording and Replay
+Records TaskManager and DailyPlanner calls to a trace file and replays them
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time as timer
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from pawpal_system import DailyPlanner, Pet, Task, TaskManager
+from pawpal_io import Source, _open_text
+from pawpal_metrics import percentile
+
+TRACE_VERSION = 1
+
+# Methods whose first argument is a task ID, remapped on replay
+_TASK_ID_METHODS = frozenset({"edit_task", "delete_task", "mark_task_completed", "get_task_by_id"})
+
+# Methods that create tasks -> IDs of the tasks in their result
+_CREATED_IDS: Dict[str, Callable[[Any], List[str]]] = {
+    "create_task": lambda task: [task.get_task_id()],
+    "create_tasks_bulk": lambda result: [task.get_task_id() for task in result[0]],
+}
+
+# json.dumps builds a new encoder per call when given options, so keep one
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+_PLAIN_TYPES = (type(None), bool, int, float, str)
+
+
+class TraceRecorder:
+    """
+    Writes a trace of calls as JSON Lines.
+
+    The first line is a header; every later line is either a planner
+    declaration or one call: its start offset ("t"), target ("o"), method
+    ("m"), arguments ("a", "k"), duration ("d"), both in whole microseconds,
+    the IDs of tasks it created ("r") and the error it raised ("x").
+    Stored tasks are written by ID, so a call costs about one short line.
+
+    Only calls made through RecordingTaskManager and RecordingDailyPlanner
+    are recorded; changes made directly through Task setters are not.
+    """
+
+    def __init__(self, fp: Source):
+        """
+        Initialize TraceRecorder
+
+        Args:
+            fp: Text file object, or a path (gzip-compressed when it ends in .gz,
+                at the fastest level to keep recording cheap)
+        """
+        self._context = _open_text(fp, "w", compresslevel=1)
+        self._out = self._context.__enter__()
+        self._lock = threading.Lock()
+        self._start = timer.perf_counter()
+        self._planner_count = 0
+        self._call_count = 0
+        self._closed = False
+        self._write({"trace": TRACE_VERSION, "created": datetime.now().isoformat(timespec="seconds")})
+
+    def get_call_count(self) -> int:
+        """Get the number of calls recorded so far"""
+        return self._call_count
+
+    def _write(self, record: Dict[str, Any], is_call: bool = False) -> None:
+        """Write one record as a compact JSON line"""
+        line = _ENCODER.encode(record) + "\n"
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Trace recorder is closed")
+            self._out.write(line)
+            if is_call:
+                self._call_count += 1
+
+    def _declare_planner(self, pet: Pet, buffer_minutes: int, cache_size: int) -> str:
+        """Record a new planner and return its target name"""
+        with self._lock:
+            self._planner_count += 1
+            name = f"planner:{self._planner_count}"
+        self._write({"t": self._offset(), "new": name, "pet": pet.to_dict(),
+                     "buffer_minutes": buffer_minutes, "cache_size": cache_size})
+        return name
+
+    def _offset(self) -> int:
+        """Microseconds since the recorder was created"""
+        return int((timer.perf_counter() - self._start) * 1e6)
+
+    def _call(self, target: str, task_manager: TaskManager, method: Callable[..., Any],
+              name: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """Run a method and record the call"""
+        record: Dict[str, Any] = {"t": self._offset(), "o": target, "m": name}
+        if name in _TASK_ID_METHODS and args:
+            record["a"] = [{"$id": args[0]}] + [_encode(arg, task_manager) for arg in args[1:]]
+        elif args:
+            record["a"] = [_encode(arg, task_manager) for arg in args]
+        if kwargs:
+            record["k"] = {key: _encode(value, task_manager) for key, value in kwargs.items()}
+            if name in _TASK_ID_METHODS and "task_id" in kwargs:
+                record["k"]["task_id"] = {"$id": kwargs["task_id"]}
+        start = timer.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            record["x"] = f"{type(e).__name__}: {e}"
+            raise
+        else:
+            if name in _CREATED_IDS:
+                record["r"] = _CREATED_IDS[name](result)
+            return result
+        finally:
+            record["d"] = int((timer.perf_counter() - start) * 1e6)
+            self._write(record, is_call=True)
+
+    def close(self) -> None:
+        """Flush and close the trace (a caller's file object is left open)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._context.__exit__(None, None, None)
+
+    def __enter__(self) -> "TraceRecorder":
+        """Use the recorder as a context manager"""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the trace"""
+        self.close()
+
+
+class _RecordingProxy:
+    """Forwards attribute access to a target, recording calls to its public methods"""
+
+    def __init__(self, target: Any, name: str, task_manager: TaskManager, recorder: TraceRecorder):
+        """Wrap a target recorded under a name"""
+        self._target = target
+        self._name = name
+        self._tm = task_manager
+        self._recorder = recorder
+
+    def __getattr__(self, attr: str) -> Any:
+        """Return the target's attribute, wrapping public methods in a recorder"""
+        value = getattr(self._target, attr)
+        if attr.startswith("_") or not callable(value):
+            return value
+        call, name, tm = self._recorder._call, self._name, self._tm
+
+        def recorded(*args, **kwargs):
+            return call(name, tm, value, attr, args, kwargs)
+
+        # Cached on the proxy, so later lookups skip __getattr__
+        setattr(self, attr, recorded)
+        return recorded
+
+
+class RecordingTaskManager(_RecordingProxy):
+    """
+    TaskManager (or SqliteTaskManager) wrapper that records every public
+    method call. Use it anywhere the wrapped manager is used.
+    """
+
+    def __init__(self, task_manager: TaskManager, recorder: TraceRecorder):
+        """
+        Initialize RecordingTaskManager
+
+        Args:
+            task_manager: Manager to wrap
+            recorder: Recorder that receives the calls
+        """
+        super().__init__(task_manager, "tm", task_manager, recorder)
+
+    def get_task_manager(self) -> TaskManager:
+        """Get the wrapped manager (calls made on it are not recorded)"""
+        return self._target
+
+
+class RecordingDailyPlanner(_RecordingProxy):
+    """
+    DailyPlanner wrapper that records every public method call. The planner
+    reads tasks from the unwrapped manager, so its internal reads are not
+    recorded as separate calls.
+    """
+
+    def __init__(self, pet: Pet, task_manager: RecordingTaskManager, recorder: TraceRecorder,
+                 buffer_minutes: int = 5, cache_size: int = 32):
+        """
+        Initialize RecordingDailyPlanner
+
+        Args:
+            pet: The Pet object
+            task_manager: The RecordingTaskManager holding the tasks
+            recorder: Recorder that receives the calls
+            buffer_minutes: Minutes of buffer time to add between consecutive tasks
+            cache_size: Number of generated plans to keep (0 disables the plan cache)
+        """
+        inner = task_manager.get_task_manager()
+        name = recorder._declare_planner(pet, buffer_minutes, cache_size)
+        super().__init__(DailyPlanner(pet, inner, buffer_minutes, cache_size), name, inner, recorder)
+
+    def get_planner(self) -> DailyPlanner:
+        """Get the wrapped planner (calls made on it are not recorded)"""
+        return self._target
+
+
+def _encode(value: Any, task_manager: TaskManager) -> Any:
+    """Convert an argument to JSON, referring to stored tasks by ID"""
+    if type(value) in _PLAIN_TYPES:
+        return value
+    if isinstance(value, Task):
+        task_id = value.get_task_id()
+        if task_manager.get_task_by_id(task_id) is value:
+            return {"$task": task_id}
+        return {"$new": value.to_dict()}
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, Pet):
+        return {"$pet": value.to_dict()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item, task_manager) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _encode(item, task_manager) for key, item in value.items()}
+    if isinstance(value, (int, float, str)):
+        return value
+    return {"$repr": repr(value)}
+
+
+def _decode(value: Any, task_manager: TaskManager, ids: Dict[str, str]) -> Any:
+    """
+    Rebuild an argument encoded by _encode
+
+    Raises:
+        ValueError: If the argument could not be recorded
+    """
+    if isinstance(value, list):
+        return [_decode(item, task_manager, ids) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        (tag, payload), = value.items()
+        if tag == "$id":
+            return ids.get(payload, payload)
+        if tag == "$task":
+            return task_manager.get_task_by_id(ids.get(payload, payload))
+        if tag == "$new":
+            return Task.from_dict(payload)
+        if tag == "$date":
+            return date.fromisoformat(payload)
+        if tag == "$datetime":
+            return datetime.fromisoformat(payload)
+        if tag == "$pet":
+            return Pet.from_dict(payload)
+        if tag == "$repr":
+            raise ValueError(f"Argument {payload} was not recorded")
+    return {key: _decode(item, task_manager, ids) for key, item in value.items()}
+
+
+def _summarize(latencies: List[float]) -> Dict[str, float]:
+    """Latency percentiles in milliseconds"""
+    ordered = sorted(latencies)
+    return {
+        'p50_ms': percentile(ordered, 0.50) * 1000,
+        'p90_ms': percentile(ordered, 0.90) * 1000,
+        'p99_ms': percentile(ordered, 0.99) * 1000,
+        'max_ms': (ordered[-1] if ordered else 0.0) * 1000,
+        'total_ms': sum(ordered) * 1000,
+    }
+
+
+def replay(
+    fp: Source,
+    task_manager: Optional[TaskManager] = None,
+    paced: bool = False,
+    speed: float = 1.0
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Re-execute a trace and measure every call.
+
+    Tasks created during the replay get new IDs; later calls that refer to
+    the recorded IDs are mapped to them. Calls that raise are counted as
+    errors and the replay continues, so a trace that recorded a failing
+    call replays it too.
+
+    Args:
+        fp: Trace written by TraceRecorder (path or file object, gzip is detected)
+        task_manager: Manager to replay into, defaults to a new TaskManager
+        paced: If True, wait before each call until its recorded offset
+            (divided by speed); if False, run the calls back to back
+        speed: Pacing multiplier, 2.0 replays twice as fast as recorded
+
+    Returns:
+        Dictionary keyed by "tm.<method>" or "planner.<method>", each with
+        count, errors, p50_ms, p90_ms, p99_ms, max_ms and total_ms of the
+        replay, plus recorded_p50_ms and recorded_p99_ms from the trace
+
+    Raises:
+        ValueError: If the file is not a trace or speed is not positive
+    """
+    if speed <= 0:
+        raise ValueError("Speed must be positive")
+    tm = task_manager if task_manager is not None else TaskManager()
+    targets: Dict[str, Any] = {"tm": tm}
+    ids: Dict[str, str] = {}
+    latencies: Dict[str, List[float]] = {}
+    recorded: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+
+    with _open_text(fp, "r") as source:
+        header = json.loads(source.readline() or "{}")
+        if header.get("trace") != TRACE_VERSION:
+            raise ValueError("Not a PawPal+ trace file")
+        start = timer.perf_counter()
+        for line in source:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if paced:
+                delay = start + record["t"] / 1e6 / speed - timer.perf_counter()
+                if delay > 0:
+                    timer.sleep(delay)
+            if "new" in record:
+                targets[record["new"]] = DailyPlanner(Pet.from_dict(record["pet"]), tm,
+                                                      record["buffer_minutes"], record["cache_size"])
+                continue
+
+            target, name = record["o"], record["m"]
+            key = f"{target.split(':')[0]}.{name}"
+            recorded.setdefault(key, []).append(record["d"] / 1e6)
+            call_start = timer.perf_counter()
+            try:
+                args = _decode(record.get("a", []), tm, ids)
+                kwargs = _decode(record.get("k", {}), tm, ids)
+                result = getattr(targets[target], name)(*args, **kwargs)
+            except Exception:
+                errors[key] = errors.get(key, 0) + 1
+                result = None
+            latencies.setdefault(key, []).append(timer.perf_counter() - call_start)
+            if result is not None and "r" in record:
+                ids.update(zip(record["r"], _CREATED_IDS[name](result)))
+
+    report: Dict[str, Dict[str, Any]] = {}
+    for key in sorted(latencies):
+        past = _summarize(recorded[key])
+        report[key] = {'count': len(latencies[key]), 'errors': errors.get(key, 0),
+                       **_summarize(latencies[key]),
+                       'recorded_p50_ms': past['p50_ms'], 'recorded_p99_ms': past['p99_ms']}
+    return report
+
+
+def format_report(report: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Format a replay report as a table
+
+    Args:
+        report: Result of replay()
+
+    Returns:
+        One line per operation, slowest p99 first
+    """
+    lines = [f"{'operation':<32} {'count':>7} {'errors':>6} {'p50 ms':>9} {'p90 ms':>9} "
+             f"{'p99 ms':>9} {'max ms':>9} {'rec p99':>9}"]
+    for key, stats in sorted(report.items(), key=lambda item: -item[1]['p99_ms']):
+        lines.append(f"{key:<32} {stats['count']:>7} {stats['errors']:>6} {stats['p50_ms']:>9.3f} "
+                     f"{stats['p90_ms']:>9.3f} {stats['p99_ms']:>9.3f} {stats['max_ms']:>9.3f} "
+                     f"{stats['recorded_p99_ms']:>9.3f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Replay a trace file from the command line and print the latency report"""
+    parser = argparse.ArgumentParser(description="Replay a PawPal+ trace")
+    parser.add_argument("trace", help="trace file written by TraceRecorder")
+    parser.add_argument("--paced", action="store_true", help="keep the recorded pacing")
+    parser.add_argument("--speed", type=float, default=1.0, help="pacing multiplier")
+    args = parser.parse_args(argv)
+    print(format_report(replay(args.trace, paced=args.paced, speed=args.speed)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+PawPal+ View Models
+Cached, paginated table data for the Streamlit app
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from pawpal_system import BudgetPlans, DailyPlanner, Task, TaskManager, page_bounds
+
+
+class TaskViewModel:
+    """
+    Derived views of a task store for display.
+
+    Sorted tasks, duplicates, conflicts, table pages and per-budget plans
+    are computed once per mutation version of the store (get_version) and
+    reused on every rerun until a task changes. A SQLite store's version
+    also moves when another session commits to the same file. Table rows
+    are only built for the page shown, so render cost is bounded by the
+    page size.
+    """
+
+    def __init__(self, task_manager: TaskManager, page_size: int = 25):
+        """
+        Initialize TaskViewModel
+
+        Args:
+            task_manager: TaskManager (or SqliteTaskManager) to present
+            page_size: Rows per table page
+
+        Raises:
+            ValueError: If page_size is not positive
+        """
+        if page_size <= 0:
+            raise ValueError("Page size must be positive")
+        self._task_manager = task_manager
+        self._page_size = page_size
+        self._version: Optional[int] = None
+        self._cache: Dict[tuple, Any] = {}
+        self._stats = {'hits': 0, 'misses': 0}
+
+    def get_page_size(self) -> int:
+        """Get the number of rows per page"""
+        return self._page_size
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get cache hit and miss counters"""
+        return dict(self._stats)
+
+    def _cached(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Return a cached value for the current store version, computing it on a miss"""
+        version = self._task_manager.get_version()
+        if version != self._version:
+            self._cache.clear()
+            self._version = version
+        if key in self._cache:
+            self._stats['hits'] += 1
+            return self._cache[key]
+        self._stats['misses'] += 1
+        value = self._cache[key] = compute()
+        return value
+
+    def get_sorted_tasks(self) -> List[Task]:
+        """Get all tasks sorted by scheduled time"""
+        return self._cached(('sorted',), self._task_manager.get_tasks_sorted_by_time)
+
+    def get_page_count(self) -> int:
+        """Get the number of task table pages"""
+        return page_bounds(len(self.get_sorted_tasks()), 1, self._page_size)[2]
+
+    def get_task_page(self, page: int) -> List[Dict[str, Any]]:
+        """
+        Get the task table rows for one page, in time order
+
+        Args:
+            page: Page number starting at 1 (clamped to the valid range)
+
+        Returns:
+            One row dict per task on the page
+        """
+        tasks = self.get_sorted_tasks()
+        start, end, _ = page_bounds(len(tasks), page, self._page_size)
+        return self._cached(('tasks', start), lambda: [self.task_row(task) for task in tasks[start:end]])
+
+    @staticmethod
+    def task_row(task: Task) -> Dict[str, Any]:
+        """Build the task table row for one task"""
+        return {
+            "Task": task.get_task_name(),
+            "Type": task.get_task_type(),
+            "Duration (min)": task.get_duration(),
+            "Priority": task.get_priority(),
+            "Time": task.get_time(),
+            "Recurrence": task.get_recurrence() or "",
+            "Completed": "Yes" if task.is_completed() else "No"
+        }
+
+    def get_duplicates(self) -> List[str]:
+        """
+        Get tasks that share a name and time
+
+        Returns:
+            One "name at HH:MM (xN)" entry per repeated pair, in time order
+        """
+        def compute() -> List[str]:
+            combo_counts: Dict[tuple[str, str], int] = {}
+            for task in self.get_sorted_tasks():
+                key = (task.get_task_name(), task.get_time())
+                combo_counts[key] = combo_counts.get(key, 0) + 1
+            return [f"{name} at {time} (x{count})" for (name, time), count in combo_counts.items() if count > 1]
+
+        return self._cached(('duplicates',), compute)
+
+    def get_conflicts(self) -> List[tuple[Task, Task, str]]:
+        """Get all scheduling conflicts"""
+        return self._cached(('conflicts',), self._task_manager.get_all_conflicts)
+
+    def get_conflict_page(self, page: int) -> List[str]:
+        """
+        Get the conflict messages for one page
+
+        Args:
+            page: Page number starting at 1 (clamped to the valid range)
+
+        Returns:
+            One message per conflict on the page
+        """
+        conflicts = self.get_conflicts()
+        start, end, _ = page_bounds(len(conflicts), page, self._page_size)
+        return self._cached(('conflict_lines', start), lambda: [
+            f"{t1.get_task_name()} at {t1.get_time()} <> {t2.get_task_name()} at {t2.get_time()} : {reason}"
+            for t1, t2, reason in conflicts[start:end]
+        ])
+
+    def get_budget_plans(self, planner: DailyPlanner, preferences: Dict[str, Any]) -> BudgetPlans:
+        """
+        Get the planner's plans for every available time, recomputed only
+        when a task changes or different preferences are given
+
+        Args:
+            planner: Planner to run plan_for_all_budgets on
+            preferences: The preferences set on the planner (part of the cache key)
+
+        Returns:
+            BudgetPlans from planner.plan_for_all_budgets()
+        """
+        frozen = tuple(sorted((name, tuple(value) if isinstance(value, list) else value)
+                              for name, value in preferences.items()))
+        return self._cached(('budgets', frozen, planner.get_plan_date()), planner.plan_for_all_budgets)
+
+    def get_plan_page(self, planner: DailyPlanner, plan: List[Task], page: int) -> List[Dict[str, Any]]:
+        """
+        Get the plan table rows for one page (not cached: the plan belongs to the planner)
+
+        Args:
+            planner: Planner that produced the plan
+            plan: The plan, in order
+            page: Page number starting at 1 (clamped to the valid range)
+
+        Returns:
+            One row dict per planned task on the page
+        """
+        start, end, _ = page_bounds(len(plan), page, self._page_size)
+        return [
+            {
+                "#": i + 1,
+                "Task": task.get_task_name(),
+                "Type": task.get_task_type(),
+                "Duration (min)": task.get_duration(),
+                "Priority": task.get_priority(),
+                "Requested": task.get_time(),
+                "Scheduled": planner.get_scheduled_time(task)
+            }
+            for i, task in enumerate(plan[start:end], start)
+        ]
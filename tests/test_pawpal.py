@@ -2,7 +2,11 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from pawpal_system import Pet, Task, TaskManager
+import pytest
+
+from datetime import date, timedelta
+
+from pawpal_system import Pet, Task, TaskManager, DailyPlanner, TaskOccurrence
 
 
 def test_task_completion():
@@ -52,22 +56,63 @@ def test_tasks_chronological_ordering():
     assert times == sorted(times), "Tasks are not sorted chronologically"
 
 
-def test_recurring_daily_completion_creates_next():
-    """Confirm marking a daily task complete creates a new task for next day"""
+def test_recurring_daily_completion_moves_to_next_occurrence():
+    """Confirm a completed daily task stays completed until its next day, without storing a copy"""
     tm = TaskManager()
-    daily = tm.create_task("Walk", "Daily walk", "09:00", 5, 20, "walk", recurrence="daily")
+    today = date(2026, 3, 1)
+    daily = tm.create_task("Walk", "Daily walk", "09:00", 5, 20, "walk", recurrence="daily", start_date=today)
     initial_count = len(tm.get_all_tasks())
 
-    new_task = tm.mark_task_completed(daily.get_task_id())
+    assert tm.mark_task_completed(daily.get_task_id()) is daily
+
+    # the completed day is recorded on the series and shows as completed
+    assert daily.is_completed_on(today) is True
+    assert daily.is_completed() is True and tm.get_completed_tasks() == [daily]
+
+    # the next occurrence is a view, nothing new stored
+    next_walk = daily.next_occurrence()
+    assert len(tm.get_all_tasks()) == initial_count
+    assert next_walk.get_date() == today + timedelta(days=1)
+    assert next_walk.get_recurrence() == "daily"
+    assert next_walk.is_completed() is False
 
-    # original marked completed
-    assert daily.is_completed() is True
+    # nothing moves until the next occurrence is due, then it is pending
+    assert tm.roll_over_recurring(today) == 0
+    assert tm.roll_over_recurring(today + timedelta(days=1)) == 1
+    assert daily.get_due_date() == next_walk.get_date() and daily.is_completed() is False
+    assert tm.get_pending_tasks() == [daily]
+
+
+def test_occurrences_are_generated_lazily():
+    """Verify occurrences over a date range come from the rules, with per-date completion"""
+    tm = TaskManager()
+    start = date(2026, 3, 2)  # a Monday
+    walk = tm.create_task("Walk", "Daily walk", "07:00", 5, 30, "walk", recurrence="daily", start_date=start)
+    bath = tm.create_task("Bath", "Weekly bath", "10:00", 3, 20, "grooming", recurrence="weekly", start_date=start)
+    vet = tm.create_task("Vet", "Checkup", "15:00", 9, 60, "medication", start_date=start + timedelta(days=3))
 
-    # new recurring task returned and added
-    assert new_task is not None
-    assert len(tm.get_all_tasks()) == initial_count + 1
-    assert new_task.get_recurrence() == "daily"
-    assert new_task.is_completed() is False
+    week = list(tm.iter_occurrences(start - timedelta(days=1), start + timedelta(days=7)))
+    assert len(week) == 8 + 2 + 1
+    assert [o.get_date() for o in week] == sorted(o.get_date() for o in week)
+    assert [o.get_task() for o in tm.get_occurrences_on(start + timedelta(days=7))] == [walk, bath]
+    assert [o.get_task() for o in tm.get_occurrences_on(start + timedelta(days=3))] == [walk, vet]
+
+    # a year of a daily task is still one stored object plus one bit per completed day
+    thursday = start + timedelta(days=3)
+    TaskOccurrence(walk, thursday).mark_completed()
+    assert walk.is_completed_on(thursday) and not walk.is_completed_on(start)
+    assert sum(1 for _ in walk.occurrences(start, start + timedelta(days=364))) == 365
+    assert len(tm.get_all_tasks()) == 3
+    with pytest.raises(ValueError):
+        bath.set_completed_on(thursday)
+
+    # the planner can plan one date's occurrences
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+    planner.set_available_time(120)
+    planner.set_plan_date(thursday)
+    plan = planner.generate_plan()
+    assert {o.get_task() for o in plan} == {walk, vet}
+    assert planner.get_scheduled_time(plan[0]) == "15:00"
 
 
 def test_scheduler_flags_duplicate_times():
@@ -88,6 +133,466 @@ def test_scheduler_flags_duplicate_times():
     assert raised, "Creating duplicate task should raise ValueError unless allow_duplicates=True"
 
 
+def test_all_conflicts_matches_pairwise_scan():
+    """Verify the sweep-line conflict engine finds the same pairs as comparing every pair"""
+    import random
+    rng = random.Random(7)
+    tm = TaskManager()
+    for i in range(60):
+        tm.create_task(f"Task {i}", "Random task", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+                       rng.randrange(11), rng.choice([5, 15, 30, 90]), "walk",
+                       pet_id=rng.choice(["Max", "Luna", None]))
+
+    tasks = tm.get_all_tasks()
+
+    def occupied(t):
+        # Minutes of the daily clock the task covers, wrapping past midnight
+        start = t.get_time_obj().hour * 60 + t.get_time_obj().minute
+        return {(start + m) % 1440 for m in range(t.get_duration())}
+
+    expected = [
+        (a, b) for i, a in enumerate(tasks) for b in tasks[i + 1:]
+        if occupied(a) & occupied(b)
+    ]
+    assert [(t1, t2) for t1, t2, _ in tm.get_all_conflicts()] == expected
+
+
+def test_conflict_index_follows_edits_and_deletes():
+    """Verify check_task_conflicts stays correct after edits, deletes and completions"""
+    tm = TaskManager()
+    walk = tm.create_task("Walk", "Morning walk", "08:00", 8, 30, "walk", pet_id="Max")
+    feed = tm.create_task("Feed", "Breakfast", "08:15", 9, 10, "feed", pet_id="Max")
+    groom = tm.create_task("Groom", "Brush fur", "10:00", 5, 20, "grooming", pet_id="Luna")
+
+    assert [t for t, _ in tm.check_task_conflicts(walk)] == [feed]
+
+    # Move feeding out of the walk and stretch grooming back over it
+    tm.edit_task(feed.get_task_id(), time="09:00")
+    assert tm.check_task_conflicts(walk) == []
+    tm.edit_task(groom.get_task_id(), time="08:55", duration=30)
+    assert [t for t, _ in tm.check_task_conflicts(feed)] == [groom]
+    assert [(a, b) for a, b, _ in tm.get_all_conflicts()] == [(feed, groom)]
+
+    # Completed tasks still hold their slot
+    tm.mark_task_completed(feed.get_task_id())
+    assert [t for t, _ in tm.check_task_conflicts(groom)] == [feed]
+    assert [(a, b) for a, b, _ in tm.get_all_conflicts()] == [(feed, groom)]
+
+    tm.delete_task(groom.get_task_id())
+    assert tm.get_all_conflicts() == []
+    assert tm.check_task_conflicts(feed) == []
+
+
+def test_filter_indexes_follow_direct_task_changes():
+    """Verify filter methods see changes made directly on Task objects"""
+    tm = TaskManager()
+    walk = tm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk", recurrence="daily", pet_id="Max")
+    feed = tm.create_task("Feed", "Breakfast", "08:00", 9, 10, "Feed", pet_id="Max")
+    play = tm.create_task("Play", "Laser pointer", "14:00", 4, 20, "playtime", pet_id="Luna")
+
+    walk.mark_completed()
+    play.set_pet_id("Max")
+    feed.set_priority(2)
+
+    assert tm.get_completed_tasks() == [walk]
+    assert tm.get_pending_tasks() == [feed, play]
+    assert tm.get_tasks_by_pet("Max") == [walk, feed, play]
+    assert tm.get_tasks_by_pet("Luna") == []
+    assert tm.get_tasks_by_type("FEED") == [feed]
+    assert tm.get_tasks_by_priority(4) == [walk, play]
+    assert tm.get_recurring_tasks() == [walk]
+
+    walk.mark_incomplete()
+    tm.delete_task(play.get_task_id())
+    assert tm.get_completed_tasks() == []
+    assert tm.get_tasks_by_priority(0) == [walk, feed]
+
+
+def test_bulk_create_reports_bad_rows_and_keeps_indexes():
+    """Verify create_tasks_bulk skips invalid or duplicate rows without aborting the batch"""
+    tm = TaskManager()
+    existing = tm.create_task("Feed", "Breakfast", "08:00", 9, 10, "feed", pet_id="Max")
+
+    rows = [
+        {"task_name": "Walk", "description": "Morning walk", "time": "08:05", "priority": 8,
+         "duration": 30, "task_type": "walk", "pet_id": "Max"},
+        {"task_name": "Feed", "description": "Second breakfast", "time": "08:00", "priority": 5,
+         "duration": 5, "task_type": "feed"},
+        {"task_name": "Nap", "description": "Afternoon nap", "time": "25:00", "priority": 1,
+         "duration": 60, "task_type": "rest"},
+        {"task_name": "Walk", "description": "Same walk again", "time": "08:05", "priority": 8,
+         "duration": 30, "task_type": "walk"},
+        {"task_name": "Play", "description": "Fetch", "time": "17:00", "priority": 6,
+         "duration": 20, "task_type": "playtime", "recurrence": "daily"},
+    ]
+    created, errors = tm.create_tasks_bulk(rows)
+
+    assert [t.get_task_name() for t in created] == ["Walk", "Play"]
+    assert [row for row, _ in errors] == [1, 2, 3]
+    assert tm.has_duplicate_task("Walk", "08:05") is True
+    assert tm.get_tasks_by_pet("Max") == [existing, created[0]]
+    assert tm.get_tasks_by_priority(6) == [existing, created[0], created[1]]
+    assert [(a, b) for a, b, _ in tm.get_all_conflicts()] == [(existing, created[0])]
+    assert tm.get_total_duration() == 60
+
+    # Names and times are compared as stored: stripped, with zero-padded hours
+    rows = [
+        {"task_name": "Feed ", "description": "Padded name", "time": "08:00", "priority": 5,
+         "duration": 5, "task_type": "feed"},
+        {"task_name": "Play", "description": "Unpadded time", "time": "9:30", "priority": 5,
+         "duration": 5, "task_type": "playtime"},
+        {"task_name": "Play ", "description": "Both in one batch", "time": "09:30", "priority": 5,
+         "duration": 5, "task_type": "playtime"},
+    ]
+    created, errors = tm.create_tasks_bulk(rows)
+    assert [row for row, _ in errors] == [0, 2]
+    assert [(t.get_task_name(), t.get_time()) for t in created] == [("Play", "09:30")]
+    with pytest.raises(ValueError):
+        tm.create_task(" Walk", "Unpadded time", "8:05", 8, 30, "walk")
+
+
+def test_vectorized_selection_matches_python_loop():
+    """Verify the NumPy planner path picks exactly the same plan as the Python loop"""
+    pytest.importorskip("numpy")
+    import random
+    rng = random.Random(3)
+    tm = TaskManager()
+    types = ["walk", "feed", "medication", "grooming", "playtime"]
+    for i in range(500):
+        tm.create_task(f"Task {i}", "Random task", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+                       rng.randrange(11), rng.randrange(1, 90), rng.choice(types))
+
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+    planner.set_preferences({'preferred_task_types': ['walk'], 'avoided_task_types': ['grooming', 'walk']})
+    tasks = tm.get_all_tasks()
+    for budget in (0, 17, 240, 1440):
+        planner.set_available_time(budget)
+        expected = planner._select_greedy(tasks, {'walk'}, {'grooming', 'walk'})
+        assert planner._select_vectorized(tasks, {'walk'}, {'grooming', 'walk'}) == expected
+
+
+def test_optimal_mode_fills_time_greedy_leaves_unused():
+    """Verify mode="optimal" finds the best-scoring set and the summary reports the greedy gap"""
+    tm = TaskManager()
+    tm.create_task("Vet", "Checkup", "09:00", 9, 35, "medication")
+    tm.create_task("Walk", "Park walk", "10:00", 8, 30, "walk")
+    tm.create_task("Feed", "Lunch", "12:00", 8, 30, "feed")
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+    planner.set_available_time(60)
+
+    greedy = planner.generate_plan()
+    assert [t.get_task_name() for t in greedy] == ["Vet"]
+    summary = planner.get_plan_summary()
+    assert (summary['plan_score'], summary['optimal_score'], summary['optimality_gap']) == (9, 16, 7)
+
+    optimal = planner.generate_plan(mode="optimal")
+    assert [t.get_task_name() for t in optimal] == ["Walk", "Feed"]
+    assert planner.get_plan_summary()['optimality_gap'] == 0
+
+    # The gap is kept with the cached greedy plan, so its summary needs no new knapsack
+    planner.generate_plan()
+    assert planner._optimality['optimality_gap'] == 7
+    assert planner.get_plan_summary()['optimality_gap'] == 7
+
+    with pytest.raises(ValueError):
+        planner.generate_plan(mode="fastest")
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_optimal_mode_matches_brute_force(monkeypatch, use_numpy):
+    """Verify the knapsack matches trying every subset, with and without NumPy"""
+    import itertools
+    import random
+    import pawpal_system
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(pawpal_system, "np", None)
+
+    rng = random.Random(11)
+    for _ in range(20):
+        tm = TaskManager()
+        for i in range(8):
+            tm.create_task(f"Task {i}", "Random task", "08:00", rng.randrange(6), rng.randrange(5, 40),
+                           rng.choice(["walk", "feed", "grooming"]))
+        planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+        planner.set_preferences({'preferred_task_types': ['walk'], 'avoided_task_types': ['grooming']})
+        budget = rng.randrange(20, 120)
+        planner.set_available_time(budget)
+        plan = planner.generate_plan(mode="optimal")
+
+        scored = planner._rank_tasks(tm.get_all_tasks(), {'walk'}, {'grooming'})
+        best = max(
+            sum(score for score, _ in subset)
+            for size in range(len(scored) + 1)
+            for subset in itertools.combinations(scored, size)
+            if sum(task.get_duration() for _, task in subset) <= budget
+        )
+        scores = {task.get_task_id(): score for score, task in scored}
+        assert sum(task.get_duration() for task in plan) <= budget
+        assert sum(scores[task.get_task_id()] for task in plan) == best
+
+
+def test_plan_for_all_budgets_matches_single_budget_plans():
+    """Verify one all-budgets table gives the same best score as planning each budget separately"""
+    import random
+    rng = random.Random(5)
+    tm = TaskManager()
+    for i in range(30):
+        tm.create_task(f"Task {i}", "Random task", "08:00", rng.randrange(11), rng.randrange(5, 90),
+                       rng.choice(["walk", "feed", "playtime"]))
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+    planner.set_preferences({'preferred_task_types': ['feed']})
+
+    plans = planner.plan_for_all_budgets()
+    curve = plans.utilization_curve()
+    assert len(curve) == DailyPlanner.MAX_BUDGET + 1
+
+    for budget in (0, 25, 60, 240, 600, 1440):
+        planner.set_available_time(budget)
+        planner.generate_plan(mode="optimal")
+        plan = plans.plan_for(budget)
+        assert plans.score_for(budget) == planner.get_optimality_gap()['optimal_score']
+        assert sum(t.get_duration() for t in plan) == plans.minutes_for(budget) <= budget
+        if budget:
+            assert curve[budget] == plans.minutes_for(budget) / budget * 100
+
+    with pytest.raises(ValueError):
+        plans.plan_for(1441)
+
+
+def test_plan_placement_keeps_buffer_between_same_pet_tasks():
+    """Verify generate_plan gives each task a start time with buffer_minutes between same-pet tasks"""
+    tm = TaskManager()
+    walk = tm.create_task("Walk", "Morning walk", "08:00", 10, 30, "walk", pet_id="Max")
+    feed = tm.create_task("Feed", "Breakfast", "08:20", 9, 10, "feed", pet_id="Max")
+    meds = tm.create_task("Meds", "Pill", "08:05", 8, 5, "medication", pet_id="Max")
+    luna = tm.create_task("Luna Feed", "Wet food", "08:00", 7, 10, "feed", pet_id="Luna")
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm, buffer_minutes=5)
+    planner.set_available_time(120)
+    planner.generate_plan()
+
+    # Walk keeps its time, Feed moves right after the walk plus buffer,
+    # Meds goes before the walk, Luna is a different pet and is not moved
+    assert planner.get_scheduled_time(walk) == "08:00"
+    assert planner.get_scheduled_time(feed) == "08:35"
+    assert planner.get_scheduled_time(meds) == "07:50"
+    assert planner.get_scheduled_time(luna) == "08:00"
+    assert [t for _, t in planner.get_schedule()] == [meds, walk, luna, feed]
+    assert planner.get_plan_summary()['tasks_moved'] == 2
+    assert "08:35 (moved from 08:20)" in planner.explain_plan()
+
+    # Tasks without a pet are placed independently of every other task
+    brush = tm.create_task("Brush", "Coat", "08:00", 6, 10, "grooming")
+    bowl = tm.create_task("Bowl", "Refill water", "08:00", 6, 10, "feed")
+    planner.generate_plan()
+    assert planner.get_scheduled_time(brush) == planner.get_scheduled_time(bowl) == "08:00"
+    assert planner.get_scheduled_time(feed) == "08:35"
+
+
+def test_plan_cache_hits_until_tasks_change():
+    """Verify generate_plan reuses cached plans until the task store version changes"""
+    tm = TaskManager()
+    walk = tm.create_task("Walk", "Morning walk", "08:00", 10, 30, "walk")
+    tm.create_task("Feed", "Breakfast", "09:00", 9, 10, "feed")
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm, cache_size=2)
+    planner.set_available_time(60)
+    planner.set_preferences({'preferred_task_types': ['feed']})
+
+    first = planner.generate_plan()
+    assert planner.generate_plan() == first
+    assert planner.get_cache_stats()['hits'] == 1
+
+    version = tm.get_version()
+    walk.set_duration(45)
+    assert tm.get_version() > version
+    assert sum(t.get_duration() for t in planner.generate_plan()) == 55
+    assert planner.get_cache_stats()['misses'] == 2
+
+    planner.set_available_time(30)
+    planner.generate_plan()
+    assert planner.get_cache_stats() == {'hits': 1, 'misses': 3, 'evictions': 1, 'size': 2, 'max_size': 2}
+
+
+def test_incremental_replanning_matches_full_rebuild():
+    """Verify incremental plan repairs agree with a full rebuild after every kind of change"""
+    import random
+    rng = random.Random(21)
+    tm = TaskManager()
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm, cache_size=0)
+    planner.set_available_time(180)
+    planner.set_preferences({'preferred_task_types': ['walk'], 'avoided_task_types': ['grooming']})
+    planner.enable_incremental(verify=True)
+
+    types = ["walk", "feed", "grooming", "playtime"]
+    for i in range(40):
+        tm.create_task(f"Task {i}", "Random task", f"{rng.randrange(24):02d}:00", rng.randrange(11),
+                       rng.randrange(5, 60), rng.choice(types), pet_id=rng.choice(["Max", "Luna"]))
+    planner.generate_plan()
+
+    for step in range(150):
+        tasks = tm.get_all_tasks()
+        task = rng.choice(tasks)
+        action = rng.randrange(5)
+        if action == 0:
+            tm.create_task(f"New {step}", "Added task", "10:00", rng.randrange(11), rng.randrange(5, 60),
+                           rng.choice(types))
+        elif action == 1 and len(tasks) > 5:
+            tm.delete_task(task.get_task_id())
+        elif action == 2:
+            tm.edit_task(task.get_task_id(), duration=rng.randrange(5, 60))
+        elif action == 3:
+            task.set_priority(rng.randrange(11))
+        else:
+            tm.mark_task_completed(task.get_task_id())
+        # verify=True raises if the repaired plan differs from a full rebuild
+        planner.generate_plan()
+
+    planner.disable_incremental()
+    assert planner._incremental is None
+
+
+def test_integer_minutes_and_tasks_past_midnight():
+    """Verify minute getters, the HH:MM parser and conflicts for tasks that run past midnight"""
+    tm = TaskManager()
+    late = tm.create_task("Night walk", "Late walk", "23:30", 5, 60, "walk", pet_id="Max")
+    early = tm.create_task("Early feed", "Breakfast", "0:15", 7, 10, "feed", pet_id="Max")
+    dawn = tm.create_task("Dawn play", "Fetch", "06:00", 3, 20, "playtime", pet_id="Max")
+
+    assert (late.get_start_minute(), late.get_end_minute()) == (1410, 1470)
+    assert late.crosses_midnight() and not early.crosses_midnight()
+    assert late.get_end_time_obj().strftime("%H:%M") == "00:30"
+    assert early.get_time_obj().strftime("%H:%M") == "00:15"
+
+    # The late walk wraps onto the early morning and overlaps breakfast
+    assert [t for t, _ in tm.check_task_conflicts(early)] == [late]
+    assert [(a, b) for a, b, _ in tm.get_all_conflicts()] == [(late, early)]
+    assert TaskManager._find_overlapping_pairs(tm.get_all_tasks()) == [(0, 1)]
+    assert tm.get_tasks_sorted_by_time() == [early, dawn, late]
+
+    tm.edit_task(late.get_task_id(), duration=30)
+    assert tm.get_all_conflicts() == []
+
+    for bad in ("24:00", "12:60", "1230", "12:3a", "", "١٢:٠٠", "123:00"):
+        with pytest.raises(ValueError):
+            Task._parse_minutes(bad)
+    assert Task._parse_minutes(" 7:5 ") == 425
+
+
 if __name__ == '__main__':
     test_task_completion()
     test_task_addition()
+
+
+def test_plan_trace_records_decisions_only_when_enabled():
+    """Verify explanations record each decision with its score and reason, and are off by default"""
+    tm = TaskManager()
+    tm.create_task("Walk", "Morning walk", "07:00", 8, 60, "walk")
+    tm.create_task("Bath", "Shampoo", "10:00", 5, 45, "grooming")
+    tm.create_task("Feed", "Breakfast", "12:00", 9, 10, "feed")
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+    planner.set_available_time(90)
+    planner.set_preferences({'preferred_task_types': ['walk'], 'avoided_task_types': ['grooming']})
+
+    planner.generate_plan()
+    assert planner.get_plan_trace() is None
+    assert "enable_explanations()" in planner.explain_plan()
+
+    planner.enable_explanations()
+    planner.generate_plan()
+    trace = planner.get_plan_trace()
+    assert len(trace) == 3 and trace.get_mode() == "greedy"
+    assert [trace.is_selected(i) for i in range(3)] == [True, True, False]
+    assert trace.describe(0) == ("Walk [walk] 60 min, score 18 = priority 8 +10 preferred: "
+                                 "selected: fits, 30 min left after it")
+    assert trace.reason(2) == "did not fit: 20 min left"
+    assert "score 0 = priority 5 -5 avoided: did not fit: 20 min left" in planner.explain_plan()
+
+    planner.generate_plan("optimal")
+    trace = planner.get_plan_trace()
+    assert trace.get_mode() == "optimal"
+    assert trace.reason(2) == "excluded: score 0 is not positive"
+
+    planner.set_available_time(50)
+    planner.set_preferences({})
+    planner.generate_plan("optimal")
+    reasons = {line.split(" [")[0][3:]: line for line in planner.get_plan_trace().render()}
+    assert reasons["Walk"].endswith("did not fit: longer than the 50 min available")
+    assert reasons["Bath"].endswith("excluded: a higher total score without it")
+
+    planner.disable_explanations()
+    assert planner.get_plan_trace() is None
+
+
+def test_explain_plan_paginates_long_plans():
+    """Verify explain_plan renders one page of tasks and decisions for large plans"""
+    tm = TaskManager()
+    tm.add_tasks([Task(f"Check {i}", "Check-in", f"{i // 60 % 24:02d}:{i % 60:02d}", i % 11, 1, "feed",
+                       pet_id=f"pet{i}") for i in range(3000)])
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+    planner.enable_explanations()
+    planner.set_available_time(1000)
+    plan = planner.generate_plan()
+    assert len(plan) == 1000 and len(planner.get_plan_trace()) == 3000
+
+    text = planner.explain_plan(page=3, page_size=20)
+    assert "Selected Tasks (in priority order, page 3 of 50):" in text
+    assert f"  41. {plan[40].get_task_name()} " in text and "  61. " not in text
+    assert "=== Decisions (greedy, 41-60 of 3000) ===" in text
+    assert "(page 3 of 150)" in text
+    assert "... and 1995 more" in text
+    assert len(text.splitlines()) < 80
+
+    # Out of range pages are clamped
+    assert "=== Decisions (greedy, 2981-3000 of 3000) ===" in planner.explain_plan(page=999, page_size=20)
+    with pytest.raises(ValueError):
+        planner.explain_plan(page_size=0)
+
+
+def test_optimize_stream_matches_greedy_with_bounded_candidates():
+    """Verify the streaming planner picks the greedy plan while holding only tasks that can still fit"""
+    import random
+    rng = random.Random(7)
+    types = ["walk", "feed", "grooming", "playtime"]
+    rows = [(rng.randrange(11), rng.choice([1, 5, 10, 15, 30, 45, 60, 300]), rng.choice(types))
+            for _ in range(20000)]
+
+    def stream():
+        # Tasks are built on demand and never held in a list
+        for i, (priority, duration, task_type) in enumerate(rows):
+            yield Task(f"Task {i}", "Streamed", "08:00", priority, duration, task_type)
+
+    planner = DailyPlanner(Pet("Max", 3, "dog"), TaskManager())
+    with pytest.raises(ValueError):
+        planner.optimize_stream(stream())
+    planner.set_available_time(240)
+    planner.set_preferences({'preferred_task_types': ['walk'], 'avoided_task_types': ['grooming']})
+    plan = planner.optimize_stream(stream())
+
+    # Reference greedy: score order, ties by arrival, take every task that still fits
+    bonus = {'walk': 10, 'grooming': -5}
+    ranked = sorted(range(len(rows)), key=lambda i: (-(rows[i][0] + bonus.get(rows[i][2], 0)), i))
+    expected, remaining = [], 240
+    for i in ranked:
+        if rows[i][1] <= remaining:
+            expected.append(f"Task {i}")
+            remaining -= rows[i][1]
+    assert [task.get_task_name() for task in plan] == expected
+
+    stats = planner.get_stream_stats()
+    assert stats['seen'] == 20000 and stats['selected'] == len(expected)
+    assert stats['candidates_peak'] < 2000
+
+
+def test_optimize_stream_over_store_iterators():
+    """Verify iter_tasks streams both stores and the result matches optimize_schedule"""
+    from pawpal_sqlite import SqliteTaskManager
+    for tm in (TaskManager(), SqliteTaskManager()):
+        for i in range(40):
+            tm.create_task(f"Task {i}", "Stored", f"{6 + i % 12:02d}:{i % 4 * 15:02d}", i % 11,
+                           5 + i % 6 * 10, ["walk", "feed"][i % 2], allow_duplicates=True)
+        planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+        planner.set_available_time(180)
+        planner.set_preferences({'preferred_task_types': ['feed'], 'sort_by_time': True})
+        assert planner.optimize_stream(tm.iter_tasks()) == planner.optimize_schedule("greedy")
+        assert [t.get_task_id() for t in tm.iter_tasks()] == [t.get_task_id() for t in tm.get_all_tasks()]
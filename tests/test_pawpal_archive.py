@@ -0,0 +1,68 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from datetime import date, datetime, timedelta
+
+from pawpal_system import TaskManager
+from pawpal_archive import TaskArchive
+
+
+def test_compact_moves_old_completed_tasks_to_archive(tmp_path):
+    """Verify compaction archives only old completed one-off tasks and keeps them queryable"""
+    tm = TaskManager()
+    old_day = date(2026, 1, 5)
+    vet = tm.create_task("Vet", "Checkup", "09:00", 9, 60, "medication", pet_id="Max", start_date=old_day)
+    bath = tm.create_task("Bath", "Bath time", "10:00", 4, 30, "grooming", pet_id="Luna", start_date=old_day)
+    walk = tm.create_task("Walk", "Daily walk", "07:00", 8, 30, "walk", recurrence="daily", start_date=old_day)
+    feed = tm.create_task("Feed", "Breakfast", "08:00", 9, 10, "feed")
+    for task in (vet, bath, walk, feed):
+        task.mark_completed()
+
+    path = str(tmp_path / "archive.jsonl")
+    archive = TaskArchive(path)
+    moved = tm.compact(archive, older_than_days=30, now=datetime.now() + timedelta(days=31))
+
+    # The recurring series is never archived
+    assert moved == 3
+    assert tm.get_all_tasks() == [walk]
+    assert tm.get_completed_tasks() == [walk]
+    assert archive.get_summary() == {
+        'count': 3, 'total_duration': 100,
+        'by_type': {'medication': 1, 'grooming': 1, 'feed': 1},
+        'by_pet': {'Max': 1, 'Luna': 1, None: 1},
+    }
+
+    restored = list(archive.iter_tasks())
+    assert [t.get_task_id() for t in restored] == [vet.get_task_id(), bath.get_task_id(), feed.get_task_id()]
+    assert all(t.is_completed() for t in restored)
+    assert [t.get_task_name() for t in archive.query(pet_id="Luna")] == ["Bath"]
+    assert [t.get_task_name() for t in archive.query(end=old_day)] == ["Vet", "Bath"]
+
+    # Reopening the file rebuilds the counters by streaming it
+    assert TaskArchive(path).get_summary() == archive.get_summary()
+
+
+def test_auto_compaction_runs_past_threshold(tmp_path):
+    """Verify compaction runs after completions once the threshold is reached, not inside a change"""
+    tm = TaskManager()
+    archive = TaskArchive(str(tmp_path / "archive.jsonl"))
+    tm.set_auto_compaction(archive, older_than_days=0, threshold=3)
+
+    tasks = [tm.create_task(f"Task {i}", "Chore", "08:00", 1, 5, "chore", allow_duplicates=True)
+             for i in range(5)]
+    tm.mark_task_completed(tasks[0].get_task_id())
+    tm.mark_task_completed(tasks[1].get_task_id())
+    assert len(archive) == 0
+
+    # Completing a Task directly never compacts in the middle of the change
+    tasks[2].mark_completed()
+    assert len(archive) == 0 and len(tm.get_all_tasks()) == 5
+    assert tm.run_auto_compaction() == 3
+    assert len(archive) == 3
+    assert tm.get_all_tasks() == tasks[3:]
+
+    # mark_task_completed checks once the completion is stored
+    tm.set_auto_compaction(archive, older_than_days=0, threshold=1)
+    assert tm.mark_task_completed(tasks[3].get_task_id()) is None
+    assert tm.get_all_tasks() == tasks[4:] and len(archive) == 4
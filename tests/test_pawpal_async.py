@@ -0,0 +1,76 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+
+import pytest
+
+from pawpal_system import Pet
+from pawpal_async import AsyncDailyPlanner, AsyncTaskManager, generate_plans
+
+
+def test_concurrent_create_task_calls_share_one_batch():
+    """Verify a burst of create_task calls is stored in one batch with per-call errors"""
+    async def scenario():
+        async with AsyncTaskManager() as atm:
+            results = await asyncio.gather(
+                atm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk", pet_id="Max"),
+                atm.create_task("Feed", "Breakfast", "08:00", 9, 10, "feed", pet_id="Max"),
+                atm.create_task("Walk", "Again", "07:00", 5, 30, "walk"),
+                atm.create_task("Meds", "Pill", "25:00", 9, 5, "medication"),
+                return_exceptions=True
+            )
+            # Reads issued right after creates see them
+            bath, by_pet = await asyncio.gather(
+                atm.create_task("Bath", "Bath time", "10:00", 4, 20, "grooming", pet_id="Max"),
+                atm.get_tasks_by_pet("Max"),
+            )
+            return results, by_pet, bath, atm.get_batch_count()
+
+    results, by_pet, bath, batches = asyncio.run(scenario())
+    walk, feed, duplicate, invalid = results
+    assert walk.get_task_name() == "Walk" and feed.get_task_name() == "Feed"
+    assert isinstance(duplicate, ValueError) and "already exists" in str(duplicate)
+    assert isinstance(invalid, ValueError)
+    assert by_pet == [walk, feed, bath]
+    assert batches == 2
+
+
+def test_generate_plans_for_several_pets_matches_sync_planner():
+    """Verify gathered plans equal the plans of the wrapped planners run directly"""
+    async def scenario():
+        async with AsyncTaskManager() as atm:
+            await asyncio.gather(
+                atm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk"),
+                atm.create_task("Feed", "Breakfast", "08:00", 9, 10, "feed"),
+                atm.create_task("Play", "Fetch", "16:00", 5, 45, "playtime"),
+            )
+            planners = []
+            for pet, minutes in ((Pet("Max", 3, "dog"), 60), (Pet("Luna", 2, "cat"), 20)):
+                planner = AsyncDailyPlanner(pet, atm)
+                planner.get_planner().set_available_time(minutes)
+                planners.append(planner)
+            plans = await generate_plans(planners)
+            summary = await planners[0].get_plan_summary()
+            return planners, plans, summary
+
+    planners, plans, summary = asyncio.run(scenario())
+    assert [[t.get_task_name() for t in plan] for plan in plans] == [["Feed", "Walk"], ["Feed"]]
+    for planner, plan in zip(planners, plans):
+        assert planner.get_planner().get_last_plan() == plan
+    assert summary['total_tasks'] == 2
+
+
+def test_create_task_surfaces_errors_to_each_caller():
+    """Verify an awaited create_task raises the ValueError of its own row"""
+    async def scenario():
+        async with AsyncTaskManager() as atm:
+            await atm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk")
+            with pytest.raises(ValueError):
+                await atm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk")
+            task = await atm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk", allow_duplicates=True)
+            return len(await atm.get_all_tasks()), task
+
+    count, task = asyncio.run(scenario())
+    assert count == 2 and task.get_time() == "07:00"
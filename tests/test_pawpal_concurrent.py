@@ -0,0 +1,99 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+
+import pytest
+
+from pawpal_system import DailyPlanner, Pet, TaskManager
+from pawpal_concurrent import ConcurrentTaskManager
+
+
+def test_snapshots_are_isolated_from_later_writes():
+    """Verify a snapshot keeps its contents while writers publish new ones"""
+    ctm = ConcurrentTaskManager()
+    walk = ctm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk", pet_id="Max")
+    before = ctm.snapshot()
+
+    feed = ctm.create_task("Feed", "Breakfast", "07:15", 9, 10, "feed", pet_id="Max")
+    assert before.get_all_tasks() == [walk]
+    assert before.get_all_conflicts() == []
+    assert before.get_tasks_by_pet("Max") == [walk]
+    assert ctm.get_tasks_by_pet("Max") == [walk, feed]
+    assert [(a, b) for a, b, _ in ctm.get_all_conflicts()] == [(walk, feed)]
+
+    # Changes through Task setters reach the live store and are published,
+    # while older snapshots keep a frozen copy that still matches their indexes
+    middle = ctm.snapshot()
+    feed.set_priority(2)
+    assert ctm.get_tasks_by_priority(5) == [walk]
+    assert before.get_tasks_by_priority(5) == [walk]
+    frozen = middle.get_task_by_id(feed.get_task_id())
+    assert frozen is not feed and frozen.get_priority() == 9
+    assert [t.get_priority() for t in middle.get_tasks_by_priority(5)] == [8, 9]
+    with pytest.raises(RuntimeError):
+        frozen.set_priority(1)
+    assert ctm.get_task_by_id(feed.get_task_id()) is feed
+
+    # One publish per batch
+    published = ctm.get_publish_count()
+    with ctm.batch() as tm:
+        tm.create_task("Play", "Fetch", "16:00", 5, 45, "playtime")
+        tm.edit_task(walk.get_task_id(), time="08:00")
+    assert ctm.get_publish_count() == published + 1
+    assert ctm.get_all_conflicts() == []
+
+    with pytest.raises(RuntimeError):
+        ctm.snapshot().create_task("Bath", "Bath time", "10:00", 4, 20, "grooming")
+    with pytest.raises(RuntimeError):
+        ctm.snapshot().delete_task(walk.get_task_id())
+
+    planner = DailyPlanner(Pet("Max", 3, "dog"), ctm)
+    planner.set_available_time(60)
+    assert [t.get_task_name() for t in planner.generate_plan()] == ["Walk", "Feed"]
+
+    # A deleted task can still be changed, but not inside the snapshots that held it
+    last = ctm.snapshot()
+    ctm.delete_task(feed.get_task_id())
+    feed.set_priority(10)
+    assert last.get_task_by_id(feed.get_task_id()).get_priority() == 2
+
+
+def test_readers_never_fail_while_a_writer_runs():
+    """Verify conflict scans and sorts in reader threads stay consistent during writes"""
+    ctm = ConcurrentTaskManager()
+    errors = []
+    done = threading.Event()
+    seen = []
+
+    def writer():
+        for i in range(200):
+            ctm.create_task(f"Task {i}", "Check-in", f"{(i * 7) % 24:02d}:{i % 60:02d}", i % 11, 5, "walk")
+            if i % 5 == 0:
+                ctm.delete_task(ctm.get_all_tasks()[0].get_task_id())
+        done.set()
+
+    def reader():
+        try:
+            while not done.is_set():
+                snap = ctm.snapshot()
+                tasks = snap.get_tasks_sorted_by_time()
+                conflicts = snap.get_all_conflicts()
+                ids = {t.get_task_id() for t in tasks}
+                assert all(a.get_task_id() in ids and b.get_task_id() in ids for a, b, _ in conflicts)
+                seen.append(len(tasks))
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(2)] + [threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert seen
+    reference = TaskManager()
+    reference.add_tasks(ctm.get_all_tasks())
+    assert len(ctm.get_all_conflicts()) == len(reference.get_all_conflicts())
@@ -0,0 +1,89 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gzip
+import io
+
+from pawpal_system import Owner, Pet, TaskManager
+from pawpal_sqlite import SqliteTaskManager
+from pawpal_io import export_jsonl, import_jsonl
+from pawpal_trace import RecordingTaskManager, TraceRecorder
+
+
+def test_jsonl_round_trip_with_owner_and_gzip(tmp_path):
+    """Verify tasks and the owner survive export and import, plain and gzip-compressed"""
+    owner = Owner("Jordan", "jordan@example.com")
+    owner.add_pet(Pet("Max", 3, "dog"))
+    tm = TaskManager()
+    walk = tm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk", recurrence="daily", pet_id="Max")
+    tm.create_task("Meds", "Pill", "23:50", 9, 20, "medication", pet_id="Max")
+    walk.mark_completed()
+
+    for name in ("tasks.jsonl", "tasks.jsonl.gz"):
+        path = str(tmp_path / name)
+        assert export_jsonl(path, tm, owner) == 3
+        for restored in (TaskManager(), SqliteTaskManager()):
+            result = import_jsonl(path, restored)
+            assert result['imported'] == 2 and result['rejected'] == 0
+            assert result['owner'].get_owner_id() == owner.get_owner_id()
+            assert [p.get_name() for p in result['owner'].get_pets()] == ["Max"]
+            assert [t.to_dict() for t in restored.get_tasks_sorted_by_time()] == \
+                [t.to_dict() for t in tm.get_tasks_sorted_by_time()]
+
+    # Compressed input is also detected on binary file objects
+    with open(str(tmp_path / "tasks.jsonl.gz"), "rb") as f:
+        assert import_jsonl(f, TaskManager())['imported'] == 2
+    assert gzip.open(str(tmp_path / "tasks.jsonl.gz"), "rt").readline().startswith('{"kind": "owner"')
+
+
+def test_import_jsonl_sends_bad_rows_to_reject_sink():
+    """Verify invalid and duplicate rows are rejected with line numbers while good rows load"""
+    tm = TaskManager()
+    tm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk")
+    out = io.StringIO()
+    export_jsonl(out, tm)
+    good = out.getvalue()
+
+    lines = [
+        good,                                   # 1: duplicate ID of a stored task
+        "not json\n",                           # 2
+        '{"kind": "task", "task_name": "Feed", "time": "25:00"}\n',  # 3: invalid fields
+        '{"kind": "pet", "name": "Max"}\n',     # 4: unknown kind
+        '{"task_name": "Feed", "description": "Breakfast", "time": "08:00", "priority": 9,'
+        ' "duration": 10, "task_type": "feed"}\n',  # 5: valid, kind defaults to task
+        '{"task_name": "Feed", "description": "Again", "time": "08:00", "priority": 5,'
+        ' "duration": 10, "task_type": "feed"}\n',  # 6: same name and time as line 5
+    ]
+    rejects = []
+    result = import_jsonl(io.StringIO("".join(lines)), tm,
+                          reject=lambda n, line, msg: rejects.append(n), chunk_size=2)
+
+    assert result == {'imported': 1, 'rejected': 5, 'owner': None}
+    assert rejects == [1, 2, 3, 4, 6]
+    assert sorted(t.get_task_name() for t in tm.get_all_tasks()) == ["Feed", "Walk"]
+
+
+def test_callers_open_files_stay_usable(tmp_path):
+    """Verify export and trace recording leave a caller's open() file usable, and duplicates are caught across chunks"""
+    path = str(tmp_path / "tasks.jsonl")
+    tm = TaskManager()
+    tm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk")
+    tm.create_task("Feed", "Breakfast", "08:00", 9, 10, "feed")
+
+    with open(path, "w", encoding="utf-8") as f:
+        assert export_jsonl(f, tm) == 2
+        with TraceRecorder(f) as recorder:
+            RecordingTaskManager(TaskManager(), recorder).create_task("Play", "Ball", "09:00", 5, 15, "playtime")
+        assert not f.closed
+        f.write("\n")
+
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) >= 4 and lines[-1] == ""  # written after both were done with the file
+
+    # Line 2 repeats line 1 in a later chunk and is caught through the manager
+    walk = lines[0]
+    restored = TaskManager()
+    result = import_jsonl(io.StringIO(walk + "\n" + walk + "\n"), restored, chunk_size=1)
+    assert result == {'imported': 1, 'rejected': 1, 'owner': None}
@@ -0,0 +1,80 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+
+import pytest
+
+from pawpal_system import DailyPlanner, Pet, TaskManager
+from pawpal_sqlite import SqliteTaskManager
+from pawpal_metrics import Metrics
+
+
+def test_metrics_record_calls_sizes_and_restore_methods():
+    """Verify enabled metrics count calls, latencies and sizes, and disable restores the methods"""
+    original = TaskManager.create_task
+    metrics = Metrics(window=100)
+    metrics.enable()
+    try:
+        assert TaskManager.create_task is not original
+        metrics.enable()  # idempotent
+        with pytest.raises(RuntimeError):
+            Metrics().enable()
+
+        tm = TaskManager()
+        tm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk")
+        tm.create_task("Feed", "Breakfast", "07:15", 9, 10, "feed")
+        with pytest.raises(ValueError):
+            tm.create_task("Walk", "Duplicate", "07:00", 1, 5, "walk")
+        assert len(tm.get_all_conflicts()) == 1
+        planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+        planner.set_available_time(60)
+        plan = planner.generate_plan()
+        SqliteTaskManager().get_all_tasks()
+    finally:
+        metrics.disable()
+    assert TaskManager.create_task is original
+
+    calls = metrics.get_metrics()['methods']['TaskManager.get_all_tasks']['calls']
+    tm.get_all_tasks()  # not counted once disabled
+    methods = metrics.get_metrics()['methods']
+    assert methods['TaskManager.get_all_tasks']['calls'] == calls
+    create = methods['TaskManager.create_task']
+    assert create['calls'] == 3 and create['errors'] == 1
+    assert create['tasks_max'] == 2 and create['tasks_mean'] == 1.0
+    assert 0 < create['p50_ms'] <= create['p99_ms'] <= create['max_ms']
+    assert methods['TaskManager.get_all_conflicts']['result_max'] == 1
+    assert methods['DailyPlanner.generate_plan']['result_max'] == len(plan)
+    assert methods['DailyPlanner.generate_plan']['tasks_max'] == 2
+    assert methods['SqliteTaskManager.get_all_tasks']['tasks_max'] is None
+    assert metrics.get_metrics()['enabled'] is False
+
+    metrics.reset()
+    assert metrics.get_metrics()['methods'] == {}
+
+
+def test_metrics_export_prometheus_and_json():
+    """Verify the Prometheus exposition and JSON dump carry the same counts"""
+    metrics = Metrics()
+    metrics.enable([TaskManager])
+    try:
+        tm = TaskManager()
+        for hour in range(5):
+            tm.create_task(f"Walk {hour}", "Walk", f"{hour + 6:02d}:00", 5, 30, "walk")
+        tm.get_tasks_sorted_by_time()
+    finally:
+        metrics.disable()
+
+    text = metrics.to_prometheus()
+    assert "# TYPE pawpal_call_duration_seconds summary" in text
+    assert 'pawpal_call_duration_seconds{method="TaskManager.create_task",quantile="0.99"}' in text
+    assert 'pawpal_call_duration_seconds_count{method="TaskManager.create_task"} 5\n' in text
+    assert 'pawpal_call_errors_total{method="TaskManager.create_task"} 0\n' in text
+    assert 'pawpal_call_tasks_sum{method="TaskManager.create_task"} 10\n' in text
+    assert 'pawpal_call_result_size_sum{method="TaskManager.get_tasks_sorted_by_time"} 5\n' in text
+
+    dumped = json.loads(metrics.to_json())
+    assert dumped['methods']['TaskManager.create_task']['calls'] == 5
+    # create_task checks for duplicates through the public method, which is counted too
+    assert dumped['methods']['TaskManager.has_duplicate_task']['calls'] == 5
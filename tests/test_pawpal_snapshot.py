@@ -0,0 +1,78 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+import pawpal_snapshot
+from pawpal_system import TaskManager, DailyPlanner, Pet
+from pawpal_snapshot import Snapshot, write_snapshot
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_snapshot_round_trip_and_queries(tmp_path, monkeypatch, use_numpy):
+    """Verify a snapshot answers queries like the TaskManager it was written from"""
+    if not use_numpy:
+        monkeypatch.setattr(pawpal_snapshot, "np", None)
+    tm = TaskManager()
+    tm.create_task("Walk", "Morning walk", "07:00", 10, 30, "walk", recurrence="daily", pet_id="Max")
+    tm.create_task("Vet", "Checkup", "23:30", 9, 60, "medical", pet_id="Max")
+    tm.create_task("Feed", "Wet food ü", "00:10", 8, 5, "feed", pet_id="Luna")
+    tm.create_task("Brush", "Brush fur", "08:32", 3, 15, "grooming")
+    tm.mark_task_completed(tm.get_all_tasks()[0].get_task_id())
+    tm.get_all_tasks()[2].mark_completed()
+
+    path = str(tmp_path / "tasks.snap")
+    assert write_snapshot(tm.get_all_tasks(), path) == 4
+
+    def names(tasks):
+        return [t.get_task_name() for t in tasks]
+
+    with Snapshot(path) as snap:
+        assert len(snap) == 4
+        assert names(snap.get_all_tasks()) == names(tm.get_all_tasks())
+        assert names(snap.get_tasks_by_pet("Max")) == names(tm.get_tasks_by_pet("Max"))
+        assert names(snap.get_tasks_by_pet(None)) == ["Brush"]
+        assert names(snap.get_tasks_by_type("FEED")) == ["Feed"]
+        assert names(snap.get_tasks_by_priority(9)) == names(tm.get_tasks_by_priority(9))
+        assert names(snap.get_completed_tasks()) == names(tm.get_completed_tasks())
+        assert names(snap.get_recurring_tasks()) == ["Walk"]
+        assert names(snap.get_tasks_sorted_by_time()) == names(tm.get_tasks_sorted_by_time())
+        assert snap.get_total_duration(include_completed=False) == tm.get_total_duration(include_completed=False)
+
+        # Views turn into real tasks with their ID and completion history intact
+        walk = tm.get_all_tasks()[0]
+        loaded = snap.get_task_by_id(walk.get_task_id()).load()
+        assert loaded.to_dict() == walk.to_dict()
+        restored = snap.load_task_manager()
+        assert [t.to_dict() for t in restored.get_all_tasks()] == [t.to_dict() for t in tm.get_all_tasks()]
+        assert len(restored.get_all_conflicts()) == len(tm.get_all_conflicts())
+
+        # The planner can read straight from the snapshot
+        planners = [DailyPlanner(Pet("Max", 3, "dog"), source) for source in (tm, snap)]
+        for planner in planners:
+            planner.set_available_time(60)
+        assert names(planners[0].generate_plan()) == names(planners[1].generate_plan())
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    """Verify files with a bad magic number, version or byte order are refused"""
+    bad = tmp_path / "bad.snap"
+    bad.write_bytes(b"NOTASNAP" + bytes(16))
+    with pytest.raises(ValueError):
+        Snapshot(str(bad))
+
+    path = str(tmp_path / "tasks.snap")
+    write_snapshot([], path)
+    data = bytearray(open(path, "rb").read())
+    data[8] = pawpal_snapshot.FORMAT_VERSION + 1
+    bad.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        Snapshot(str(bad))
+    data[8] = pawpal_snapshot.FORMAT_VERSION
+    data[12:13] = b">" if data[12:13] == b"<" else b"<"
+    bad.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="byte order"):
+        Snapshot(str(bad))
+    with Snapshot(path) as snap:
+        assert len(snap) == 0 and snap.get_all_tasks() == []
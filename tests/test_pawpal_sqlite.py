@@ -0,0 +1,95 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+
+from pawpal_system import TaskManager, DailyPlanner, Pet
+from pawpal_sqlite import SqliteTaskManager
+
+
+def test_sqlite_manager_matches_in_memory_manager():
+    """Verify SqliteTaskManager queries and conflicts agree with TaskManager"""
+    rng = random.Random(11)
+    memory = TaskManager()
+    db = SqliteTaskManager(batch_size=7)
+    for i in range(120):
+        args = (f"Task {i}", "Random task", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+                rng.randrange(11), rng.choice([5, 15, 30, 90, 200]), rng.choice(["walk", "feed", "Play"]))
+        kwargs = dict(recurrence=rng.choice([None, "daily"]), pet_id=rng.choice(["Max", "Luna", None]))
+        memory.create_task(*args, **kwargs)
+        db.create_task(*args, **kwargs)
+    for tm in (memory, db):
+        tasks = tm.get_all_tasks()
+        tasks[3].mark_completed()
+        tm.edit_task(tasks[5].get_task_id(), time="23:50", duration=45)
+        tasks[8].set_priority(10)
+        tm.delete_task(tasks[9].get_task_id())
+
+    def names(tasks):
+        return [t.get_task_name() for t in tasks]
+
+    assert names(db.get_all_tasks()) == names(memory.get_all_tasks())
+    assert names(db.get_tasks_by_pet("Max")) == names(memory.get_tasks_by_pet("Max"))
+    assert names(db.get_tasks_by_type("play")) == names(memory.get_tasks_by_type("play"))
+    assert names(db.get_tasks_by_priority(8)) == names(memory.get_tasks_by_priority(8))
+    assert names(db.get_completed_tasks()) == names(memory.get_completed_tasks())
+    assert names(db.get_recurring_tasks()) == names(memory.get_recurring_tasks())
+    assert names(db.get_tasks_sorted_by_time()) == names(memory.get_tasks_sorted_by_time())
+    assert db.get_total_duration(include_completed=False) == memory.get_total_duration(include_completed=False)
+    assert ([(a.get_task_name(), b.get_task_name(), r) for a, b, r in db.get_all_conflicts()] ==
+            [(a.get_task_name(), b.get_task_name(), r) for a, b, r in memory.get_all_conflicts()])
+    for db_task, memory_task in zip(db.get_all_tasks()[:20], memory.get_all_tasks()[:20]):
+        assert ([(t.get_task_name(), r) for t, r in db.check_task_conflicts(db_task)] ==
+                [(t.get_task_name(), r) for t, r in memory.check_task_conflicts(memory_task)])
+
+    # Handed-out tasks keep their identity and the planner runs on either manager
+    assert db.get_all_tasks()[0] is db.get_task_by_id(db.get_all_tasks()[0].get_task_id())
+    plans = []
+    for tm in (memory, db):
+        planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+        planner.set_available_time(240)
+        plans.append(names(planner.generate_plan()))
+    assert plans[0] == plans[1]
+
+    # Incremental mode reads insertion ranks through the public accessor
+    planner = DailyPlanner(Pet("Max", 3, "dog"), db, cache_size=0)
+    planner.set_available_time(240)
+    planner.enable_incremental(verify=True)
+    planner.generate_plan()
+    late = db.create_task("Late walk", "Added task", "21:00", 10, 20, "walk")
+    db.get_all_tasks()[0].set_priority(0)
+    planner.generate_plan()  # verify=True raises if the repair differs from a full rebuild
+    assert db.get_insertion_rank(late.get_task_id()) > db.get_insertion_rank(db.get_all_tasks()[0].get_task_id())
+    assert db.get_insertion_rank("missing") is None
+
+
+def test_sqlite_manager_persists_between_connections(tmp_path):
+    """Verify tasks and completion state survive closing and reopening the database"""
+    path = str(tmp_path / "pawpal.db")
+    with SqliteTaskManager(path) as db:
+        walk = db.create_task("Walk", "Daily walk", "07:00", 8, 30, "walk", recurrence="daily", pet_id="Max")
+        db.create_task("Feed", "Breakfast", "08:00", 9, 10, "feed", pet_id="Max")
+        assert db.mark_task_completed(walk.get_task_id()) is walk
+        next_date = walk.next_occurrence().get_date()
+        walk_id = walk.get_task_id()
+
+    with SqliteTaskManager(path) as db:
+        walk = db.get_task_by_id(walk_id)
+        assert [t.get_task_name() for t in db.get_all_tasks()] == ["Walk", "Feed"]
+        assert db.get_completed_tasks() == [walk]
+        assert db.roll_over_recurring(next_date) == 1
+        assert walk.get_due_date() == next_date and db.get_completed_tasks() == []
+        assert walk.is_completed_on(walk.get_start_date())
+        assert db.has_duplicate_task("Feed", "08:00")
+
+    # A second connection sees each write of the first one without an explicit commit
+    with SqliteTaskManager(path) as first, SqliteTaskManager(path) as second:
+        held = second.get_task_by_id(walk_id)
+        version = second.get_version()
+        assert second.get_version() == version
+        first.create_task("Play", "Fetch", "17:00", 5, 20, "playtime")
+        first.edit_task(walk_id, time="06:30")
+        assert second.get_version() > version
+        assert [t.get_task_name() for t in second.get_tasks_sorted_by_time()] == ["Walk", "Feed", "Play"]
+        assert held.get_time() == "06:30" and held is second.get_task_by_id(walk_id)
@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from datetime import timedelta
+
+from pawpal_system import TaskManager
+from pawpal_store import TaskStore
+
+
+def test_store_matches_task_manager_queries():
+    """Verify TaskStore filters, sorting and conflicts agree with TaskManager"""
+    tm = TaskManager()
+    tm.create_task("Walk", "Morning walk", "07:00", 10, 30, "walk", recurrence="daily", pet_id="Max")
+    tm.create_task("Vet", "Checkup", "07:15", 9, 20, "medical", pet_id="Max")
+    tm.create_task("Feed", "Wet food", "08:30", 8, 5, "feed", pet_id="Luna")
+    tm.create_task("Brush", "Brush fur", "08:32", 3, 15, "grooming")
+    tm.get_all_tasks()[2].mark_completed()
+
+    store = TaskStore.from_task_manager(tm)
+
+    def names(tasks):
+        return [t.get_task_name() for t in tasks]
+
+    assert len(store) == 4
+    assert names(store.get_tasks_by_pet("Max")) == names(tm.get_tasks_by_pet("Max"))
+    assert names(store.get_tasks_by_priority(9)) == names(tm.get_tasks_by_priority(9))
+    assert names(store.get_completed_tasks()) == ["Feed"]
+    assert names(store.get_recurring_tasks()) == ["Walk"]
+    assert names(store.get_tasks_sorted_by_time()) == names(tm.get_tasks_sorted_by_time())
+    assert ([(names(pair), reason) for *pair, reason in store.get_all_conflicts()] ==
+            [(names(pair), reason) for *pair, reason in tm.get_all_conflicts()])
+    assert store.get_total_duration() == tm.get_total_duration()
+
+
+def test_store_views_write_back_and_report_memory():
+    """Verify views update their row, deletes hide rows, and memory is reported per task"""
+    store = TaskStore()
+    walk = store.create_task("Walk", "Morning walk", "07:00", 5, 30, "walk", recurrence="daily", pet_id="Max")
+    feed = store.create_task("Feed", "Breakfast", "08:00", 9, 10, "feed", pet_id="Max")
+
+    version = store.get_version()
+    walk.set_time("09:15")
+    walk.set_priority(7)
+    assert store.get_version() > version
+    assert store.get_task_by_id(walk.get_task_id()).get_time() == "09:15"
+    assert store.get_tasks_by_priority(7) == [walk, feed]
+    assert store.has_duplicate_task("Walk", "9:15") and not store.has_duplicate_task("Walk", "07:00")
+
+    # Completing a series sets its current occurrence's bit instead of adding a row
+    today = walk.get_due_date()
+    assert store.mark_task_completed(walk.get_task_id()) == walk
+    assert walk.is_completed() is True and len(store) == 2
+    assert store.roll_over_recurring(today) == 0
+    assert store.roll_over_recurring(today + timedelta(days=3)) == 1
+    assert walk.get_due_date() == today + timedelta(days=3) and walk.is_completed() is False
+    assert walk.is_completed_on(today) is True
+
+    assert store.delete_task(feed.get_task_id()) is True
+    assert store.get_task_by_id(feed.get_task_id()) is None
+    assert not store.has_duplicate_task("Feed", "08:00")
+    assert list(store.iter_tasks()) == store.get_all_tasks() == [walk]
+    assert store.bytes_per_task() == sum(store.memory_usage().values()) / 2
@@ -0,0 +1,85 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gzip
+import io
+import json
+from datetime import date
+
+import pytest
+
+from pawpal_system import Pet, Task, TaskManager
+from pawpal_trace import RecordingDailyPlanner, RecordingTaskManager, TraceRecorder, format_report, replay
+
+
+def record_session(fp) -> TaskManager:
+    """Record a short session of creates, edits, completions and plans, return the recorded store"""
+    with TraceRecorder(fp) as recorder:
+        tm = RecordingTaskManager(TaskManager(), recorder)
+        walk = tm.create_task("Walk", "Morning walk", "07:00", 8, 30, "walk", recurrence="daily", pet_id="Max")
+        meds = tm.create_task("Meds", "Pill", "07:15", 9, 5, "medication", start_date=date(2026, 1, 5))
+        created, errors = tm.create_tasks_bulk([
+            dict(task_name="Feed", description="Breakfast", time="08:00", priority=9, duration=10, task_type="feed"),
+            dict(task_name="Walk", description="Duplicate", time="07:00", priority=1, duration=5, task_type="walk"),
+        ])
+        assert len(created) == 1 and len(errors) == 1
+        tm.add_tasks([Task("Play", "Fetch", "18:00", 4, 20, "playtime")])
+        tm.edit_task(task_id=meds.get_task_id(), priority=10, time="09:00")
+        tm.mark_task_completed(walk.get_task_id())
+        tm.check_task_conflicts(walk)
+        tm.check_task_conflicts(Task("Probe", "Unsaved", "08:05", 1, 10, "walk"))
+        tm.delete_task(task_id=created[0].get_task_id())
+        with pytest.raises(ValueError):
+            tm.create_task("Bad", "Invalid time", "25:00", 5, 10, "walk")
+
+        planner = RecordingDailyPlanner(Pet("Max", 3, "dog"), tm, recorder, buffer_minutes=0)
+        planner.set_available_time(60)
+        planner.generate_plan("optimal")
+        planner.get_plan_summary()
+        assert recorder.get_call_count() == 13
+    return tm.get_task_manager()
+
+
+def test_replay_reproduces_recorded_state():
+    """Verify a replay maps recorded task IDs to new tasks and ends in the same state"""
+    trace = io.StringIO()
+    original = record_session(trace)
+    lines = trace.getvalue().splitlines()
+    assert json.loads(lines[0])["trace"] == 1
+    # Stored tasks are referenced by ID, not re-serialised
+    conflict_call = next(json.loads(line) for line in lines if '"check_task_conflicts"' in line)
+    assert list(conflict_call["a"][0]) == ["$task"]
+    # Task IDs passed by keyword are recorded for remapping too
+    edit_call = next(json.loads(line) for line in lines if '"edit_task"' in line)
+    assert list(edit_call["k"]["task_id"]) == ["$id"]
+
+    restored = TaskManager()
+    report = replay(io.StringIO(trace.getvalue()), restored)
+
+    def state(tm):
+        return sorted((t.get_task_name(), t.get_time(), t.get_priority(), t.get_due_date(), t.is_completed())
+                      for t in tm.get_all_tasks())
+
+    assert state(restored) == state(original)
+    assert report["tm.create_task"]["count"] == 3 and report["tm.create_task"]["errors"] == 1
+    assert report["planner.generate_plan"]["count"] == 1
+    assert all(stats["errors"] == 0 for key, stats in report.items() if key != "tm.create_task")
+    for stats in report.values():
+        assert 0 <= stats["p50_ms"] <= stats["p90_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+    assert "planner.generate_plan" in format_report(report)
+
+
+def test_paced_replay_of_gzip_trace(tmp_path):
+    """Verify gzip traces replay and paced replay waits for the recorded offsets"""
+    path = str(tmp_path / "trace.jsonl.gz")
+    record_session(path)
+    assert gzip.open(path, "rt").readline().startswith('{"trace":1')
+
+    fast = replay(path)
+    paced = replay(path, paced=True, speed=0.5)
+    assert fast.keys() == paced.keys()
+    with pytest.raises(ValueError):
+        replay(path, speed=0)
+    with pytest.raises(ValueError):
+        replay(io.StringIO('{"kind":"task"}\n'))
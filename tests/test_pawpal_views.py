@@ -0,0 +1,86 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from pawpal_system import DailyPlanner, Pet, TaskManager
+from pawpal_views import TaskViewModel, page_bounds
+
+
+def test_page_bounds_clamps_pages():
+    """Verify page slices, page counts and clamping of out-of-range pages"""
+    assert page_bounds(0, 1, 10) == (0, 0, 1)
+    assert page_bounds(25, 1, 10) == (0, 10, 3)
+    assert page_bounds(25, 3, 10) == (20, 25, 3)
+    assert page_bounds(25, 9, 10) == (20, 25, 3)
+    assert page_bounds(25, 0, 10) == (0, 10, 3)
+    with pytest.raises(ValueError):
+        page_bounds(5, 1, 0)
+
+
+def test_view_model_caches_until_the_store_changes():
+    """Verify derived views are reused while the version is unchanged and rebuilt after a write"""
+    tm = TaskManager()
+    for i in range(5):
+        tm.create_task(f"Task {i}", "Check-in", f"{9 - i:02d}:00", 5, 90, "walk", pet_id="Max")
+    tm.create_task("Task 0", "Again", "09:00", 5, 10, "feed", allow_duplicates=True)
+    views = TaskViewModel(tm, page_size=2)
+
+    assert [row["Time"] for row in views.get_task_page(1)] == ["05:00", "06:00"]
+    assert [row["Time"] for row in views.get_task_page(99)] == ["09:00", "09:00"]
+    assert views.get_page_count() == 3
+    assert views.get_duplicates() == ["Task 0 at 09:00 (x2)"]
+    conflicts = views.get_conflicts()
+    assert len(conflicts) == 6
+    t1, t2, reason = conflicts[4]
+    assert views.get_conflict_page(3)[0] == f"{t1.get_task_name()} at {t1.get_time()} <> {t2.get_task_name()} at {t2.get_time()} : {reason}"
+
+    misses = views.get_cache_stats()['misses']
+    views.get_task_page(1)
+    views.get_duplicates()
+    views.get_conflict_page(3)
+    assert views.get_cache_stats()['misses'] == misses
+
+    tm.create_task("Late", "Night walk", "23:00", 3, 15, "walk")
+    assert views.get_page_count() == 4
+    assert views.get_task_page(4) == [TaskViewModel.task_row(tm.get_tasks_sorted_by_time()[-1])]
+    assert views.get_task_page(4)[0]["Task"] == "Late"
+    assert views.get_cache_stats()['misses'] > misses
+
+    planner = DailyPlanner(Pet("Max", 3, "dog"), tm)
+    planner.set_available_time(200)
+    plan = planner.generate_plan()
+    rows = views.get_plan_page(planner, plan, 2)
+    assert [row["#"] for row in rows] == [3]
+    assert rows[0]["Scheduled"] == planner.get_scheduled_time(plan[2])
+
+    # Budget plans are rebuilt only for new preferences or a changed store
+    preferences = {'preferred_task_types': ['walk']}
+    planner.set_preferences(preferences)
+    budgets = views.get_budget_plans(planner, preferences)
+    assert views.get_budget_plans(planner, {'preferred_task_types': ['walk']}) is budgets
+    planner.set_preferences({})
+    unranked = views.get_budget_plans(planner, {})
+    assert unranked is not budgets
+    tm.create_task("Later", "Night walk", "23:30", 3, 15, "walk")
+    assert views.get_budget_plans(planner, {}) is not unranked
+
+
+def test_view_model_sees_writes_from_another_session(tmp_path):
+    """Verify views and cached plans over a shared database follow another connection's commits"""
+    from pawpal_sqlite import SqliteTaskManager
+    path = str(tmp_path / "pawpal.db")
+    with SqliteTaskManager(path, batch_size=1) as mine, SqliteTaskManager(path, batch_size=1) as other:
+        views = TaskViewModel(mine)
+        planner = DailyPlanner(Pet("Max", 3, "dog"), mine)
+        planner.set_available_time(60)
+        assert views.get_sorted_tasks() == [] and planner.generate_plan() == []
+
+        walk = other.create_task("Walk", "Morning walk", "08:00", 8, 30, "walk")
+        assert [t.get_task_name() for t in views.get_sorted_tasks()] == ["Walk"]
+        assert [t.get_task_name() for t in planner.generate_plan()] == ["Walk"]
+
+        other.edit_task(walk.get_task_id(), time="06:00")
+        assert views.get_task_page(1)[0]["Time"] == "06:00"
+        assert planner.get_cache_stats()['hits'] == 0